@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+import path_util        # noqa: F401
+import argparse
+import asyncio
+import os
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot import init_logging
+from hummingbot.client.parameter_sweep import ParameterSweep
+from hummingbot.client.settings import CONF_FILE_PATH
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Backtests a strategy config over recorded market data for every combination "
+                                     "of the swept parameter values, in parallel.")
+        self.add_argument("--config-file-name", "-f",
+                          type=str,
+                          required=True,
+                          help="Specify a file in `conf/` to load as the strategy config file.")
+        self.add_argument("--parameter", "-P",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="A swept parameter and its values, e.g. bid_spread=0.1,0.2,0.5. Can be repeated.")
+        self.add_argument("--recordings", "-r",
+                          type=str,
+                          nargs="+",
+                          required=True,
+                          help="The market data recordings to replay (.hbmd, .jsonl or .jsonl.gz files).")
+        self.add_argument("--start-time",
+                          type=float,
+                          required=True,
+                          help="The timestamp (in seconds) the backtests start at.")
+        self.add_argument("--end-time",
+                          type=float,
+                          required=True,
+                          help="The timestamp (in seconds) the backtests end at.")
+        self.add_argument("--balance", "-b",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="A start balance, e.g. ETH=10. Can be repeated.")
+        self.add_argument("--tick-size",
+                          type=float,
+                          default=1.0,
+                          help="The clock tick size, in seconds.")
+        self.add_argument("--workers", "-w",
+                          type=int,
+                          required=False,
+                          help="The number of worker processes, the number of CPUs by default.")
+        self.add_argument("--output", "-o",
+                          type=str,
+                          required=False,
+                          help="Save the results table to this CSV file.")
+
+
+def parse_parameter_grid(parameters: List[str]) -> Dict[str, List[Any]]:
+    grid = {}
+    for parameter in parameters:
+        name, values = parameter.split("=", 1)
+        grid[name.strip()] = [value.strip() for value in values.split(",")]
+    return grid
+
+
+def parse_balances(balances: List[str]) -> Dict[str, Decimal]:
+    return {asset.strip(): Decimal(amount) for asset, amount in (balance.split("=", 1) for balance in balances)}
+
+
+async def sweep(args):
+    init_logging("hummingbot_logs.yml")
+    parameter_sweep = ParameterSweep(config_file_path=os.path.join(CONF_FILE_PATH, args.config_file_name),
+                                     parameter_grid=parse_parameter_grid(args.parameter),
+                                     recording_file_paths=args.recordings,
+                                     start_balances=parse_balances(args.balance),
+                                     start_time=args.start_time,
+                                     end_time=args.end_time,
+                                     tick_size=args.tick_size,
+                                     max_workers=args.workers)
+    results = await parameter_sweep.run()
+    print(results.to_string(index=False))
+    if args.output is not None:
+        results.to_csv(args.output, index=False)
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    asyncio.get_event_loop().run_until_complete(sweep(args))
+
+
+if __name__ == "__main__":
+    main()
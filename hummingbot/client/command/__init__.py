@@ -16,6 +16,7 @@ from .ticker_command import TickerCommand
 from .gateway_command import GatewayCommand
 from .script_command import ScriptCommand
 from .rate_command import RateCommand
+from .metrics_command import MetricsCommand
 
 
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     GatewayCommand,
     ScriptCommand,
     RateCommand,
+    MetricsCommand,
 ]
@@ -27,6 +27,9 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        if self.markets_recorder is not None:
+            self.markets_recorder.stop()
+
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
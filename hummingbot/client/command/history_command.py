@@ -3,18 +3,28 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from typing import (
+    Awaitable,
+    Callable,
+    Dict,
     List,
     Optional,
-    Set,
     Tuple,
     TYPE_CHECKING,
 )
 
 import pandas as pd
+from sqlalchemy import BigInteger, Text, type_coerce
+from sqlalchemy.orm import Session
 
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import (
+    PerformanceAccumulator,
+    PerformanceMetrics,
+    PerformanceTracker,
+    TRADES_FRAME_COLUMNS,
+)
 from hummingbot.client.settings import (
     AllConnectorSettings,
     ConnectorType,
@@ -31,6 +41,9 @@ s_decimal_0 = Decimal("0")
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 
+# Computes the performance metrics of a market and trading pair, given the current balances of the market
+MetricsSource = Callable[[Dict[str, Decimal]], Awaitable[PerformanceMetrics]]
+
 
 def get_timestamp(days_ago: float = 0.) -> float:
     return time.time() - (60. * 60. * 24. * days_ago)
@@ -51,30 +64,92 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
 
+        performance_tracker: Optional[PerformanceTracker] = self._session_performance_tracker(start_time)
+        if performance_tracker is not None:
+            if performance_tracker.num_trades == 0:
+                self._notify("\n  No past trades to report.")
+                return
+            safe_ensure_future(self._performance_tracker_history(start_time, performance_tracker, verbose, precision))
+            return
+        safe_ensure_future(self._trade_fills_history(start_time, verbose, precision))
+
+    async def _performance_tracker_history(self,  # type: HummingbotApplication
+                                           start_time: float,
+                                           performance_tracker: PerformanceTracker,
+                                           verbose: bool,
+                                           precision: Optional[int]):
+        if verbose:
+            await self.list_trades(start_time)
+        if self.strategy_name != "celo_arb":
+            await self.performance_report(
+                start_time, self._accumulators_metrics_sources(performance_tracker.accumulators), precision)
+
+    async def _trade_fills_history(self,  # type: HummingbotApplication
+                                   start_time: float,
+                                   verbose: bool,
+                                   precision: Optional[int]):
+        await self._flush_markets_recorder()
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            trades: pd.DataFrame = self._get_trades_frame_from_session(
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            if not trades:
-                self._notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            if self.strategy_name != "celo_arb":
-                safe_ensure_future(self.history_report(start_time, trades, precision))
+        if len(trades) == 0:
+            self._notify("\n  No past trades to report.")
+            return
+        if verbose:
+            await self.list_trades(start_time)
+        if self.strategy_name != "celo_arb":
+            await self.history_frame_report(start_time, trades, precision)
+
+    async def _flush_markets_recorder(self  # type: HummingbotApplication
+                                      ):
+        """
+        Waits for the records of the markets recorder to be committed, so that the trade fills database is up to date
+        """
+        if self.markets_recorder is not None:
+            await self.markets_recorder.flush()
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        for trade in trades:
+            accumulator: Optional[PerformanceAccumulator] = accumulators.get((trade.market, trade.symbol))
+            if accumulator is None:
+                accumulator = PerformanceAccumulator(trade.market, trade.symbol)
+                accumulators[(trade.market, trade.symbol)] = accumulator
+            accumulator.add_trade_fill(trade)
+        return await self.performance_report(start_time,
+                                             self._accumulators_metrics_sources(accumulators),
+                                             precision,
+                                             display_report)
+
+    async def history_frame_report(self,  # type: HummingbotApplication
+                                   start_time: float,
+                                   trades: pd.DataFrame,
+                                   precision: Optional[int] = None,
+                                   display_report: bool = True) -> Decimal:
+        """
+        Same as history_report, for trades read with _get_trades_frame_from_session
+        """
+        metrics_sources: Dict[Tuple[str, str], MetricsSource] = {
+            (market, symbol): partial(PerformanceMetrics.create_from_frame, market, symbol, market_trades)
+            for (market, symbol), market_trades in trades.groupby(["market", "symbol"], sort=False)
+        }
+        return await self.performance_report(start_time, metrics_sources, precision, display_report)
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 metrics_sources: Dict[Tuple[str, str], MetricsSource],
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), metrics_source in metrics_sources.items():
             network_timeout = float(global_config_map["other_commands_timeout"].value)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -83,7 +158,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
+            perf = await metrics_source(cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -210,22 +285,76 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        performance_tracker: Optional[PerformanceTracker] = self._session_performance_tracker(start_time)
+        if performance_tracker is not None:
+            return await self.performance_report(start_time,
+                                                 self._accumulators_metrics_sources(performance_tracker.accumulators),
+                                                 display_report=False)
+
+        await self.markets_recorder.flush()
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            trades: pd.DataFrame = self._get_trades_frame_from_session(
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
-        return avg_return
+        return await self.history_frame_report(start_time, trades, display_report=False)
 
-    def list_trades(self,  # type: HummingbotApplication
-                    start_time: float):
-        if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.list_trades, start_time)
-            return
+    @staticmethod
+    def _accumulators_metrics_sources(
+            accumulators: Dict[Tuple[str, str], PerformanceAccumulator]) -> Dict[Tuple[str, str], MetricsSource]:
+        # Copied, fills can add accumulators while the report waits for the balances
+        return {key: accumulator.performance_metrics for key, accumulator in list(accumulators.items())}
+
+    def _get_trades_frame_from_session(self,  # type: HummingbotApplication
+                                       start_timestamp: int,
+                                       session: Session,
+                                       config_file_path: str = None) -> pd.DataFrame:
+        """
+        Reads the trades in chronological order, as a data frame with the market, the symbol and the
+        TRADES_FRAME_COLUMNS columns. The columns are read as plain rows (prices and amounts as their stored integers)
+        and converted column-wise, instead of creating an ORM object and its decimals for each trade.
+        """
+        filters = [TradeFill.timestamp >= start_timestamp]
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        columns = {
+            "market": TradeFill.market,
+            "symbol": TradeFill.symbol,
+            "order_id": TradeFill.order_id,
+            "trade_type": TradeFill.trade_type,
+            "price": type_coerce(TradeFill.price, BigInteger),
+            "amount": type_coerce(TradeFill.amount, BigInteger),
+            "trade_fee": type_coerce(TradeFill.trade_fee, Text),
+            "position": TradeFill.position,
+        }
+        query = (session
+                 .query(*[column.label(name) for name, column in columns.items()])
+                 .filter(*filters)
+                 .order_by(TradeFill.timestamp.asc()))
+        rows = session.execute(query.statement).fetchall()
+        trades: pd.DataFrame = pd.DataFrame.from_records(rows, columns=list(columns.keys()))
+        for decimal_column in (TradeFill.price, TradeFill.amount):
+            trades[decimal_column.key] = (trades[decimal_column.key].to_numpy(dtype=float)
+                                          / decimal_column.type.multiplier_int)
+        return trades[["market", "symbol"] + TRADES_FRAME_COLUMNS]
+
+    def _session_performance_tracker(self,  # type: HummingbotApplication
+                                     start_time: float) -> Optional[PerformanceTracker]:
+        """
+        Returns the performance tracker if it tracks the trades of the current strategy since the given time.
+        """
+        performance_tracker: Optional[PerformanceTracker] = self.performance_tracker
+        if (performance_tracker is not None
+                and performance_tracker.config_file_path == self.strategy_file_name
+                and performance_tracker.start_time == start_time):
+            return performance_tracker
+        return None
 
+    async def list_trades(self,  # type: HummingbotApplication
+                          start_time: float):
         lines = []
 
+        await self._flush_markets_recorder()
         with self.trade_fill_db.get_new_session() as session:
             queried_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -0,0 +1,53 @@
+import threading
+from typing import (
+    TYPE_CHECKING,
+)
+
+import pandas as pd
+
+from hummingbot.core.clock_metrics import ClockMetrics
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class MetricsCommand:
+    def metrics(self,  # type: HummingbotApplication
+                ):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.metrics)
+            return
+        if self.clock is None:
+            self._notify("\n This command can only be used while a strategy is running")
+            return
+        metrics = self.clock.metrics
+        if metrics is None:
+            self._notify("\n Clock instrumentation is disabled. Set clock_instrumentation to true in "
+                         "conf_global.yml and restart the strategy to collect the metrics.")
+            return
+        self._notify(self.metrics_report(metrics))
+
+    @staticmethod
+    def metrics_report(metrics: ClockMetrics) -> str:
+        ticks = metrics.tick_histogram
+        lines = [
+            f"\n  Ticks: {ticks.total_count} (tick size {metrics.tick_size}s)",
+            f"  Overruns: {metrics.overrun_count}",
+            f"  Tick duration (ms): mean {ticks.mean_duration * 1e3:.3f} | p99 {ticks.quantile(0.99) * 1e3:.3f} | "
+            f"max {ticks.max_duration * 1e3:.3f}",
+            f"  Event loop lag (ms): last {metrics.last_loop_lag * 1e3:.3f} | mean {metrics.mean_loop_lag * 1e3:.3f} | "
+            f"max {metrics.max_loop_lag * 1e3:.3f}",
+        ]
+        if metrics.iterator_histograms:
+            columns = ["Iterator", "Ticks", "Errors", "Mean (ms)", "p50 (ms)", "p99 (ms)", "Max (ms)"]
+            data = [[name,
+                     histogram.total_count,
+                     metrics.iterator_errors(name),
+                     round(histogram.mean_duration * 1e3, 3),
+                     round(histogram.quantile(0.5) * 1e3, 3),
+                     round(histogram.quantile(0.99) * 1e3, 3),
+                     round(histogram.max_duration * 1e3, 3)]
+                    for name, histogram in metrics.iterator_histograms.items()]
+            df = pd.DataFrame(data=data, columns=columns)
+            lines.extend(["", "  Iterators:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        return "\n".join(lines)
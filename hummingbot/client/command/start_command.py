@@ -115,11 +115,16 @@ class StartCommand:
             start_strategy(self)
         else:
             raise NotImplementedError
+        if settings.required_rate_oracle:
+            RateOracle.get_instance().precompute_rates(
+                trading_pair for trading_pairs in self.market_trading_pairs_map.values()
+                for trading_pair in trading_pairs)
 
         try:
             config_path: str = self.strategy_file_name
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            self.clock = Clock(ClockMode.REALTIME,
+                               instrumented=global_config_map.get("clock_instrumentation").value or False)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -141,7 +146,7 @@ class StartCommand:
                     self._notify("Error: script feature is only available for pure_market_making strategy (for now).")
                 else:
                     self._script_iterator = ScriptIterator(script_file, list(self.markets.values()),
-                                                           self.strategy, 0.1)
+                                                           self.strategy)
                     self.clock.add_iterator(self._script_iterator)
                     self._notify(f"Script ({script_file}) started.")
 
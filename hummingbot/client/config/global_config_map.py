@@ -7,7 +7,8 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange as using_exchange_pointer
 from hummingbot.client.config.config_validators import (
     validate_bool,
-    validate_decimal
+    validate_decimal,
+    validate_int,
 )
 from hummingbot.client.settings import AllConnectorSettings, DEFAULT_KEY_FILE_PATH, DEFAULT_LOG_FILE_PATH
 from hummingbot.core.rate_oracle.rate_oracle import RateOracleSource, RateOracle
@@ -48,6 +49,10 @@ def rate_oracle_source_on_validated(value: str):
     RateOracle.source = RateOracleSource[value]
 
 
+def rate_oracle_streaming_on_validated(value: str):
+    RateOracle.streaming = value.lower() in ("true", "yes", "y")
+
+
 def validate_color(value: str) -> Optional[str]:
     if not re.search(r'^#(?:[0-9a-fA-F]{2}){3}$', value):
         return "Invalid color code"
@@ -86,6 +91,12 @@ main_config_map = {
                   type_str="float",
                   required_if=lambda: False,
                   default=900),
+    "clock_instrumentation":
+        ConfigVar(key="clock_instrumentation",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
     "logger_override_whitelist":
         ConfigVar(key="logger_override_whitelist",
                   prompt=None,
@@ -292,6 +303,15 @@ main_config_map = {
                   validator=validate_rate_oracle_source,
                   on_validated=rate_oracle_source_on_validated,
                   default=RateOracleSource.binance.name),
+    "rate_oracle_streaming":
+        ConfigVar(key="rate_oracle_streaming",
+                  prompt="Would you like rate oracle to stream the prices it needs when its source allows it? "
+                         "(Yes/No) >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  on_validated=rate_oracle_streaming_on_validated,
+                  default=False),
     "global_token":
         ConfigVar(key="global_token",
                   prompt="What is your default display token? (e.g. USD,EUR,BTC)  >>> ",
@@ -314,6 +334,21 @@ main_config_map = {
                   validator=lambda v: validate_decimal(v, 1, 100, inclusive=True),
                   required_if=lambda: False,
                   default=Decimal("100")),
+    "http_connection_limit":
+        ConfigVar(key="http_connection_limit",
+                  prompt="How many HTTP connections can be open at the same time (0 for no limit)? >>> ",
+                  type_str="int",
+                  validator=lambda v: validate_int(v, min_value=0),
+                  required_if=lambda: False,
+                  default=100),
+    "http_connection_limit_per_host":
+        ConfigVar(key="http_connection_limit_per_host",
+                  prompt="How many HTTP connections can be open to the same host at the same time "
+                         "(0 for no limit)? >>> ",
+                  type_str="int",
+                  validator=lambda v: validate_int(v, min_value=0),
+                  required_if=lambda: False,
+                  default=20),
     "create_command_timeout":
         ConfigVar(key="create_command_timeout",
                   prompt="Network timeout when fetching the minimum order amount"
@@ -33,6 +33,7 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import AllConnectorSettings, ConnectorType
@@ -100,6 +101,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_tracker: Optional[PerformanceTracker] = None
         self._script_iterator = None
         self._binance_connector = None
 
@@ -272,7 +274,16 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
         )
+        with self.trade_fill_db.get_new_session() as session:
+            session_trades = self._get_trades_from_session(int(self.init_time * 1e3),
+                                                           session=session,
+                                                           config_file_path=self.strategy_file_name)
+            self.performance_tracker = PerformanceTracker(list(self.markets.values()),
+                                                          self.strategy_file_name,
+                                                          self.init_time,
+                                                          session_trades)
         self.markets_recorder.start()
+        self.performance_tracker.start()
 
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
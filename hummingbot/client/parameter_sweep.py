@@ -0,0 +1,261 @@
+import asyncio
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pandas as pd
+
+from hummingbot.client.config.config_helpers import (
+    get_strategy_config_map,
+    get_strategy_starter_file,
+    get_strategy_template_path,
+    load_yml_into_cm,
+    parse_cvar_value,
+    strategy_name_from_file,
+)
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import (
+    PerformanceAccumulator,
+    PerformanceTracker,
+)
+from hummingbot.connector.exchange.paper_trade import create_backtest_market
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+s_logger = None
+
+# Columns of the sweep results, after the swept parameters
+RESULT_COLUMNS: List[str] = ["run", "market", "trading_pair", "trades", "volume_quote", "trade_pnl", "fees_quote",
+                             "total_pnl", "return_pct", "end_base_balance", "end_quote_balance", "duration", "error"]
+
+
+@dataclass
+class BacktestSpec:
+    """
+    Everything a backtest run of a sweep needs, passed on to the worker processes
+    """
+    strategy: str
+    strategy_file_name: str
+    config_values: Dict[str, Any]
+    recording_file_paths: List[str]
+    start_balances: Dict[str, Decimal]
+    start_time: float
+    end_time: float
+    tick_size: float = 1.0
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+
+class BacktestApplication:
+    """
+    Stands in for HummingbotApplication when a strategy's start function runs in a backtest: the markets it
+    initializes are BacktestExchanges replaying the recorded market data, funded with the start balances.
+    """
+
+    def __init__(self, spec: BacktestSpec):
+        self._spec = spec
+        self.strategy_file_name: str = spec.strategy_file_name
+        self.markets: Dict[str, ExchangeBase] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = {}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.market_pair = None
+        self.assets = set()
+        self.strategy = None
+        self.trade_fill_db = None
+        self.notifications: List[str] = []
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    _initialize_market_assets = staticmethod(HummingbotApplication._initialize_market_assets)
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            self.market_trading_pairs_map.setdefault(market_name, []).extend(trading_pairs)
+        for market_name, trading_pairs in self.market_trading_pairs_map.items():
+            market = create_backtest_market(market_name.replace("_paper_trade", ""),
+                                            trading_pairs,
+                                            self._spec.recording_file_paths)
+            for asset, balance in self._spec.start_balances.items():
+                market.set_balance(asset, balance)
+            self.markets[market_name] = market
+
+    def _notify(self, msg: str):
+        self.notifications.append(msg)
+
+
+def parameter_grid_runs(parameter_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Returns the parameters of every run of the grid, the cartesian product of the values of each parameter
+    """
+    names = list(parameter_grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*[parameter_grid[name] for name in names])]
+
+
+async def load_strategy_config(config_file_path: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Loads a strategy config file into its config map and returns the strategy with the config values
+    """
+    strategy = strategy_name_from_file(config_file_path)
+    config_map = get_strategy_config_map(strategy)
+    await load_yml_into_cm(config_file_path, get_strategy_template_path(strategy), config_map)
+    return strategy, {key: cvar.value for key, cvar in config_map.items()}
+
+
+def run_backtest(spec: BacktestSpec) -> List[Dict[str, Any]]:
+    """
+    Runs the strategy with its config values overridden by the swept parameters over the recorded market data, on a
+    BACKTEST mode clock, and returns the performance of each of its markets and trading pairs.
+    It is meant to run in a worker process: it sets the strategy config map of the process, and the main application
+    for the duration of the run.
+    """
+    ev_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    previous_main_app = HummingbotApplication._main_app
+    try:
+        config_map = get_strategy_config_map(spec.strategy)
+        for key, value in spec.config_values.items():
+            config_map[key].value = value
+        for key, value in spec.parameters.items():
+            config_map[key].value = parse_cvar_value(config_map[key], value)
+
+        application = BacktestApplication(spec)
+        # Some start functions look things up on the main application
+        HummingbotApplication._main_app = application
+        get_strategy_starter_file(spec.strategy)(application)
+        if application.strategy is None:
+            raise ValueError(f"The {spec.strategy} strategy could not be started: {' '.join(application.notifications)}")
+
+        start = time.perf_counter()
+        clock = Clock(ClockMode.BACKTEST, spec.tick_size, spec.start_time, spec.end_time)
+        for market in application.markets.values():
+            clock.add_iterator(market)
+        clock.add_iterator(application.strategy)
+        performance_tracker = PerformanceTracker(list(application.markets.values()),
+                                                 spec.strategy_file_name,
+                                                 spec.start_time)
+        performance_tracker.start()
+        clock.backtest()
+        performance_tracker.stop()
+        duration = time.perf_counter() - start
+
+        results = []
+        for market_info in application.market_trading_pair_tuples:
+            market = market_info.market
+            accumulator = performance_tracker.accumulators.get(
+                (market.display_name, market_info.trading_pair),
+                PerformanceAccumulator(market.display_name, market_info.trading_pair))
+            metrics = ev_loop.run_until_complete(
+                accumulator.performance_metrics(market.get_all_balances(), current_price=market_info.get_mid_price()))
+            results.append({
+                "market": market.display_name,
+                "trading_pair": market_info.trading_pair,
+                "trades": metrics.num_trades,
+                "volume_quote": metrics.s_vol_quote - metrics.b_vol_quote,
+                "trade_pnl": metrics.trade_pnl,
+                "fees_quote": metrics.fee_in_quote,
+                "total_pnl": metrics.total_pnl,
+                "return_pct": metrics.return_pct * Decimal("100"),
+                "end_base_balance": metrics.cur_base_bal,
+                "end_quote_balance": metrics.cur_quote_bal,
+                "duration": duration,
+            })
+        return results
+    finally:
+        HummingbotApplication._main_app = previous_main_app
+        ev_loop.close()
+        asyncio.set_event_loop(None)
+
+
+def _run_backtest_in_worker(run: int, spec: BacktestSpec) -> Tuple[int, List[Dict[str, Any]]]:
+    try:
+        return run, run_backtest(spec)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Backtest run {run} ({spec.parameters}) failed.", exc_info=True)
+        return run, [{"error": str(e)}]
+
+
+class ParameterSweep:
+    """
+    Backtests a strategy config for every combination of the values of a parameter grid, e.g.
+    {"bid_spread": [0.1, 0.2], "order_levels": [1, 2, 3]}, over recorded market data.
+
+    The runs are independent, each one in a worker process of a process pool with its own BACKTEST mode clock and
+    BacktestExchanges, so the sweep scales with the number of cores. Market data recorded with MarketDataRecorder is
+    memory mapped by the workers: the pages are read from disk once and shared through the page cache, instead of
+    being loaded again for every run (JSON lines recordings are parsed by every run).
+    """
+
+    def __init__(self,
+                 config_file_path: str,
+                 parameter_grid: Dict[str, List[Any]],
+                 recording_file_paths: List[str],
+                 start_balances: Dict[str, Decimal],
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 max_workers: Optional[int] = None):
+        self._config_file_path = config_file_path
+        self._parameter_grid = parameter_grid
+        self._recording_file_paths = recording_file_paths
+        self._start_balances = start_balances
+        self._start_time = start_time
+        self._end_time = end_time
+        self._tick_size = tick_size
+        self._max_workers = max_workers or os.cpu_count()
+
+    @property
+    def runs(self) -> List[Dict[str, Any]]:
+        return parameter_grid_runs(self._parameter_grid)
+
+    async def specs(self) -> List[BacktestSpec]:
+        strategy, config_values = await load_strategy_config(self._config_file_path)
+        unknown_parameters = [name for name in self._parameter_grid if name not in config_values]
+        if len(unknown_parameters) > 0:
+            raise ValueError(f"{', '.join(unknown_parameters)} not in the {strategy} config map.")
+        return [BacktestSpec(strategy=strategy,
+                             strategy_file_name=os.path.basename(self._config_file_path),
+                             config_values=config_values,
+                             recording_file_paths=self._recording_file_paths,
+                             start_balances=self._start_balances,
+                             start_time=self._start_time,
+                             end_time=self._end_time,
+                             tick_size=self._tick_size,
+                             parameters=parameters)
+                for parameters in self.runs]
+
+    async def run(self) -> pd.DataFrame:
+        """
+        Runs the backtests and returns their results, one row per run, market and trading pair, with the swept
+        parameters followed by RESULT_COLUMNS.
+        """
+        specs = await self.specs()
+        ev_loop = asyncio.get_event_loop()
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            run_results = await safe_gather(*[ev_loop.run_in_executor(executor, _run_backtest_in_worker, run, spec)
+                                              for run, spec in enumerate(specs)])
+        rows = [{**specs[run].parameters, "run": run, **result} for run, results in run_results for result in results]
+        return pd.DataFrame(rows, columns=list(self._parameter_grid.keys()) + RESULT_COLUMNS)
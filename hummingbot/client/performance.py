@@ -1,21 +1,33 @@
+import asyncio
+import json
+import threading
 from decimal import Decimal
 from dataclasses import dataclass
 from typing import (
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
 )
 
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.market_price import get_last_price
-from hummingbot.core.event.events import TradeType, PositionAction
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent, TradeType, PositionAction
 from hummingbot.model.trade_fill import TradeFill
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
+# Columns of the trades data frames PerformanceMetrics.create_from_frame works with
+TRADES_FRAME_COLUMNS: List[str] = ["order_id", "trade_type", "price", "amount", "trade_fee", "position"]
+
 
 @dataclass
 class PerformanceMetrics:
@@ -65,6 +77,21 @@ class PerformanceMetrics:
         await performance._initialize_metrics(exchange, trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_frame(cls, exchange: str,
+                                trading_pair: str,
+                                trades: pd.DataFrame,
+                                current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Same as `create`, for trade fills given as a data frame with the `TRADES_FRAME_COLUMNS` columns (prices and
+        amounts as floats, fees as their JSON text), in chronological order.
+        The trades are processed column-wise, which keeps large histories fast. The results are the same as the ones
+        of `create` up to float precision.
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_frame(exchange, trading_pair, trades, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -188,6 +215,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount * trade.price))
 
+        self._calculate_volume_totals_and_averages()
+
+        return buys, sells
+
+    def _calculate_volume_totals_and_averages(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -198,8 +230,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, exchange: str, quote: str, trades: List[Any]):
         for trade in trades:
             if self._is_trade_fill(trade):
@@ -223,6 +253,9 @@ class PerformanceMetrics:
                         self.fees[flat_fee.token] = s_decimal_0
                     self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(exchange, quote)
+
+    async def _calculate_fee_in_quote(self, exchange: str, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -237,19 +270,12 @@ class PerformanceMetrics:
         # Handle trade_pnl differently for derivatives
         if self._are_derivatives(buys) or self._are_derivatives(sells):
             buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
-
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
-
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
+            # Same pairing as repeatedly calling position_order, without searching and removing from the lists:
+            # the n-th order opening a position is paired with the n-th order closing a position of that direction
+            long = list(zip([order for order in buys_copy if order.position == PositionAction.OPEN.value],
+                            [order for order in sells_copy if order.position == PositionAction.CLOSE.value]))
+            short = list(zip([order for order in sells_copy if order.position == PositionAction.OPEN.value],
+                             [order for order in buys_copy if order.position == PositionAction.CLOSE.value]))
 
             self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
 
@@ -273,15 +299,145 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(exchange,
+                                                  trading_pair,
+                                                  current_balances,
+                                                  start_price=Decimal(str(trades[0].price)),
+                                                  last_trade_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(exchange, quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_frame(self,
+                                             exchange: str,
+                                             trading_pair: str,
+                                             trades: pd.DataFrame,
+                                             current_balances: Dict[str, Decimal]):
+        base, quote = split_hb_trading_pair(trading_pair)
+        is_buy: np.ndarray = self._frame_column_equals(trades["trade_type"], TradeType.BUY.name, case_insensitive=True)
+        is_sell: np.ndarray = self._frame_column_equals(trades["trade_type"], TradeType.SELL.name,
+                                                        case_insensitive=True)
+        prices: np.ndarray = trades["price"].to_numpy(dtype=float)
+        amounts: np.ndarray = trades["amount"].to_numpy(dtype=float)
+        quote_amounts: np.ndarray = prices * amounts
+
+        self.num_buys = int(is_buy.sum())
+        self.num_sells = int(is_sell.sum())
+        self.num_trades = self.num_buys + self.num_sells
+
+        self.b_vol_base = self._float_to_decimal(amounts[is_buy].sum())
+        self.b_vol_quote = -self._float_to_decimal(quote_amounts[is_buy].sum())
+        self.s_vol_base = -self._float_to_decimal(amounts[is_sell].sum())
+        self.s_vol_quote = self._float_to_decimal(quote_amounts[is_sell].sum())
+        self._calculate_volume_totals_and_averages()
+
+        await self._calculate_balances_and_values(exchange,
+                                                  trading_pair,
+                                                  current_balances,
+                                                  start_price=self._float_to_decimal(prices[0]),
+                                                  last_trade_price=self._float_to_decimal(prices[-1]))
+
+        self.trade_pnl = self.cur_value - self.hold_value
+        is_nil_position: np.ndarray = self._frame_column_equals(trades["position"], PositionAction.NIL.value)
+        if ((self.num_buys > 0 and not is_nil_position[is_buy].any())
+                or (self.num_sells > 0 and not is_nil_position[is_sell].any())):
+            self.trade_pnl = self._frame_derivative_pnl(trades, is_buy, is_sell)
+
+        self._calculate_fees_from_frame(quote, trades["trade_fee"], quote_amounts)
+        await self._calculate_fee_in_quote(exchange, quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    @staticmethod
+    def _float_to_decimal(value: float) -> Decimal:
+        return Decimal(str(float(value)))
+
+    @staticmethod
+    def _frame_column_equals(column: pd.Series, value: str, case_insensitive: bool = False) -> np.ndarray:
+        # Compares the distinct values only, the columns have very few of them
+        codes, uniques = pd.factorize(column)
+        matching_uniques = np.array([(unique.upper() if case_insensitive else unique) == value
+                                     if isinstance(unique, str) else False
+                                     for unique in uniques] + [False], dtype=bool)
+        return matching_uniques[codes]
+
+    @classmethod
+    def _frame_aggregate_orders(cls, trades: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Aggregates the fills by order the same way as `aggregate_orders`
+        :return: for each order, in the order of their first fill: the position of the first fill, the average fill
+        price and the total amount filled
+        """
+        codes, uniques = pd.factorize(trades["order_id"])
+        fill_counts: np.ndarray = np.bincount(codes, minlength=len(uniques))
+        average_prices: np.ndarray = (np.bincount(codes, weights=trades["price"].to_numpy(dtype=float),
+                                                  minlength=len(uniques))
+                                      / np.maximum(fill_counts, 1))
+        total_amounts: np.ndarray = np.bincount(codes, weights=trades["amount"].to_numpy(dtype=float),
+                                                minlength=len(uniques))
+        first_fill_indexes: np.ndarray = np.unique(codes, return_index=True)[1]
+        positions: np.ndarray = trades["position"].to_numpy()[first_fill_indexes]
+        return positions, average_prices, total_amounts
+
+    @classmethod
+    def _frame_derivative_pnl(cls, trades: pd.DataFrame, is_buy: np.ndarray, is_sell: np.ndarray) -> Decimal:
+        buy_positions, buy_prices, buy_amounts = cls._frame_aggregate_orders(trades[is_buy])
+        sell_positions, sell_prices, sell_amounts = cls._frame_aggregate_orders(trades[is_sell])
+
+        long_opens: np.ndarray = buy_positions == PositionAction.OPEN.value
+        long_closes: np.ndarray = sell_positions == PositionAction.CLOSE.value
+        longs: int = min(long_opens.sum(), long_closes.sum())
+        long_pnl: float = ((sell_prices[long_closes][:longs] - buy_prices[long_opens][:longs])
+                           * sell_amounts[long_closes][:longs]).sum()
+
+        short_opens: np.ndarray = sell_positions == PositionAction.OPEN.value
+        short_closes: np.ndarray = buy_positions == PositionAction.CLOSE.value
+        shorts: int = min(short_opens.sum(), short_closes.sum())
+        short_pnl: float = ((sell_prices[short_opens][:shorts] - buy_prices[short_closes][:shorts])
+                            * buy_amounts[short_closes][:shorts]).sum()
+
+        return cls._float_to_decimal(long_pnl + short_pnl)
+
+    def _calculate_fees_from_frame(self, quote: str, trade_fees: pd.Series, quote_amounts: np.ndarray):
+        # Fills mostly share the same few fees, so each distinct fee is only parsed once
+        codes, uniques = pd.factorize(trade_fees)
+        fill_counts: np.ndarray = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        percents: np.ndarray = np.zeros(len(uniques) + 1)
+        for index, trade_fee in enumerate(uniques):
+            trade_fee = json.loads(trade_fee) if isinstance(trade_fee, str) else trade_fee
+            percents[index] = float(trade_fee.get("percent") or 0)
+            for flat_fee in trade_fee.get("flat_fees", []):
+                self.fees[flat_fee["asset"]] = (self.fees.get(flat_fee["asset"], s_decimal_0)
+                                                + Decimal(str(flat_fee["amount"])) * int(fill_counts[index]))
+        fill_percents: np.ndarray = percents[codes]
+        has_percent_fee: np.ndarray = fill_percents > 0
+        if has_percent_fee.any():
+            self.fees[quote] = (self.fees.get(quote, s_decimal_0)
+                                + self._float_to_decimal((quote_amounts * fill_percents)[has_percent_fee].sum()))
+
+    async def _calculate_balances_and_values(self,
+                                             exchange: str,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             start_price: Decimal,
+                                             last_trade_price: Decimal,
+                                             current_price: Optional[Decimal] = None):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, 0)
         self.cur_quote_bal = current_balances.get(quote, 0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
-        self.cur_price = await get_last_price(exchange.replace("_paper_trade", ""), trading_pair)
+        self.start_price = start_price
+        self.cur_price = current_price
+        if self.cur_price is None:
+            self.cur_price = await get_last_price(exchange.replace("_paper_trade", ""), trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -289,9 +445,259 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(exchange, quote, trades)
 
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+class _AggregatedPositionOrder:
+    """
+    Fills of a derivative order aggregated the same way as `PerformanceMetrics.aggregate_orders` does: the price is
+    the average of the fill prices and the amount is the total amount filled.
+    """
+    __slots__ = ("price_sum", "fill_count", "amount", "pairing_list", "index")
+
+    def __init__(self, pairing_list: List["_AggregatedPositionOrder"]):
+        self.price_sum: Decimal = s_decimal_0
+        self.fill_count: int = 0
+        self.amount: Decimal = s_decimal_0
+        self.pairing_list: List["_AggregatedPositionOrder"] = pairing_list
+        self.index: int = len(pairing_list)
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fill_count
+
+
+class PerformanceAccumulator:
+    """
+    Running aggregates of the trades of one market and trading pair: trade counts, volumes, fees, first and last
+    prices and the PnL of the closed derivative positions. Each trade is added in constant time, and the performance
+    metrics are computed from the aggregates without going through the trades again.
+
+    The metrics are the same as the ones `PerformanceMetrics.create` computes from the list of trades.
+    """
+
+    def __init__(self, exchange: str, trading_pair: str):
+        self.exchange: str = exchange
+        self.trading_pair: str = trading_pair
+        self.base, self.quote = split_hb_trading_pair(trading_pair)
+
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = {}
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+
+        # Derivative positions are paired the same way as `PerformanceMetrics.position_order` does: the n-th order
+        # opening a position is paired with the n-th order closing a position of the same direction.
+        self.closed_positions_pnl: Decimal = s_decimal_0
+        self._nil_position_buys: int = 0
+        self._nil_position_sells: int = 0
+        self._position_orders: Dict[str, _AggregatedPositionOrder] = {}
+        self._long_opens: List[_AggregatedPositionOrder] = []
+        self._long_closes: List[_AggregatedPositionOrder] = []
+        self._short_opens: List[_AggregatedPositionOrder] = []
+        self._short_closes: List[_AggregatedPositionOrder] = []
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return ((self.num_buys > 0 and self._nil_position_buys == 0)
+                or (self.num_sells > 0 and self._nil_position_sells == 0))
+
+    def add_trade_fill(self, trade: TradeFill):
+        fee: Dict[str, Any] = trade.trade_fee
+        self.add_trade(is_buy=trade.trade_type.upper() == TradeType.BUY.name,
+                       price=Decimal(str(trade.price)),
+                       amount=Decimal(str(trade.amount)),
+                       order_id=trade.order_id,
+                       position=trade.position,
+                       fee_percent=Decimal(str(fee.get("percent") or 0)),
+                       flat_fees=[(flat_fee["asset"], Decimal(str(flat_fee["amount"])))
+                                  for flat_fee in fee.get("flat_fees", [])])
+
+    def add_order_filled_event(self, event: OrderFilledEvent):
+        self.add_trade(is_buy=event.trade_type == TradeType.BUY,
+                       price=event.price if event.price == event.price else s_decimal_0,
+                       amount=event.amount,
+                       order_id=event.order_id,
+                       position=event.position if event.position else PositionAction.NIL.value,
+                       fee_percent=event.trade_fee.percent,
+                       flat_fees=[(flat_fee.token, flat_fee.amount) for flat_fee in event.trade_fee.flat_fees])
+
+    def add_trade(self,
+                  is_buy: bool,
+                  price: Decimal,
+                  amount: Decimal,
+                  order_id: str,
+                  position: str,
+                  fee_percent: Decimal,
+                  flat_fees: Iterable[Tuple[str, Decimal]]):
+        quote_amount: Decimal = price * amount
+        if is_buy:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= quote_amount
+            if position == PositionAction.NIL.value:
+                self._nil_position_buys += 1
+        else:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += quote_amount
+            if position == PositionAction.NIL.value:
+                self._nil_position_sells += 1
+
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+
+        if fee_percent > 0:
+            self.fees[self.quote] = self.fees.get(self.quote, s_decimal_0) + quote_amount * fee_percent
+        for asset, fee_amount in flat_fees:
+            self.fees[asset] = self.fees.get(asset, s_decimal_0) + fee_amount
+
+        self._add_position_fill(is_buy, price, amount, order_id, position)
+
+    async def performance_metrics(self,
+                                  current_balances: Dict[str, Decimal],
+                                  current_price: Optional[Decimal] = None) -> PerformanceMetrics:
+        """
+        Computes the performance metrics of the trades added so far.
+        :param current_balances: current user account balance
+        :param current_price: the price to value the balances at, fetched from the exchange if not given (e.g. in
+        backtests, where the current price is the replayed one)
+        """
+        performance = PerformanceMetrics()
+        performance.num_buys = self.num_buys
+        performance.num_sells = self.num_sells
+        performance.num_trades = self.num_trades
+        performance.b_vol_base = self.b_vol_base
+        performance.s_vol_base = self.s_vol_base
+        performance.b_vol_quote = self.b_vol_quote
+        performance.s_vol_quote = self.s_vol_quote
+        performance._calculate_volume_totals_and_averages()
+
+        await performance._calculate_balances_and_values(self.exchange,
+                                                         self.trading_pair,
+                                                         current_balances,
+                                                         start_price=self.start_price or s_decimal_0,
+                                                         last_trade_price=self.last_price or s_decimal_0,
+                                                         current_price=current_price)
+        if self.are_derivatives:
+            performance.trade_pnl = self.closed_positions_pnl
+        else:
+            performance.trade_pnl = performance.cur_value - performance.hold_value
+
+        performance.fees = dict(self.fees)
+        await performance._calculate_fee_in_quote(self.exchange, self.quote)
+
+        performance.total_pnl = performance.trade_pnl - performance.fee_in_quote
+        performance.return_pct = performance.divide(performance.total_pnl, performance.hold_value)
+        return performance
+
+    def _add_position_fill(self, is_buy: bool, price: Decimal, amount: Decimal, order_id: str, position: str):
+        order: Optional[_AggregatedPositionOrder] = self._position_orders.get(order_id)
+        if order is None:
+            if position == PositionAction.OPEN.value:
+                pairing_list = self._long_opens if is_buy else self._short_opens
+            elif position == PositionAction.CLOSE.value:
+                pairing_list = self._short_closes if is_buy else self._long_closes
+            else:
+                return
+            order = _AggregatedPositionOrder(pairing_list)
+            pairing_list.append(order)
+            self._position_orders[order_id] = order
+
+        previous_pnl: Decimal = self._paired_position_pnl(order)
+        order.price_sum += price
+        order.fill_count += 1
+        order.amount += amount
+        self.closed_positions_pnl += self._paired_position_pnl(order) - previous_pnl
+
+    def _paired_position_pnl(self, order: _AggregatedPositionOrder) -> Decimal:
+        if order.pairing_list is self._long_opens or order.pairing_list is self._long_closes:
+            opens, closes, direction = self._long_opens, self._long_closes, 1
+        else:
+            opens, closes, direction = self._short_opens, self._short_closes, -1
+        if order.index >= len(opens) or order.index >= len(closes):
+            return s_decimal_0
+        open_order, close_order = opens[order.index], closes[order.index]
+        if open_order.fill_count == 0 or close_order.fill_count == 0:
+            return s_decimal_0
+        return (close_order.price - open_order.price) * close_order.amount * direction
+
+
+class PerformanceTracker:
+    """
+    Keeps the performance aggregates of the current session up to date with the fills of the markets, so that the
+    history command and the kill switch do not have to reload and go through every trade from the database.
+
+    The tracker starts from the trades already recorded for the session, and adds the fills of the markets as they
+    happen once started.
+    """
+
+    def __init__(self,
+                 markets: List[ConnectorBase],
+                 config_file_path: str,
+                 start_time: float,
+                 trades: Iterable[TradeFill] = ()):
+        """
+        :param markets: the markets to track the fills of
+        :param config_file_path: the strategy config file the fills are recorded for
+        :param start_time: timestamp (in seconds) of the start of the tracked period
+        :param trades: trades recorded since the start of the tracked period, in chronological order
+        """
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._markets: List[ConnectorBase] = markets
+        self._config_file_path: str = config_file_path
+        self._start_time: float = start_time
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        for trade in trades:
+            self._accumulator(trade.market, trade.symbol).add_trade_fill(trade)
+
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def config_file_path(self) -> str:
+        return self._config_file_path
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        """
+        Returns the aggregates of the trades, by market and trading pair.
+        """
+        return self._accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def start(self):
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def _accumulator(self, exchange: str, trading_pair: str) -> PerformanceAccumulator:
+        accumulator: Optional[PerformanceAccumulator] = self._accumulators.get((exchange, trading_pair))
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(exchange, trading_pair)
+            self._accumulators[(exchange, trading_pair)] = accumulator
+        return accumulator
+
+    def _did_fill_order(self, event_tag: int, market: ConnectorBase, evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+        self._accumulator(market.display_name, evt.trading_pair).add_order_filled_event(evt)
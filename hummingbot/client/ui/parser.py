@@ -110,6 +110,9 @@ def load_parser(hummingbot, command_tabs) -> [ThrowingArgumentParser, Any]:
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    metrics_parser = subparsers.add_parser("metrics", help="Show the timing of the clock ticks of the running strategy")
+    metrics_parser.set_defaults(func=hummingbot.metrics)
+
     script_parser = subparsers.add_parser("script", help="Send command to running script instance")
     script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
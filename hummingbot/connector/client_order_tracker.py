@@ -1,9 +1,10 @@
 import logging
 import asyncio
 
-from collections import defaultdict
+from collections import ChainMap, defaultdict
 from decimal import Decimal
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 from cachetools import TTLCache
 
 from hummingbot.connector.connector_base import ConnectorBase
@@ -60,6 +61,16 @@ class ClientOrderTracker:
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
 
+        self._all_orders: ChainMap = ChainMap(self._in_flight_orders, self._cached_orders)
+
+        # Secondary indexes, kept up to date as orders are tracked, untracked and updated
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._indexed_order_states: Dict[str, OrderState] = {}
+        self._untracked_orders_since_index_rebuild: int = 0
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -72,18 +83,20 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
+        The returned mapping is a view on the cache, not a copy.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return self._cached_orders
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
+        The returned mapping is a view on the active and cached orders, not a copy.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders
 
     @property
     def current_timestamp(self) -> int:
@@ -94,11 +107,19 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._index_exchange_order_id(order)
+        self._index_order_state(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
-            del self._in_flight_orders[client_order_id]
+            order: InFlightOrder = self._in_flight_orders.pop(client_order_id)
+            self._cached_orders[client_order_id] = order
+            self._orders_without_exchange_order_id.pop(client_order_id, None)
+            self._unindex_active_order(order)
+            self._untracked_orders_since_index_rebuild += 1
+            if self._untracked_orders_since_index_rebuild >= self.MAX_CACHE_SIZE:
+                self._rebuild_exchange_order_id_index()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -119,13 +140,79 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        if client_order_id in self.all_orders:
-            return self.all_orders[client_order_id]
+        order: Optional[InFlightOrder] = self._in_flight_orders.get(client_order_id)
+        if order is None and client_order_id is not None:
+            order = self._cached_orders.get(client_order_id)
+        if order is None and exchange_order_id is not None:
+            order = self._fetch_order_by_exchange_order_id(exchange_order_id)
+        return order
+
+    def fetch_orders_by_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the actively tracked orders of the trading pair, as a read-only view keyed by client order id.
+        """
+        return MappingProxyType(self._active_orders_by_trading_pair.get(trading_pair, {}))
+
+    def fetch_orders_by_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the actively tracked orders in the given state, as a read-only view keyed by client order id.
+        """
+        return MappingProxyType(self._active_orders_by_state.get(state, {}))
 
-        for order in self.all_orders.values():
-            if order.exchange_order_id == exchange_order_id:
+    def _fetch_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        order: Optional[InFlightOrder] = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is not None:
+            if order.exchange_order_id == exchange_order_id and order.client_order_id in self._all_orders:
                 return order
-        return None
+            del self._orders_by_exchange_order_id[exchange_order_id]
+
+        # The exchange order id might have been assigned to an order directly, outside of the tracker updates
+        for pending_order in list(self._orders_without_exchange_order_id.values()):
+            if pending_order.exchange_order_id is not None:
+                self._index_exchange_order_id(pending_order)
+        return self._orders_by_exchange_order_id.get(exchange_order_id)
+
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+    def _index_order_state(self, order: InFlightOrder):
+        client_order_id: str = order.client_order_id
+        indexed_state: Optional[OrderState] = self._indexed_order_states.get(client_order_id)
+        if indexed_state is not order.current_state:
+            if indexed_state is not None:
+                self._active_orders_by_state[indexed_state].pop(client_order_id, None)
+            self._active_orders_by_state[order.current_state][client_order_id] = order
+            self._indexed_order_states[client_order_id] = order.current_state
+
+    def _unindex_active_order(self, order: InFlightOrder):
+        client_order_id: str = order.client_order_id
+        trading_pair_orders: Dict[str, InFlightOrder] = self._active_orders_by_trading_pair.get(order.trading_pair, {})
+        trading_pair_orders.pop(client_order_id, None)
+        if len(trading_pair_orders) == 0:
+            self._active_orders_by_trading_pair.pop(order.trading_pair, None)
+        indexed_state: Optional[OrderState] = self._indexed_order_states.pop(client_order_id, None)
+        if indexed_state is not None:
+            self._active_orders_by_state[indexed_state].pop(client_order_id, None)
+
+    def _update_order_indexes(self, order: InFlightOrder):
+        if order.client_order_id in self._in_flight_orders:
+            self._index_exchange_order_id(order)
+            self._index_order_state(order)
+        elif order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+    def _rebuild_exchange_order_id_index(self):
+        # Drops the orders that expired from the cache. Runs once every MAX_CACHE_SIZE untracked orders
+        self._untracked_orders_since_index_rebuild = 0
+        self._orders_by_exchange_order_id = {
+            order.exchange_order_id: order
+            for order in self._all_orders.values()
+            if order.exchange_order_id is not None
+        }
 
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
@@ -254,6 +341,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._update_order_indexes(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_fills(tracked_order, previous_executed_amount_base)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -271,6 +359,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                self._update_order_indexes(tracked_order)
                 self._trigger_order_fills(tracked_order, previous_executed_amount_base)
                 self._trigger_order_completion(tracked_order, trade_update)
 
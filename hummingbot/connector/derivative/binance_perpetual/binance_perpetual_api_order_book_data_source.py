@@ -34,6 +34,9 @@ from hummingbot.logger import HummingbotLogger
 
 class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    # Snapshot requests are all paced by the data source's throttler
+    CONCURRENT_SNAPSHOT_REQUESTS = True
+
     _bpobds_logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
     _mapping_initialization_lock = asyncio.Lock()
@@ -46,11 +49,11 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         api_factory: Optional[WebAssistantsFactory] = None,
     ):
         super().__init__(trading_pairs)
-        self._api_factory: WebAssistantsFactory = api_factory or utils.build_api_factory()
+        self._throttler = throttler or self._get_throttler_instance()
+        self._api_factory: WebAssistantsFactory = api_factory or utils.build_api_factory(throttler=self._throttler)
         self._ws_assistant: Optional[WSAssistant] = None
         self._order_book_create_function = lambda: OrderBook()
         self._domain = domain
-        self._throttler = throttler or self._get_throttler_instance()
         self._funding_info: Dict[str, FundingInfo] = {}
 
         self._message_queue: Dict[int, asyncio.Queue] = defaultdict(asyncio.Queue)
@@ -285,7 +288,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             domain=self._domain,
             throttler=self._throttler)}
 
-        async with self._get_throttler_instance().execute_task(limit_id=CONSTANTS.MARK_PRICE_URL):
+        async with self._throttler.execute_task(limit_id=CONSTANTS.MARK_PRICE_URL):
             url = utils.rest_url(CONSTANTS.MARK_PRICE_URL, self._domain)
             request: RESTRequest = RESTRequest(method=RESTMethod.GET, url=url, params=params)
             response: RESTResponse = await rest_assistant.call(request)
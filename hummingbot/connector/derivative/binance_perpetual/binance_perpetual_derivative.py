@@ -85,10 +85,10 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
                                                                 api_secret=binance_perpetual_api_secret)
         self._trading_pairs = trading_pairs
         self._trading_required = trading_required
-        self._api_factory = utils.build_api_factory(auth=self._auth)
+        self._throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
+        self._api_factory = utils.build_api_factory(auth=self._auth, throttler=self._throttler)
         self._rest_assistant: Optional[RESTAssistant] = None
         self._ws_assistant: Optional[WSAssistant] = None
-        self._throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
         self._domain = domain
 
         ExchangeBase.__init__(self)
@@ -50,13 +50,14 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         api_factory: Optional[WebAssistantsFactory] = None
     ):
         super().__init__()
-        self._api_factory: WebAssistantsFactory = api_factory or utils.build_api_factory(auth=auth)
+        self._throttler = throttler or self._get_throttler_instance()
+        self._api_factory: WebAssistantsFactory = api_factory or utils.build_api_factory(auth=auth,
+                                                                                         throttler=self._throttler)
         self._rest_assistant: Optional[RESTAssistant] = None
         self._ws_assistant: Optional[WSAssistant] = None
         self._current_listen_key = None
         self._listen_for_user_stream_task = None
         self._domain = domain
-        self._throttler = throttler or self._get_throttler_instance()
         self._last_listen_key_ping_ts = None
 
         self._manage_listen_key_task = None
@@ -6,9 +6,11 @@ import hummingbot.connector.derivative.binance_perpetual.constants as CONSTANTS
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -57,8 +59,21 @@ def wss_url(endpoint: str, domain: str = "binance_perpetual"):
     return base_ws_url + endpoint
 
 
-def build_api_factory(auth: Optional[AuthBase] = None) -> WebAssistantsFactory:
-    api_factory = WebAssistantsFactory(auth=auth, rest_pre_processors=[BinancePerpetualRESTPreProcessor()])
+def build_api_factory(auth: Optional[AuthBase] = None,
+                      throttler: Optional[AsyncThrottlerBase] = None) -> WebAssistantsFactory:
+    """
+    Builds the WebAssistantsFactory used to communicate with the exchange
+    :param auth: the authenticator used for private endpoints
+    :param throttler: if provided, the rate limit usage reported in the responses headers is fed back into it
+    :return: the WebAssistantsFactory instance
+    """
+    rest_post_processors = []
+    if throttler is not None:
+        rest_post_processors.append(RateLimitUsageRESTPostProcessor(throttler=throttler,
+                                                                    usage_headers=CONSTANTS.RATE_LIMIT_USAGE_HEADERS))
+    api_factory = WebAssistantsFactory(auth=auth,
+                                       rest_pre_processors=[BinancePerpetualRESTPreProcessor()],
+                                       rest_post_processors=rest_post_processors)
     return api_factory
 
 
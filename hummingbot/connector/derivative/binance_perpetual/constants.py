@@ -65,6 +65,13 @@ REQUEST_WEIGHT = "REQUEST_WEIGHT"
 ORDERS_1MIN = "ORDERS_1MIN"
 ORDERS_1SEC = "ORDERS_1SEC"
 
+# Response headers reporting the rate limits usage of the IP/account
+RATE_LIMIT_USAGE_HEADERS = {
+    "X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT,
+    "X-MBX-ORDER-COUNT-1M": ORDERS_1MIN,
+    "X-MBX-ORDER-COUNT-10S": ORDERS_1SEC,
+}
+
 DIFF_STREAM_ID = 1
 TRADE_STREAM_ID = 2
 FUNDING_INFO_STREAM_ID = 3
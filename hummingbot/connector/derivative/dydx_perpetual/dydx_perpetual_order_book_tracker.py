@@ -66,6 +66,7 @@ class DydxPerpetualOrderBookTracker(OrderBookTracker):
     async def _track_single_book(self, trading_pair: str):
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: DydxPerpetualOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         while True:
             try:
                 message: DydxPerpetualOrderBookMessage = None
@@ -75,6 +76,7 @@ class DydxPerpetualOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
                 if message.type is OrderBookMessageType.DIFF:
                     bids = [ClientOrderBookRow(Decimal(bid["price"]), Decimal(bid["amount"]), message.update_id) for bid in message.bids]
                     asks = [ClientOrderBookRow(Decimal(ask["price"]), Decimal(ask["amount"]), message.update_id) for ask in message.asks]
@@ -77,6 +77,7 @@ class AscendExOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: AscendExOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
 
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
@@ -90,6 +91,7 @@ class AscendExOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
                     # bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
@@ -30,6 +30,7 @@ from hummingbot.core.web_assistant.connections.data_types import (
     RESTResponse,
     WSRequest,
 )
+from hummingbot.core.web_assistant.connections.ws_channel_router import WSChannelRouter
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -39,6 +40,8 @@ from hummingbot.logger import HummingbotLogger
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     HEARTBEAT_TIME_INTERVAL = 30.0
+    # Snapshot requests are all paced by the data source's throttler
+    CONCURRENT_SNAPSHOT_REQUESTS = True
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
@@ -317,11 +320,14 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
+        The events are routed to their queue by the channel router, from their event type at the start of the raw
+        frame, so only the messages the router doesn't recognize are decoded before being inspected here.
         """
         ws = None
         while True:
             try:
                 ws: WSAssistant = await self._get_ws_assistant()
+                ws.set_channel_router(self._channel_router())
                 await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
                                  ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
                 await self._subscribe_channels(ws)
@@ -345,6 +351,12 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             finally:
                 ws and await ws.disconnect()
 
+    def _channel_router(self) -> WSChannelRouter:
+        channel_router = WSChannelRouter()
+        for event_type in [CONSTANTS.DIFF_EVENT_TYPE, CONSTANTS.TRADE_EVENT_TYPE]:
+            channel_router.add_route(f'"e":"{event_type}"', self._message_queue[event_type])
+        return channel_router
+
     async def get_snapshot(
             self,
             trading_pair: str,
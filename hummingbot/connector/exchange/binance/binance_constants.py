@@ -39,6 +39,12 @@ REQUEST_WEIGHT = "REQUEST_WEIGHT"
 ORDERS = "ORDERS"
 ORDERS_24HR = "ORDERS_24HR"
 
+# Response headers reporting the rate limits usage of the IP/account
+RATE_LIMIT_USAGE_HEADERS = {
+    "X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT,
+    "X-MBX-ORDER-COUNT-1D": ORDERS_24HR,
+}
+
 # Rate Limit time intervals
 ONE_MINUTE = 60
 ONE_SECOND = 1
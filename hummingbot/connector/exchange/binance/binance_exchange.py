@@ -12,6 +12,7 @@ from typing import (
 )
 
 from async_timeout import timeout
+import ujson
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
@@ -47,6 +48,7 @@ from hummingbot.core.utils.async_utils import (
 )
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
@@ -77,9 +79,14 @@ class BinanceExchange(ExchangeBase):
             api_key=binance_api_key,
             secret_key=binance_api_secret,
             time_provider=self._binance_time_synchronizer)
-        self._api_factory = WebAssistantsFactory(auth=self._auth)
-        self._rest_assistant = None
         self._throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
+        # Binance sends prices and amounts as strings, so ujson decodes its messages accurately
+        self._api_factory = WebAssistantsFactory(
+            auth=self._auth,
+            rest_post_processors=[RateLimitUsageRESTPostProcessor(throttler=self._throttler,
+                                                                  usage_headers=CONSTANTS.RATE_LIMIT_USAGE_HEADERS)],
+            ws_json_decoder=ujson.loads)
+        self._rest_assistant = None
         self._order_book_tracker = BinanceOrderBookTracker(
             trading_pairs=trading_pairs,
             domain=domain,
@@ -96,6 +103,7 @@ class BinanceExchange(ExchangeBase):
         self._status_polling_task = None
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
+        self._prewarm_connections_task = None
         self._last_poll_timestamp = 0
         self._last_trades_poll_binance_timestamp = 0
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self)
@@ -191,7 +199,10 @@ class BinanceExchange(ExchangeBase):
         - The polling loop to update the trading rules
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
+        It also opens the connection to the REST API in advance, so the first orders do not wait for the TLS handshake.
         """
+        self._prewarm_connections_task = safe_ensure_future(self._api_factory.prewarm_connections(
+            [binance_utils.public_rest_url(CONSTANTS.PING_PATH_URL, domain=self._domain)]))
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
@@ -218,7 +229,10 @@ class BinanceExchange(ExchangeBase):
             self._user_stream_event_listener_task.cancel()
         if self._trading_rules_polling_task is not None:
             self._trading_rules_polling_task.cancel()
+        if self._prewarm_connections_task is not None:
+            self._prewarm_connections_task.cancel()
         self._status_polling_task = self._user_stream_tracker_task = self._user_stream_event_listener_task = None
+        self._prewarm_connections_task = None
 
     async def check_network(self) -> NetworkStatus:
         """
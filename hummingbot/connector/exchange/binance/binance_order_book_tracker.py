@@ -99,7 +99,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
                     continue
-                await message_queue.put(ob_message)
+                self._put_tracking_message(trading_pair, message_queue, ob_message)
                 messages_accepted += 1
 
                 # Log some statistics.
@@ -128,6 +128,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -141,13 +142,24 @@ class BinanceOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                    self._queue_overflow_messages(trading_pair, message_queue)
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    diffs: List[OrderBookMessage] = [message]
+                    # Merge the diffs waiting behind this one, up to the next snapshot
+                    while self._coalesce_diffs and len(saved_messages) == 0 and not message_queue.empty():
+                        message = message_queue.get_nowait()
+                        if message.type is not OrderBookMessageType.DIFF:
+                            saved_messages.append(message)
+                            break
+                        self._record_tracked_message(message)
+                        diffs.append(message)
+                    self._apply_diff_messages(trading_pair, order_book, diffs)
+                    past_diffs_window.extend(diffs)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted += len(diffs)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -140,6 +140,7 @@ class BitfinexOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: BitfinexOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         active_order_tracker: BitfinexActiveOrderTracker = self._active_order_trackers[trading_pair]
 
         last_message_timestamp: float = time.time()
@@ -153,6 +154,7 @@ class BitfinexOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = self._convert_diff_message_to_order_book_row(message)
@@ -61,6 +61,7 @@ class BitmartOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: BitmartOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
 
         while True:
             try:
@@ -71,6 +72,7 @@ class BitmartOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[BitmartOrderBookMessage] = list(past_diffs_window)
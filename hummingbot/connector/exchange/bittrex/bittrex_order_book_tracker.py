@@ -141,6 +141,7 @@ class BittrexOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: BittrexOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         active_order_tracker: BittrexActiveOrderTracker = self._active_order_trackers[trading_pair]
 
         last_message_timestamp = order_book.snapshot_uid
@@ -155,6 +156,7 @@ class BittrexOrderBookTracker(OrderBookTracker):
                     message = save_messages.popleft()
                 elif message_queue.qsize() > 0:
                     message = await message_queue.get()
+                    self._record_tracked_message(message)
                 else:
                     # Waits to received some diff messages
                     await asyncio.sleep(3)
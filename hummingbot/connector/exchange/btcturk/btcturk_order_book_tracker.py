@@ -122,6 +122,7 @@ class BtcturkOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -135,6 +136,7 @@ class BtcturkOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
@@ -122,6 +122,7 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: CoinbaseProOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         active_order_tracker: CoinbaseProActiveOrderTracker = self._active_order_trackers[trading_pair]
 
         last_message_timestamp: float = time.time()
@@ -136,6 +137,7 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
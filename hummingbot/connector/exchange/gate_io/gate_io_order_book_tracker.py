@@ -76,6 +76,7 @@ class GateIoOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: GateIoOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         active_order_tracker: GateIoActiveOrderTracker = self._active_order_trackers[trading_pair]
 
         last_message_timestamp: float = time.time()
@@ -84,6 +85,7 @@ class GateIoOrderBookTracker(OrderBookTracker):
         while True:
             try:
                 message: GateIoOrderBookMessage = await message_queue.get()
+                self._record_tracked_message(message)
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
                     order_book.apply_diffs(bids, asks, message.update_id)
@@ -68,12 +68,14 @@ class HuobiOrderBookTracker(OrderBookTracker):
     async def _track_single_book(self, trading_pair: str):
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
         while True:
             try:
                 message: OrderBookMessage = await message_queue.get()
+                self._record_tracked_message(message)
                 if message.type is OrderBookMessageType.DIFF:
                     # Huobi websocket messages contain the entire order book state so they should be treated as snapshots
                     order_book.apply_snapshot(message.bids, message.asks, message.update_id)
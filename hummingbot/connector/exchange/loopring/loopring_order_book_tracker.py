@@ -73,6 +73,7 @@ class LoopringOrderBookTracker(OrderBookTracker):
     async def _track_single_book(self, trading_pair: str):
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: LoopringOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
         active_order_tracker: LoopringActiveOrderTracker = self._active_order_trackers[trading_pair]
         while True:
             try:
@@ -83,6 +84,7 @@ class LoopringOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
                     order_book.apply_diffs(bids, asks, message.content["startVersion"])
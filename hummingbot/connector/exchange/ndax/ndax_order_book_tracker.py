@@ -68,6 +68,7 @@ class NdaxOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: NdaxOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
 
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
@@ -81,6 +82,7 @@ class NdaxOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = message.bids, message.asks
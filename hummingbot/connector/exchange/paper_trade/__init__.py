@@ -1,7 +1,9 @@
 from typing import List, Callable
 from hummingbot.client.config.config_helpers import get_connector_class
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
 from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.replay_order_book_tracker import ReplayOrderBookTracker
 from hummingbot.client.settings import AllConnectorSettings
 
 
@@ -28,3 +30,14 @@ def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
     return PaperTradeExchange(obt_obj,
                               MarketConfig.default_config(),
                               get_connector_class(exchange_name))
+
+
+def create_backtest_market(exchange_name: str, trading_pairs: List[str], recording_file_paths: List[str]):
+    """
+    Creates a paper trade market of the exchange replaying the market data recorded in the files, to run with a
+    BACKTEST mode clock.
+    """
+    obt_obj = ReplayOrderBookTracker.from_recordings(recording_file_paths, trading_pairs, exchange_name)
+    return BacktestExchange(obt_obj,
+                            MarketConfig.default_config(),
+                            get_connector_class(exchange_name))
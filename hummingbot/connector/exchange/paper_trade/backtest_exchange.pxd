@@ -0,0 +1,5 @@
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+
+
+cdef class BacktestExchange(PaperTradeExchange):
+    pass
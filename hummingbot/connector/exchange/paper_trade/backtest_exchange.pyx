@@ -0,0 +1,27 @@
+from hummingbot.core.clock cimport Clock
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.replay_order_book_tracker import ReplayOrderBookTracker
+
+
+cdef class BacktestExchange(PaperTradeExchange):
+    """
+    Paper trade exchange whose order books replay recorded market data, to backtest strategies with a BACKTEST mode
+    clock. On every tick the recorded messages up to the tick's timestamp are applied to the order books before the
+    paper trade orders are matched against them, and the strategies, ticked after the markets, see the replayed
+    market as it was at that time.
+    """
+
+    def __init__(self, order_book_tracker: ReplayOrderBookTracker, config: MarketConfig, target_market: type):
+        super().__init__(order_book_tracker, config, target_market)
+
+    @property
+    def display_name(self) -> str:
+        return f"{self._order_book_tracker.exchange_name}_Backtest"
+
+    cdef c_start(self, Clock clock, double timestamp):
+        PaperTradeExchange.c_start(self, clock, timestamp)
+        self._order_book_tracker.advance_to(timestamp)
+
+    cdef c_tick(self, double timestamp):
+        self._order_book_tracker.advance_to(timestamp)
+        PaperTradeExchange.c_tick(self, timestamp)
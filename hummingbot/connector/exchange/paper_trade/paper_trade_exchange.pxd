@@ -41,6 +41,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         object _config
         object _queued_orders
         dict _quantization_params
+        dict _on_hold_balances
         object _order_book_trade_listener
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
@@ -50,6 +51,7 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
     cdef c_process_market_orders(self)
     cdef c_set_balance(self, str currency, object amount)
+    cdef c_add_on_hold_balance(self, str currency, object amount)
     cdef object c_get_fee(self,
                           str base_asset,
                           str quote_asset,
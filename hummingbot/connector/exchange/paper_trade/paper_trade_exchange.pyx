@@ -176,6 +176,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         super(ExchangeBase, self).__init__()
         self._account_balances = {}
         self._account_available_balances = {}
+        self._on_hold_balances = {}
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._config = config
@@ -285,20 +286,12 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
-        _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
-        return _available_balances
+        return {currency: balance - self._on_hold_balances.get(currency, s_decimal_0)
+                for currency, balance in self._account_balances.items()}
 
     # </editor-fold>
 
@@ -374,6 +367,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_add_on_hold_balance(quote_asset, quantized_price * quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -428,6 +422,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_add_on_hold_balance(base_asset, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -567,14 +562,33 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_add_on_hold_balance(self, str currency, object amount):
+        # The amounts held by the open limit orders are kept up to date as the orders are created and deleted, so
+        # that the available balances don't have to go through the orders
+        cdef object on_hold_balance = self._on_hold_balances.get(currency, s_decimal_0) + amount
+        if on_hold_balance == s_decimal_0:
+            self._on_hold_balances.pop(currency, None)
+        else:
+            self._on_hold_balances[currency] = on_hold_balance
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            str on_hold_currency
+            object on_hold_amount
         try:
+            if cpp_limit_order_ptr.getIsBuy():
+                on_hold_currency = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+                on_hold_amount = <object> cpp_limit_order_ptr.getPrice() * <object> cpp_limit_order_ptr.getQuantity()
+            else:
+                on_hold_currency = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+                on_hold_amount = <object> cpp_limit_order_ptr.getQuantity()
             orders_collection_ptr.erase(orders_it)
+            self.c_add_on_hold_balance(on_hold_currency, -on_hold_amount)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
             return True
@@ -832,7 +846,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._on_hold_balances.get(currency, s_decimal_0)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cdef:
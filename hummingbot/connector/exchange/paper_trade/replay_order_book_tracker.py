@@ -0,0 +1,240 @@
+import asyncio
+import gzip
+import heapq
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+import ujson
+
+from hummingbot.core.data_type.market_data_recorder import (
+    DATA_FILE_EXTENSION,
+    MarketDataReader,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.logger import HummingbotLogger
+
+RECORD_TYPES = {
+    "snapshot": OrderBookMessageType.SNAPSHOT,
+    "diff": OrderBookMessageType.DIFF,
+    "trade": OrderBookMessageType.TRADE,
+}
+
+
+def message_from_record(record: Dict[str, Any]) -> OrderBookMessage:
+    """
+    Converts a recorded market data entry to an order book message. The entries are dictionaries with the type
+    ("snapshot", "diff" or "trade"), the timestamp (in seconds) and the trading pair, along with:
+    - for snapshots and diffs, the update id and the bids and asks as [price, amount] rows
+    - for trades, the trade id, the trade type ("buy" or "sell", the taker side), the price and the amount
+    """
+    message_type = RECORD_TYPES[record["type"]]
+    if message_type is OrderBookMessageType.TRADE:
+        content = {
+            "trading_pair": record["trading_pair"],
+            "trade_type": float(TradeType.SELL.value if record["trade_type"] == "sell" else TradeType.BUY.value),
+            "trade_id": record["trade_id"],
+            "update_id": record["trade_id"],
+            "price": record["price"],
+            "amount": record["amount"],
+        }
+    else:
+        content = {
+            "trading_pair": record["trading_pair"],
+            "update_id": record["update_id"],
+            "bids": record["bids"],
+            "asks": record["asks"],
+        }
+    return OrderBookMessage(message_type, content, record["timestamp"])
+
+
+def record_from_message(message: OrderBookMessage) -> Dict[str, Any]:
+    """
+    Converts an order book message to the recorded market data format read by message_from_record
+    """
+    if message.type is OrderBookMessageType.TRADE:
+        return {
+            "type": "trade",
+            "timestamp": message.timestamp,
+            "trading_pair": message.trading_pair,
+            "trade_id": message.trade_id,
+            "trade_type": "sell" if message.content["trade_type"] == float(TradeType.SELL.value) else "buy",
+            "price": str(message.content["price"]),
+            "amount": str(message.content["amount"]),
+        }
+    return {
+        "type": "snapshot" if message.type is OrderBookMessageType.SNAPSHOT else "diff",
+        "timestamp": message.timestamp,
+        "trading_pair": message.trading_pair,
+        "update_id": message.update_id,
+        "bids": [[str(row.price), str(row.amount)] for row in message.bids],
+        "asks": [[str(row.price), str(row.amount)] for row in message.asks],
+    }
+
+
+def read_recorded_messages(file_path: str) -> Iterator[OrderBookMessage]:
+    """
+    Reads the messages recorded in a JSON lines file, one record per line in timestamp order. Files whose name ends
+    with .gz are decompressed on the fly, and market data files written by MarketDataRecorder are read through
+    MarketDataReader.
+    """
+    if file_path.endswith(DATA_FILE_EXTENSION):
+        reader = MarketDataReader(file_path)
+        try:
+            yield from reader.iter_messages()
+        finally:
+            reader.close()
+        return
+    open_function = gzip.open if file_path.endswith(".gz") else open
+    with open_function(file_path, "rt") as recording:
+        for line in recording:
+            if line.strip():
+                yield message_from_record(ujson.loads(line))
+
+
+def write_recorded_messages(file_path: str, messages: Iterable[OrderBookMessage]):
+    open_function = gzip.open if file_path.endswith(".gz") else open
+    with open_function(file_path, "wt") as recording:
+        for message in messages:
+            recording.write(ujson.dumps(record_from_message(message)) + "\n")
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of the recorded markets. It has no live data, the messages are replayed by ReplayOrderBookTracker.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        raise NotImplementedError("The order books of recorded markets are built from their recorded snapshots.")
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker replaying recorded snapshots, diffs and trades, in timestamp order, into the order books.
+    Instead of listening to an exchange, it applies the recorded messages up to a timestamp each time advance_to() is
+    called; BacktestExchange calls it on every clock tick, so that the markets are replayed in step with a BACKTEST
+    mode clock, as fast as the strategies can process them.
+
+    An order book is created from the first snapshot of its trading pair, the diffs and trades recorded before it are
+    skipped, and the tracker is ready once every trading pair has an order book.
+    """
+
+    _rtobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rtobt_logger is None:
+            cls._rtobt_logger = logging.getLogger(__name__)
+        return cls._rtobt_logger
+
+    def __init__(self, messages: Iterable[OrderBookMessage], trading_pairs: List[str], exchange_name: str):
+        super().__init__(data_source=ReplayOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+        self._exchange_name = exchange_name
+        self._messages: Iterator[OrderBookMessage] = iter(messages)
+        self._next_message: Optional[OrderBookMessage] = next(self._messages, None)
+        self._replayed_messages_count = 0
+
+    @classmethod
+    def from_recordings(cls,
+                        file_paths: List[str],
+                        trading_pairs: List[str],
+                        exchange_name: str) -> "ReplayOrderBookTracker":
+        """
+        Replays recording files, merging them in timestamp order (e.g. one file per trading pair)
+        """
+        messages = heapq.merge(*[read_recorded_messages(file_path) for file_path in file_paths],
+                               key=lambda message: message.timestamp)
+        return cls(messages, trading_pairs, exchange_name)
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def replayed_messages_count(self) -> int:
+        return self._replayed_messages_count
+
+    @property
+    def next_message_timestamp(self) -> Optional[float]:
+        """
+        The timestamp of the next message to replay, None once they have all been replayed
+        """
+        return self._next_message.timestamp if self._next_message is not None else None
+
+    def start(self):
+        # Nothing to listen to, the recorded messages are replayed by advance_to()
+        pass
+
+    def stop(self):
+        pass
+
+    def advance_to(self, timestamp: float):
+        """
+        Applies the recorded messages whose timestamps are up to the timestamp.
+        """
+        while self._next_message is not None and self._next_message.timestamp <= timestamp:
+            message = self._next_message
+            self._next_message = next(self._messages, None)
+            self._replayed_messages_count += 1
+            trading_pair = message.trading_pair
+            if trading_pair not in self._trading_pairs:
+                continue
+            order_book = self._order_books.get(trading_pair)
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                if order_book is None:
+                    order_book = self._data_source.order_book_create_function()
+                    self._order_books[trading_pair] = order_book
+                    self._ready_trading_pairs.add(trading_pair)
+                    if len(self._ready_trading_pairs) == len(self._trading_pairs):
+                        self._order_books_initialized.set()
+                order_book.apply_raw_snapshot(message.content["bids"], message.content["asks"], message.update_id)
+            elif order_book is None:
+                continue
+            elif message.type is OrderBookMessageType.DIFF:
+                if message.update_id > order_book.snapshot_uid:
+                    self._apply_diff_messages(trading_pair, order_book, [message])
+            else:
+                order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=trading_pair,
+                    timestamp=message.timestamp,
+                    price=float(message.content["price"]),
+                    amount=float(message.content["amount"]),
+                    type=TradeType.SELL if
+                    message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+                ))
@@ -81,6 +81,7 @@ class ProbitOrderBookTracker(OrderBookTracker):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: ProbitOrderBook = self._order_books[trading_pair]
+        self._record_order_book(trading_pair, order_book)
 
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
@@ -94,6 +95,7 @@ class ProbitOrderBookTracker(OrderBookTracker):
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                self._record_tracked_message(message)
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = probit_utils.convert_diff_message_to_order_book_row(message)
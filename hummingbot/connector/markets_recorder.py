@@ -1,10 +1,12 @@
 import asyncio
+import logging
 import os.path
+import queue
 import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -35,15 +37,39 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position import RangePosition
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
 
+# A write operation adds its records to the session, and optionally returns a callback to run once they are committed
+WriteOperation = Callable[[Session], Optional[Callable[[], None]]]
+
 
 class MarketsRecorder:
+    """
+    Records the orders, trades and market states of the markets into the trade fills database.
+
+    Once started, the records are written behind the events: each event queues a write operation that a background
+    thread commits, together with the other queued operations, in batched transactions. Operations are committed in
+    the order the events were received, which keeps the records of each order in order, and the market states are
+    saved once per batch. The queue is bounded by `WRITE_QUEUE_MAX_SIZE`; when it is full, recording an event waits
+    for the writer to catch up. When the recorder is not started, the records are written as the events are received.
+    """
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    WRITE_BATCH_SIZE: int = 200
+    WRITE_QUEUE_MAX_SIZE: int = 10000
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
@@ -57,12 +83,16 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_MAX_SIZE)
+        self._writer_thread: Optional[threading.Thread] = None
+        # Latest tracking states of the markets, waiting to be saved by the writer
+        self._pending_market_states: Dict[str, Dict[str, any]] = {}
+        self._pending_market_states_lock: threading.Lock = threading.Lock()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
+        trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
+        trade_fill_details = {TradeFillOrderDetails(tf.market, tf.exchange_trade_id, tf.symbol) for tf in trade_fills}
         for market in self._markets:
-            trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
-                                                                               tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills})
+            market.add_trade_fills_from_market_recorder(set(trade_fill_details))
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
@@ -110,15 +140,34 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def pending_writes(self) -> int:
+        return self._write_queue.qsize()
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is not None:
+            # The writer commits everything queued before the stop signal, then exits
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    async def flush(self):
+        """
+        Waits until all the records queued so far are committed to the database, without blocking the event loop
+        """
+        if self._writer_thread is not None:
+            await self._ev_loop.run_in_executor(None, self._write_queue.join)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -149,17 +198,25 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_market_states(config_file_path, market.display_name, market.tracking_states, session)
+
+    def _save_market_states(self, config_file_path: str, market_name: str, saved_state: Dict[str, any],
+                            session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -180,6 +237,93 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _write(self, operation: WriteOperation, market: Optional[ConnectorBase] = None):
+        """
+        Queues a write operation for the writer thread, or runs it right away if the recorder is not started.
+        :param operation: the write operation
+        :param market: if provided, the market states of the market are saved along with the operation
+        """
+        market_name: Optional[str] = None
+        if market is not None:
+            market_name = market.display_name
+            with self._pending_market_states_lock:
+                self._pending_market_states[market_name] = market.tracking_states
+        if self._writer_thread is None:
+            self._write_batch([(operation, market_name)])
+        else:
+            if self._write_queue.full():
+                self.logger().warning("The trade fills database writes are lagging behind, waiting for pending "
+                                      "records to be committed.")
+            self._write_queue.put((operation, market_name))
+
+    def _write_loop(self):
+        while True:
+            batch: List[Optional[Tuple[WriteOperation, Optional[str]]]] = [self._write_queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop_requested: bool = batch[-1] is None
+            items = [item for item in batch if item is not None]
+            try:
+                if len(items) > 0:
+                    self._write_batch(items)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            if stop_requested:
+                return
+
+    def _write_batch(self, items: List[Tuple[WriteOperation, Optional[str]]]):
+        try:
+            post_commit_callbacks: List[Callable[[], None]] = self._commit(items)
+        except Exception:
+            if len(items) == 1:
+                self.logger().error("Unexpected error while saving records to the trade fills database.",
+                                    exc_info=True)
+                return
+            # Commit the operations one by one, so that a single faulty record does not discard the whole batch
+            self.logger().warning("Unexpected error while saving a batch of records to the trade fills database. "
+                                  "Retrying them one at a time.", exc_info=True)
+            for item in items:
+                self._write_batch([item])
+            return
+        # The records are committed at this point, a failing callback must not have them written again
+        for callback in post_commit_callbacks:
+            try:
+                callback()
+            except Exception:
+                self.logger().error("Unexpected error after saving records to the trade fills database.",
+                                    exc_info=True)
+
+    def _commit(self, items: List[Tuple[WriteOperation, Optional[str]]]) -> List[Callable[[], None]]:
+        """
+        Runs the write operations in one transaction and returns the callbacks to run once they are committed
+        """
+        post_commit_callbacks: List[Callable[[], None]] = []
+        saved_states: Dict[str, Dict[str, any]] = {}
+
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for operation, market_name in items:
+                    callback: Optional[Callable[[], None]] = operation(session)
+                    if callback is not None:
+                        post_commit_callbacks.append(callback)
+                    if market_name is not None and market_name not in saved_states:
+                        with self._pending_market_states_lock:
+                            saved_state = self._pending_market_states.get(market_name)
+                        if saved_state is not None:
+                            saved_states[market_name] = saved_state
+                for market_name, saved_state in saved_states.items():
+                    self._save_market_states(self._config_file_path, market_name, saved_state, session)
+
+        with self._pending_market_states_lock:
+            for market_name, saved_state in saved_states.items():
+                if self._pending_market_states.get(market_name) is saved_state:
+                    del self._pending_market_states[market_name]
+        return post_commit_callbacks
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -192,31 +336,32 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._write(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -231,47 +376,48 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=Decimal(
+                evt.price) if evt.price == evt.price else Decimal(0),
+            amount=Decimal(evt.amount),
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+
+        def write(session: Session) -> Callable[[], None]:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            session.flush()
+            csv_row: Tuple[str, tuple, tuple] = self._trade_csv_row(trade_fill_record)
+            return lambda: self._append_csv_row(*csv_row)
+
+        self._write(write, market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -281,22 +427,22 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write(write)
 
     @staticmethod
     def _is_primitive_type(obj: object) -> bool:
@@ -312,6 +458,9 @@ class MarketsRecorder:
         return tuple(df.iloc[0].values) == header
 
     def append_to_csv(self, trade: TradeFill):
+        self._append_csv_row(*self._trade_csv_row(trade))
+
+    def _trade_csv_row(self, trade: TradeFill) -> Tuple[str, tuple, tuple]:
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -327,7 +476,9 @@ class MarketsRecorder:
             '%H:%M:%S') if "//" not in trade.order_id else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
+    def _append_csv_row(self, csv_path: str, field_names: tuple, field_data: tuple):
         if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
             move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
 
@@ -353,18 +504,18 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -399,25 +550,25 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
-                                                     config_file_path=self._config_file_path,
-                                                     strategy=self._strategy_name,
-                                                     tx_hash=evt.tx_hash,
-                                                     connector=connector.display_name,
-                                                     trading_pair=evt.trading_pair,
-                                                     fee_tier=str(evt.fee_tier),
-                                                     lower_price=float(evt.lower_price),
-                                                     upper_price=float(evt.upper_price),
-                                                     base_amount=float(evt.base_amount),
-                                                     quote_amount=float(evt.quote_amount),
-                                                     status=evt.status,
-                                                     creation_timestamp=timestamp,
-                                                     last_update_timestamp=timestamp)
-                session.add(r_pos)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
+                                             config_file_path=self._config_file_path,
+                                             strategy=self._strategy_name,
+                                             tx_hash=evt.tx_hash,
+                                             connector=connector.display_name,
+                                             trading_pair=evt.trading_pair,
+                                             fee_tier=str(evt.fee_tier),
+                                             lower_price=float(evt.lower_price),
+                                             upper_price=float(evt.upper_price),
+                                             base_amount=float(evt.base_amount),
+                                             quote_amount=float(evt.quote_amount),
+                                             status=evt.status,
+                                             creation_timestamp=timestamp,
+                                             last_update_timestamp=timestamp)
+
+        def write(session: Session):
+            session.add(r_pos)
+
+        self._write(write, connector)
 
     def _did_update_range_position(self,
                                    event_tag: int,
@@ -428,19 +579,19 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
-                    RangePosition.hb_id == evt.hb_id).one_or_none()
-                if rp_record is not None:
-                    rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
-                                                                         timestamp=timestamp,
-                                                                         tx_hash=evt.tx_hash,
-                                                                         token_id=evt.token_id,
-                                                                         base_amount=float(evt.base_amount),
-                                                                         quote_amount=float(evt.quote_amount),
-                                                                         status=evt.status,
-                                                                         )
-                    session.add(rp_update)
-                    self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.tx_hash,
+                                                             token_id=evt.token_id,
+                                                             base_amount=float(evt.base_amount),
+                                                             quote_amount=float(evt.quote_amount),
+                                                             status=evt.status,
+                                                             )
+
+        def write(session: Session):
+            rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
+                RangePosition.hb_id == evt.hb_id).one_or_none()
+            if rp_record is not None:
+                session.add(rp_update)
+
+        self._write(write, connector)
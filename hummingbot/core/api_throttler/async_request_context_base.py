@@ -5,12 +5,14 @@ import time
 from abc import ABC, abstractmethod
 from typing import (
     List,
+    Optional,
     Tuple,
 )
 
 from hummingbot.core.api_throttler.data_types import (
     RateLimit,
     TaskLog,
+    TaskLogWindow,
 )
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -22,6 +24,7 @@ class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
     It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
+    When there is no capacity left, it sleeps until enough of the logged tasks expire instead of polling.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -34,7 +37,7 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: TaskLogWindow,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
@@ -47,9 +50,9 @@ class AsyncRequestContextBase(ABC):
         :param rate_limit: The RateLimit associated with this API Request
         :param rate_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check, used when the task can never fit within the limits
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: TaskLogWindow = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
@@ -61,34 +64,42 @@ class AsyncRequestContextBase(ABC):
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: float = time.time()
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: float = now - task.timestamp
-            if elapsed > task_limit.time_interval + (task_limit.time_interval * self._safety_margin_pct):
-                self._task_logs.remove(task)
+        self._task_logs.flush(time.time())
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def time_until_capacity(self) -> float:
+        """
+        Returns the number of seconds until all related limits have capacity for this task
+        """
+        now: float = time.time()
+        wait_time: float = 0.0
+        for rate_limit, weight in self._related_limits:
+            limit_wait_time: Optional[float] = self._task_logs.time_until_capacity(rate_limit, weight, now)
+            if limit_wait_time is None:
+                return self._retry_interval
+            wait_time = max(wait_time, limit_wait_time)
+        return wait_time
+
     async def acquire(self):
         while True:
             async with self._lock:
                 self.flush()
 
                 if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-            for limit, weight in self._related_limits:
-                task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                self._task_logs.append(task)
+                    now = time.time()
+                    # Each related limit is represented as it own individual TaskLog
+                    self._task_logs.append(TaskLog(timestamp=now,
+                                                   rate_limit=self._rate_limit,
+                                                   weight=self._rate_limit.weight))
+                    for limit, weight in self._related_limits:
+                        task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
+                        self._task_logs.append(task)
+                    return
+                wait_time: float = self.time_until_capacity()
+            await asyncio.sleep(wait_time)
 
     async def __aenter__(self):
         await self.acquire()
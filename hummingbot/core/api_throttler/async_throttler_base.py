@@ -2,6 +2,7 @@ import asyncio
 import copy
 import logging
 import math
+import time
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
@@ -15,7 +16,8 @@ from typing import (
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.data_types import (
     RateLimit,
-    TaskLog
+    TaskLog,
+    TaskLogWindow,
 )
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -64,13 +66,13 @@ class AsyncThrottlerBase(ABC):
         # MB added
         # for key, item in self._id_to_limit_map.items():
         #     self.logger().error(f"key: {key} item: {item}")
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
-
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
+        # Window of TaskLog used to determine the API requests within a set time window.
+        self._task_logs: TaskLogWindow = TaskLogWindow(safety_margin_pct=safety_margin_pct)
+
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
@@ -86,6 +88,35 @@ class AsyncThrottlerBase(ABC):
 
         return rate_limit, related_limits
 
+    def update_used_capacity(self, limit_id: str, used_weight: int):
+        """
+        Reconciles the local accounting of a rate limit with the usage reported by the server (i.e. from response
+        headers). The server counts requests sent before a restart or by other clients sharing the same IP, so any
+        weight it reports above what has been logged locally is added to the window as a single task.
+        The reported usage is scaled by the share of the limits allocated to this throttler.
+        :param limit_id: the limit_id the reported usage applies to
+        :param used_weight: the weight used within the rate limit period, as reported by the server
+        """
+        rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id)
+        if rate_limit is None:
+            return
+        now: float = time.time()
+        scaled_used_weight: int = math.ceil(Decimal(str(used_weight)) * self.limits_pct)
+        untracked_weight: int = scaled_used_weight - self._task_logs.used_capacity(limit_id, now)
+        if untracked_weight > 0:
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=untracked_weight))
+
+    def block_limit(self, limit_id: str, duration: float):
+        """
+        Blocks new tasks against a rate limit for the given duration, i.e. after the server rejected a request
+        for exceeding its limits and asked to retry later.
+        :param limit_id: the limit_id to block
+        :param duration: number of seconds before new tasks can be run against the limit
+        """
+        if limit_id not in self._id_to_limit_map:
+            return
+        self._task_logs.block(limit_id, time.time() + duration)
+
     @abstractmethod
     def execute_task(self, limit_ids: List[str]) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,5 +1,9 @@
+from collections import deque
 from dataclasses import dataclass
 from typing import (
+    Deque,
+    Dict,
+    Iterator,
     List,
     Optional,
 )
@@ -54,3 +58,108 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class TaskLogWindow:
+    """
+    Sliding window of TaskLogs, kept as one deque per limit id with a running weight sum for each of them.
+    Logs of a given limit id share the same time interval, so they expire in the order they were appended and
+    flushing only ever needs to look at the front of each deque. Checking the capacity used by a limit is O(1)
+    (amortized over the expired logs), regardless of how many tasks are logged.
+    """
+
+    def __init__(self, safety_margin_pct: float = 0.05):
+        """
+        :param safety_margin_pct: Percentage of the time interval a task log is kept beyond its rate limit period
+        """
+        self._safety_margin_pct: float = safety_margin_pct
+        self._logs: Dict[str, Deque[TaskLog]] = {}
+        self._used_weights: Dict[str, int] = {}
+        self._blocked_until: Dict[str, float] = {}
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for logs in self._logs.values():
+            yield from logs
+
+    def append(self, task_log: TaskLog):
+        limit_id: str = task_log.rate_limit.limit_id
+        logs: Optional[Deque[TaskLog]] = self._logs.get(limit_id)
+        if logs is None:
+            logs = self._logs[limit_id] = deque()
+            self._used_weights[limit_id] = 0
+        logs.append(task_log)
+        self._used_weights[limit_id] += task_log.weight
+        self._size += 1
+
+    def extend(self, task_logs: List[TaskLog]):
+        for task_log in task_logs:
+            self.append(task_log)
+
+    def expiry(self, task_log: TaskLog) -> float:
+        """
+        Returns the time at which the task log stops counting towards its rate limit
+        """
+        time_interval: float = task_log.rate_limit.time_interval
+        return task_log.timestamp + time_interval + (time_interval * self._safety_margin_pct)
+
+    def flush(self, now: float):
+        """
+        Removes the task logs that have passed their rate limit periods, for all limit ids
+        """
+        for limit_id in self._logs:
+            self._flush_limit(limit_id, now)
+
+    def used_capacity(self, limit_id: str, now: float) -> int:
+        """
+        Returns the total weight logged against the limit id within its rate limit period
+        """
+        if limit_id not in self._logs:
+            return 0
+        self._flush_limit(limit_id, now)
+        return self._used_weights[limit_id]
+
+    def block(self, limit_id: str, until: float):
+        """
+        Blocks every new task against the limit id until the given time, regardless of the logged weight
+        """
+        self._blocked_until[limit_id] = max(until, self._blocked_until.get(limit_id, 0.0))
+
+    def time_until_unblocked(self, limit_id: str, now: float) -> float:
+        """
+        Returns the number of seconds left before the limit id is unblocked, 0 if it is not blocked
+        """
+        blocked_until: Optional[float] = self._blocked_until.get(limit_id)
+        if blocked_until is None:
+            return 0.0
+        if blocked_until <= now:
+            del self._blocked_until[limit_id]
+            return 0.0
+        return blocked_until - now
+
+    def time_until_capacity(self, rate_limit: RateLimit, weight: int, now: float) -> Optional[float]:
+        """
+        Returns the number of seconds until the rate limit is unblocked and enough logged weight has expired for a new
+        task of the given weight to fit within it, 0 if it already fits, or None if it can never fit.
+        """
+        if weight > rate_limit.limit:
+            return None
+        blocked_time: float = self.time_until_unblocked(rate_limit.limit_id, now)
+        excess: int = self.used_capacity(rate_limit.limit_id, now) + weight - rate_limit.limit
+        if excess <= 0:
+            return blocked_time
+        for task_log in self._logs[rate_limit.limit_id]:
+            excess -= task_log.weight
+            if excess <= 0:
+                return max(blocked_time, self.expiry(task_log) - now)
+        return None
+
+    def _flush_limit(self, limit_id: str, now: float):
+        logs: Deque[TaskLog] = self._logs[limit_id]
+        while len(logs) > 0 and self.expiry(logs[0]) < now:
+            task_log: TaskLog = logs.popleft()
+            self._used_weights[limit_id] -= task_log.weight
+            self._size -= 1
@@ -10,3 +10,6 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _metrics
+
+    cdef bint c_instrumented_tick(self, object metrics) except *
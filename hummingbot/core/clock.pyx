@@ -3,11 +3,15 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_metrics import ClockMetrics
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -21,12 +25,14 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 instrumented: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param instrumented: (real time mode only) whether to time the ticks of the child iterators, see ClockMetrics
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +42,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._metrics = ClockMetrics(tick_size) if instrumented else None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +64,10 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def metrics(self) -> Optional[ClockMetrics]:
+        return self._metrics
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +101,7 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            object metrics = self._metrics
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -112,6 +124,11 @@ cdef class Clock:
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
+                if metrics is not None:
+                    if not self.c_instrumented_tick(metrics):
+                        return
+                    continue
+
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
@@ -127,6 +144,40 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef bint c_instrumented_tick(self, object metrics) except *:
+        """
+        Runs through all the child iterators like run_til(), timing each of them.
+        Returns False if an iterator stopped the iteration. Errors recording the metrics are logged, never raised.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double loop_lag = time.time() - self._current_tick
+            double tick_start = time.perf_counter()
+            double iterator_start
+            bint failed
+
+        for ci in self._current_context:
+            child_iterator = ci
+            failed = False
+            iterator_start = time.perf_counter()
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                return False
+            except Exception:
+                failed = True
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            try:
+                metrics.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start, failed)
+            except Exception:
+                self.logger().error("Unexpected error recording clock metrics.", exc_info=True)
+        try:
+            metrics.record_tick(time.perf_counter() - tick_start, loop_lag)
+        except Exception:
+            self.logger().error("Unexpected error recording clock metrics.", exc_info=True)
+        return True
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
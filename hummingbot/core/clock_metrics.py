@@ -0,0 +1,170 @@
+import logging
+import time
+from bisect import bisect_left
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+# Upper bounds (in seconds) of the tick duration histogram buckets, the last one catching everything above
+TICK_DURATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf"))
+
+
+class TickDurationHistogram:
+    """
+    Counts of tick durations per TICK_DURATION_BUCKETS bucket, with their total and maximum
+    """
+
+    def __init__(self):
+        self.counts: List[int] = [0] * len(TICK_DURATION_BUCKETS)
+        self.total_count: int = 0
+        self.total_duration: float = 0
+        self.max_duration: float = 0
+
+    def add(self, duration: float):
+        self.counts[bisect_left(TICK_DURATION_BUCKETS, duration)] += 1
+        self.total_count += 1
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.total_count if self.total_count > 0 else 0
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the upper bound of the bucket the q quantile falls in, capped by the maximum duration
+        """
+        rank = q * self.total_count
+        cumulative_count = 0
+        for bound, count in zip(TICK_DURATION_BUCKETS, self.counts):
+            cumulative_count += count
+            if count > 0 and cumulative_count >= rank:
+                return min(bound, self.max_duration)
+        return self.max_duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.total_count,
+            "mean": self.mean_duration,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max_duration,
+            "buckets": {str(bound): count for bound, count in zip(TICK_DURATION_BUCKETS, self.counts)},
+        }
+
+
+class ClockMetrics:
+    """
+    Instrumentation of a realtime Clock: the duration of each child iterator's tick, the ticks which took longer than
+    the tick size and how late the event loop woke the clock up for each tick.
+    The metrics are logged at METRICS_LOG_LEVEL every log_interval seconds.
+    """
+
+    def __init__(self, tick_size: float, log_interval: float = 60.0):
+        self._tick_size = tick_size
+        self._log_interval = log_interval
+        self._iterator_histograms: Dict[str, TickDurationHistogram] = {}
+        self._iterator_errors: Dict[str, int] = {}
+        self._tick_histogram = TickDurationHistogram()
+        self._overrun_count = 0
+        self._last_loop_lag = 0.0
+        self._max_loop_lag = 0.0
+        self._total_loop_lag = 0.0
+        self._last_log_timestamp = time.time()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    @staticmethod
+    def iterator_name(iterator: Any) -> str:
+        name = getattr(iterator, "display_name", None)
+        return name if isinstance(name, str) else type(iterator).__name__
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    @property
+    def overrun_count(self) -> int:
+        return self._overrun_count
+
+    @property
+    def last_loop_lag(self) -> float:
+        return self._last_loop_lag
+
+    @property
+    def mean_loop_lag(self) -> float:
+        tick_count = self._tick_histogram.total_count
+        return self._total_loop_lag / tick_count if tick_count > 0 else 0
+
+    @property
+    def max_loop_lag(self) -> float:
+        return self._max_loop_lag
+
+    @property
+    def tick_histogram(self) -> TickDurationHistogram:
+        return self._tick_histogram
+
+    @property
+    def iterator_histograms(self) -> Dict[str, TickDurationHistogram]:
+        return self._iterator_histograms
+
+    def iterator_errors(self, name: str) -> int:
+        return self._iterator_errors.get(name, 0)
+
+    def record_iterator_tick(self, iterator: Any, duration: float, failed: bool = False):
+        name = self.iterator_name(iterator)
+        histogram = self._iterator_histograms.get(name)
+        if histogram is None:
+            histogram = self._iterator_histograms[name] = TickDurationHistogram()
+            self._iterator_errors[name] = 0
+        histogram.add(duration)
+        if failed:
+            self._iterator_errors[name] += 1
+
+    def record_tick(self, duration: float, loop_lag: float, now: Optional[float] = None):
+        """
+        :param duration: the time it took to tick all the child iterators
+        :param loop_lag: how long after the scheduled tick time the clock started ticking
+        :param now: the current timestamp, used to decide when to log the metrics
+        """
+        self._tick_histogram.add(duration)
+        if loop_lag + duration > self._tick_size:
+            self._overrun_count += 1
+        self._last_loop_lag = loop_lag
+        self._total_loop_lag += loop_lag
+        if loop_lag > self._max_loop_lag:
+            self._max_loop_lag = loop_lag
+        now = time.time() if now is None else now
+        if now - self._last_log_timestamp >= self._log_interval:
+            self._last_log_timestamp = now
+            self.log_metrics()
+
+    def log_metrics(self):
+        self.logger().metrics_log(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tick_size": self._tick_size,
+            "ticks": self._tick_histogram.to_dict(),
+            "overruns": self._overrun_count,
+            "loop_lag": {
+                "last": self._last_loop_lag,
+                "mean": self.mean_loop_lag,
+                "max": self._max_loop_lag,
+            },
+            "iterators": {name: dict(histogram.to_dict(), errors=self._iterator_errors[name])
+                          for name, histogram in self._iterator_histograms.items()},
+        }
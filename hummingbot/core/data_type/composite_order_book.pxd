@@ -6,3 +6,5 @@ cdef class CompositeOrderBook(OrderBook):
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_build_depth_index(self, bint is_buy)
+    cdef Py_ssize_t c_copy_depth(self, bint is_buy, double[:, ::1] buffer, Py_ssize_t n_levels)
@@ -32,6 +32,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book.c_invalidate_depth_index()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +77,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_depth_index()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -179,6 +182,40 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_build_depth_index(self, bint is_buy):
+        # The depth index has to reflect the composite entries, i.e. the original book minus the recorded fills.
+        cdef:
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            vector[double] *cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            double base_total = 0
+            double quote_total = 0
+
+        deref(prices).clear()
+        deref(cum_base).clear()
+        deref(cum_quote).clear()
+        for row in (self.ask_entries() if is_buy else self.bid_entries()):
+            base_total += row.amount
+            quote_total += row.amount * row.price
+            deref(prices).push_back(row.price)
+            deref(cum_base).push_back(base_total)
+            deref(cum_quote).push_back(quote_total)
+
+    cdef Py_ssize_t c_copy_depth(self, bint is_buy, double[:, ::1] buffer, Py_ssize_t n_levels):
+        cdef:
+            Py_ssize_t i = 0
+
+        if n_levels <= 0:
+            return 0
+        for row in (self.ask_entries() if is_buy else self.bid_entries()):
+            buffer[i, 0] = row.price
+            buffer[i, 1] = row.amount
+            buffer[i, 2] = row.update_id
+            i += 1
+            if i >= n_levels:
+                break
+        return i
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
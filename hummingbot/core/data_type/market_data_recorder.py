@@ -0,0 +1,410 @@
+import logging
+import mmap
+import os
+import sys
+from array import array
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+)
+from enum import IntEnum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.event.events import TradeType
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+# Market data files hold the recorded rows of one trading pair in chunks. Each chunk stores its rows column by column,
+# every column being a little-endian array of 8 byte values, in the order below. Order book snapshots and diffs take
+# one row per price level, trades one row each.
+COLUMNS = (
+    ("timestamp", "<f8"),
+    ("update_id", "<i8"),   # the trade id for trades
+    ("row_type", "<i8"),    # a RecordedRowType
+    ("price", "<f8"),
+    ("amount", "<f8"),
+)
+ROW_SIZE = 8 * len(COLUMNS)
+# The index file next to each market data file has an entry per chunk, appended once the chunk is written
+INDEX_MAGIC = b"HBMDIDX1"
+INDEX_DTYPE = np.dtype([
+    ("offset", "<i8"),
+    ("row_count", "<i8"),
+    ("first_timestamp", "<f8"),
+    ("last_timestamp", "<f8"),
+])
+DATA_FILE_EXTENSION = ".hbmd"
+INDEX_FILE_EXTENSION = ".idx"
+
+_ARRAY_TYPECODES = {"<f8": "d", "<i8": "q"}
+
+
+class RecordedRowType(IntEnum):
+    SNAPSHOT_BID = 0
+    SNAPSHOT_ASK = 1
+    DIFF_BID = 2
+    DIFF_ASK = 3
+    TRADE_BUY = 4
+    TRADE_SELL = 5
+
+
+def data_file_path(directory: str, trading_pair: str) -> str:
+    return os.path.join(directory, f"{trading_pair}{DATA_FILE_EXTENSION}")
+
+
+def _read_index(index_path: str) -> np.ndarray:
+    with open(index_path, "rb") as index_file:
+        content = index_file.read()
+    if content[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+        raise ValueError(f"{index_path} is not a market data index file.")
+    entries_size = (len(content) - len(INDEX_MAGIC)) // INDEX_DTYPE.itemsize * INDEX_DTYPE.itemsize
+    return np.frombuffer(content, dtype=INDEX_DTYPE, count=entries_size // INDEX_DTYPE.itemsize,
+                         offset=len(INDEX_MAGIC))
+
+
+class MarketDataFileWriter:
+    """
+    Appends rows to the market data file of a trading pair. The rows are buffered in memory and written as a chunk
+    once there are max_chunk_rows of them or they span max_chunk_duration seconds. A chunk's index entry is only
+    appended after the chunk is written, so on reopening a file anything past the last indexed chunk (left by a crash)
+    is truncated.
+    Timestamps are kept non-decreasing, a row older than the previous one takes its timestamp, so that the rows can be
+    searched by time.
+    With an executor, the chunks are written and the files closed by it (e.g. a single thread, off the event loop),
+    otherwise by the calling thread.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 path: str,
+                 max_chunk_rows: int = 8192,
+                 max_chunk_duration: float = 60.0,
+                 executor: Optional[Executor] = None):
+        self._path = path
+        self._executor = executor
+        self._max_chunk_rows = max_chunk_rows
+        self._max_chunk_duration = max_chunk_duration
+        index_path = path + INDEX_FILE_EXTENSION
+        data_end = 0
+        self._last_timestamp = float("-inf")
+        if os.path.exists(index_path):
+            index = _read_index(index_path)
+            if len(index) > 0:
+                data_end = int(index[-1]["offset"] + index[-1]["row_count"] * ROW_SIZE)
+                self._last_timestamp = float(index[-1]["last_timestamp"])
+            self._index_file = open(index_path, "r+b")
+            self._index_file.truncate(len(INDEX_MAGIC) + len(index) * INDEX_DTYPE.itemsize)
+            self._index_file.seek(0, os.SEEK_END)
+        else:
+            self._index_file = open(index_path, "wb")
+            self._index_file.write(INDEX_MAGIC)
+            self._index_file.flush()
+        self._data_file = open(path, "r+b" if os.path.exists(path) else "wb")
+        self._data_file.truncate(data_end)
+        self._data_file.seek(data_end)
+        self._columns: List[array] = []
+        self._reset_columns()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def pending_row_count(self) -> int:
+        return len(self._columns[0])
+
+    def _reset_columns(self):
+        self._columns = [array(_ARRAY_TYPECODES[dtype]) for _, dtype in COLUMNS]
+
+    def append(self, timestamp: float, update_id: int, row_type: RecordedRowType, price: float, amount: float):
+        timestamp = max(timestamp, self._last_timestamp)
+        self._last_timestamp = timestamp
+        timestamps, update_ids, row_types, prices, amounts = self._columns
+        timestamps.append(timestamp)
+        update_ids.append(update_id)
+        row_types.append(row_type)
+        prices.append(price)
+        amounts.append(amount)
+        if (len(timestamps) >= self._max_chunk_rows
+                or timestamp - timestamps[0] >= self._max_chunk_duration):
+            self.write_chunk()
+
+    def write_chunk(self):
+        if len(self._columns[0]) == 0:
+            return
+        columns = self._columns
+        self._reset_columns()
+        self._run(self._write_columns, columns)
+
+    def close(self):
+        self.write_chunk()
+        self._run(self._close_files)
+
+    def _run(self, function: Callable[..., Any], *args):
+        if self._executor is None:
+            function(*args)
+        else:
+            self._executor.submit(function, *args).add_done_callback(self._log_error)
+
+    def _log_error(self, future: Future):
+        if future.exception() is not None:
+            self.logger().error(f"Unexpected error writing the market data file {self._path}.",
+                                exc_info=future.exception())
+
+    def _write_columns(self, columns: List[array]):
+        row_count = len(columns[0])
+        first_timestamp, last_timestamp = columns[0][0], columns[0][-1]
+        offset = self._data_file.tell()
+        for column in columns:
+            if sys.byteorder != "little":
+                column.byteswap()
+            column.tofile(self._data_file)
+        self._data_file.flush()
+        entry = np.array([(offset, row_count, first_timestamp, last_timestamp)], dtype=INDEX_DTYPE)
+        self._index_file.write(entry.tobytes())
+        self._index_file.flush()
+
+    def _close_files(self):
+        self._data_file.close()
+        self._index_file.close()
+
+
+class MarketDataRecorder:
+    """
+    Records the order book snapshots, diffs and trades of the trading pairs to one market data file per trading pair
+    in a directory. Recording a message only appends its rows to in-memory arrays, the files are written a chunk at a
+    time by a background thread, so that recording never blocks the event loop on disk writes.
+    """
+
+    def __init__(self, directory: str, max_chunk_rows: int = 8192, max_chunk_duration: float = 60.0):
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_chunk_rows = max_chunk_rows
+        self._max_chunk_duration = max_chunk_duration
+        self._writers: Dict[str, MarketDataFileWriter] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _writer(self, trading_pair: str) -> MarketDataFileWriter:
+        writer = self._writers.get(trading_pair)
+        if writer is None:
+            if self._executor is None:
+                # A single thread, so that the chunks of each file are written in order
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="market_data_recorder")
+            writer = MarketDataFileWriter(data_file_path(self._directory, trading_pair),
+                                          self._max_chunk_rows,
+                                          self._max_chunk_duration,
+                                          self._executor)
+            self._writers[trading_pair] = writer
+        return writer
+
+    def record_message(self, message: OrderBookMessage):
+        writer = self._writer(message.trading_pair)
+        timestamp = message.timestamp
+        if message.type is OrderBookMessageType.TRADE:
+            try:
+                trade_id = int(message.trade_id)
+            except (TypeError, ValueError):
+                trade_id = -1
+            row_type = (RecordedRowType.TRADE_SELL
+                        if message.content["trade_type"] == float(TradeType.SELL.value)
+                        else RecordedRowType.TRADE_BUY)
+            writer.append(timestamp, trade_id, row_type,
+                          float(message.content["price"]), float(message.content["amount"]))
+            return
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            bid_type, ask_type = RecordedRowType.SNAPSHOT_BID, RecordedRowType.SNAPSHOT_ASK
+        else:
+            bid_type, ask_type = RecordedRowType.DIFF_BID, RecordedRowType.DIFF_ASK
+        raw_entries = message.has_raw_entries
+        update_id = message.update_id
+        for row_type, rows in ((bid_type, message.content["bids"] if raw_entries else message.bids),
+                               (ask_type, message.content["asks"] if raw_entries else message.asks)):
+            for row in rows:
+                writer.append(timestamp, update_id, row_type, float(row[0]), float(row[1]))
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        """
+        Records the current state of an order book as a snapshot
+        """
+        writer = self._writer(trading_pair)
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        for row_type, rows in ((RecordedRowType.SNAPSHOT_BID, order_book.bid_entries()),
+                               (RecordedRowType.SNAPSHOT_ASK, order_book.ask_entries())):
+            for row in rows:
+                writer.append(timestamp, update_id, row_type, row.price, row.amount)
+
+    def flush(self):
+        """
+        Writes the rows recorded so far, and waits until they are written
+        """
+        for writer in self._writers.values():
+            writer.write_chunk()
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result()
+
+    def close(self):
+        """
+        Writes the rows recorded so far and closes the files, waiting until they are closed. Recording again reopens
+        them.
+        """
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class MarketDataReader:
+    """
+    Reads a market data file through a memory map. The columns are exposed as NumPy arrays viewing the mapped file,
+    nothing is parsed or copied, so the arrays must be released before closing the reader.
+    """
+
+    def __init__(self, path: str, trading_pair: Optional[str] = None):
+        self._path = path
+        self._trading_pair = (trading_pair if trading_pair is not None
+                              else os.path.basename(path)[:-len(DATA_FILE_EXTENSION)])
+        self._index = _read_index(path + INDEX_FILE_EXTENSION)
+        self._mmap: Optional[mmap.mmap] = None
+        if len(self._index) > 0:
+            with open(path, "rb") as data_file:
+                self._mmap = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def index(self) -> np.ndarray:
+        return self._index
+
+    @property
+    def row_count(self) -> int:
+        return int(self._index["row_count"].sum())
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def chunk(self, chunk_number: int) -> Dict[str, np.ndarray]:
+        entry = self._index[chunk_number]
+        offset = int(entry["offset"])
+        row_count = int(entry["row_count"])
+        columns = {}
+        for name, dtype in COLUMNS:
+            columns[name] = np.frombuffer(self._mmap, dtype=dtype, count=row_count, offset=offset)
+            offset += row_count * 8
+        return columns
+
+    def iter_chunks(self,
+                    start_timestamp: float = float("-inf"),
+                    end_timestamp: float = float("inf")) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Yields the columns of the rows with start_timestamp <= timestamp < end_timestamp, one chunk at a time, as
+        slices of the memory mapped columns.
+        """
+        first_chunk = int(np.searchsorted(self._index["last_timestamp"], start_timestamp, side="left"))
+        last_chunk = int(np.searchsorted(self._index["first_timestamp"], end_timestamp, side="left"))
+        for chunk_number in range(first_chunk, last_chunk):
+            columns = self.chunk(chunk_number)
+            timestamps = columns["timestamp"]
+            start = int(np.searchsorted(timestamps, start_timestamp, side="left"))
+            end = int(np.searchsorted(timestamps, end_timestamp, side="left"))
+            if start < end:
+                yield {name: column[start:end] for name, column in columns.items()}
+
+    def read(self,
+             start_timestamp: float = float("-inf"),
+             end_timestamp: float = float("inf")) -> Dict[str, np.ndarray]:
+        """
+        Returns the columns of the rows with start_timestamp <= timestamp < end_timestamp, concatenated across chunks
+        """
+        chunks = list(self.iter_chunks(start_timestamp, end_timestamp))
+        if len(chunks) == 1:
+            return chunks[0]
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) if len(chunks) > 0 else np.empty(0, dtype)
+                for name, dtype in COLUMNS}
+
+    def iter_messages(self,
+                      start_timestamp: float = float("-inf"),
+                      end_timestamp: float = float("inf")) -> Iterator[OrderBookMessage]:
+        """
+        Rebuilds the recorded order book messages, e.g. to replay them with ReplayOrderBookTracker. Consecutive
+        snapshot or diff rows with the same update id and timestamp make up one message.
+        """
+        message_type: Optional[OrderBookMessageType] = None
+        bids: List[List[float]] = []
+        asks: List[List[float]] = []
+        update_id = timestamp = None
+        for columns in self.iter_chunks(start_timestamp, end_timestamp):
+            for row_timestamp, row_update_id, row_type, price, amount in zip(*(columns[name].tolist()
+                                                                               for name, _ in COLUMNS)):
+                if row_type >= RecordedRowType.TRADE_BUY:
+                    row_message_type = OrderBookMessageType.TRADE
+                elif row_type >= RecordedRowType.DIFF_BID:
+                    row_message_type = OrderBookMessageType.DIFF
+                else:
+                    row_message_type = OrderBookMessageType.SNAPSHOT
+                if message_type is not None and (row_message_type is not message_type
+                                                 or row_update_id != update_id
+                                                 or row_timestamp != timestamp):
+                    yield self._book_message(message_type, update_id, timestamp, bids, asks)
+                    message_type = None
+                    bids, asks = [], []
+                if row_message_type is OrderBookMessageType.TRADE:
+                    yield OrderBookMessage(OrderBookMessageType.TRADE, {
+                        "trading_pair": self._trading_pair,
+                        "trade_type": float(TradeType.SELL.value if row_type == RecordedRowType.TRADE_SELL
+                                            else TradeType.BUY.value),
+                        "trade_id": row_update_id,
+                        "update_id": row_update_id,
+                        "price": price,
+                        "amount": amount,
+                    }, row_timestamp)
+                    continue
+                message_type, update_id, timestamp = row_message_type, row_update_id, row_timestamp
+                (bids if row_type in (RecordedRowType.SNAPSHOT_BID, RecordedRowType.DIFF_BID) else asks).append(
+                    [price, amount])
+        if message_type is not None:
+            yield self._book_message(message_type, update_id, timestamp, bids, asks)
+
+    def _book_message(self,
+                      message_type: OrderBookMessageType,
+                      update_id: int,
+                      timestamp: float,
+                      bids: List[List[float]],
+                      asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(message_type, {
+            "trading_pair": self._trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp)
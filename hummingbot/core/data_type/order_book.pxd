@@ -20,10 +20,22 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef vector[double] _bid_index_prices
+    cdef vector[double] _bid_index_cum_base
+    cdef vector[double] _bid_index_cum_quote
+    cdef vector[double] _ask_index_prices
+    cdef vector[double] _ask_index_cum_base
+    cdef vector[double] _ask_index_cum_quote
+    cdef bint _bid_index_valid
+    cdef bint _ask_index_valid
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_invalidate_depth_index(self)
+    cdef c_build_depth_index(self, bint is_buy)
+    cdef c_ensure_depth_index(self, bint is_buy)
+    cdef Py_ssize_t c_copy_depth(self, bint is_buy, double[:, ::1] buffer, Py_ssize_t n_levels)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
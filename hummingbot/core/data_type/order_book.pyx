@@ -4,17 +4,21 @@ import bisect
 import logging
 import time
 from typing import (
+    Any,
     Dict,
     Iterator,
     List,
     Optional,
     Tuple,
+    Union,
 )
 
 import numpy as np
 import pandas as pd
 from aiokafka import ConsumerRecord
 
+from cpython.conversion cimport PyOS_string_to_double
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
 from cython.operator cimport(
     address as ref,
     dereference as deref,
@@ -37,6 +41,62 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline double c_parse_raw_value(object value) except? -1:
+    # Exchanges send prices and amounts as decimal strings. Parse them from the string's UTF-8 buffer, without the
+    # intermediate Python float that float(value) would create.
+    if type(value) is str:
+        return PyOS_string_to_double(PyUnicode_AsUTF8AndSize(value, NULL), NULL, NULL)
+    return float(value)
+
+
+cdef c_read_raw_entries(object rows, int64_t update_id, vector[OrderBookEntry] &entries):
+    cdef:
+        double[:, :] packed_rows
+        Py_ssize_t i
+
+    if isinstance(rows, np.ndarray):
+        packed_rows = rows
+        entries.reserve(packed_rows.shape[0])
+        for i in range(packed_rows.shape[0]):
+            entries.push_back(OrderBookEntry(packed_rows[i, 0], packed_rows[i, 1], update_id))
+    else:
+        entries.reserve(len(rows))
+        for row in rows:
+            entries.push_back(OrderBookEntry(c_parse_raw_value(row[0]), c_parse_raw_value(row[1]), update_id))
+
+
+cdef inline size_t c_first_index_at_least(const vector[double] &values, double target) nogil:
+    # Binary search over a non-decreasing array. Returns values.size() if no element is >= target (or target is NaN).
+    cdef:
+        size_t lo = 0
+        size_t hi = values.size()
+        size_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if values[mid] >= target:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+cdef inline size_t c_count_prices_within(const vector[double] &prices, double limit, bint ascending) nogil:
+    # Number of leading price levels that do not go past limit. A NaN limit matches every level.
+    cdef:
+        size_t lo = 0
+        size_t hi = prices.size()
+        size_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if ascending and prices[mid] > limit:
+            hi = mid
+        elif not ascending and prices[mid] < limit:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -56,6 +116,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._bid_index_valid = False
+        self._ask_index_valid = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -96,6 +158,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -136,12 +199,66 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_invalidate_depth_index(self):
+        self._bid_index_valid = False
+        self._ask_index_valid = False
+
+    cdef c_build_depth_index(self, bint is_buy):
+        """
+        Rebuilds the cumulative depth index of one side of the book, in the order the side is consumed (asks from
+        the lowest price up, bids from the highest price down). Each level stores its price and the cumulative base
+        and quote amounts up to and including that level, so volume queries become a binary search.
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            vector[double] *cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            double base_total = 0
+            double quote_total = 0
+
+        # clear() keeps the capacity, so the index does not allocate once the book has reached its usual depth.
+        deref(prices).clear()
+        deref(cum_base).clear()
+        deref(cum_quote).clear()
+        if is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                base_total += entry.getAmount()
+                quote_total += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cum_base).push_back(base_total)
+                deref(cum_quote).push_back(quote_total)
+                inc(ask_it)
+        else:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                base_total += entry.getAmount()
+                quote_total += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cum_base).push_back(base_total)
+                deref(cum_quote).push_back(quote_total)
+                inc(bid_it)
+
+    cdef c_ensure_depth_index(self, bint is_buy):
+        if is_buy and not self._ask_index_valid:
+            self.c_build_depth_index(True)
+            self._ask_index_valid = True
+        elif not is_buy and not self._bid_index_valid:
+            self.c_build_depth_index(False)
+            self._bid_index_valid = True
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -172,12 +289,73 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.depth_arrays()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields)
         return bids_df, asks_df
 
+    def depth_arrays(self,
+                     n_levels: Optional[int] = None,
+                     bids_buffer: Optional[np.ndarray] = None,
+                     asks_buffer: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the top n_levels of each side of the book into float64 arrays with 3 columns,
+        [price, amount, update_id], bids from the best (highest) price down and asks from the best (lowest) price up.
+
+        Pass C-contiguous (rows, 3) float64 buffers to reuse them between calls. Nothing is allocated then, and the
+        returned arrays are views of the filled rows of the buffers. A buffer with fewer rows than n_levels limits
+        the number of levels copied.
+
+        :param n_levels: the number of levels to copy per side, or None for the whole book
+        :param bids_buffer: optional preallocated array for the bids
+        :param asks_buffer: optional preallocated array for the asks
+        :return: a tuple of the (bids, asks) arrays
+        """
+        cdef:
+            Py_ssize_t bid_levels = self._bid_book.size()
+            Py_ssize_t ask_levels = self._ask_book.size()
+            Py_ssize_t bids_copied
+            Py_ssize_t asks_copied
+
+        if n_levels is not None:
+            bid_levels = min(bid_levels, n_levels)
+            ask_levels = min(ask_levels, n_levels)
+        if bids_buffer is None:
+            bids_buffer = np.empty((bid_levels, 3), dtype=np.float64)
+        if asks_buffer is None:
+            asks_buffer = np.empty((ask_levels, 3), dtype=np.float64)
+        if bids_buffer.ndim != 2 or bids_buffer.shape[1] != 3 or asks_buffer.ndim != 2 or asks_buffer.shape[1] != 3:
+            raise ValueError("Depth buffers must have the shape (rows, 3).")
+
+        bids_copied = self.c_copy_depth(False, bids_buffer, min(bid_levels, bids_buffer.shape[0]))
+        asks_copied = self.c_copy_depth(True, asks_buffer, min(ask_levels, asks_buffer.shape[0]))
+        return bids_buffer[:bids_copied], asks_buffer[:asks_copied]
+
+    cdef Py_ssize_t c_copy_depth(self, bint is_buy, double[:, ::1] buffer, Py_ssize_t n_levels):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            Py_ssize_t i = 0
+
+        if is_buy:
+            while i < n_levels and ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                buffer[i, 0] = entry.getPrice()
+                buffer[i, 1] = entry.getAmount()
+                buffer[i, 2] = entry.getUpdateId()
+                inc(ask_it)
+                i += 1
+        else:
+            while i < n_levels and bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                buffer[i, 0] = entry.getPrice()
+                buffer[i, 1] = entry.getAmount()
+                buffer[i, 2] = entry.getUpdateId()
+                inc(bid_it)
+                i += 1
+        return i
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -198,6 +376,36 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: Union[List[List[Any]], np.ndarray], asks: Union[List[List[Any]], np.ndarray],
+                        update_id: int):
+        """
+        Applies diffs given in the exchange's own format, without building OrderBookRow objects first.
+
+        :param bids: the bid levels, either a list of [price, amount, ...] rows where price and amount are decimal
+        strings or numbers (extra columns are ignored), or a 2 dimensional float64 array with price and amount in the
+        first two columns
+        :param asks: the ask levels, in the same format as the bids
+        :param update_id: the update id of the diff, used for all its entries
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_read_raw_entries(bids, update_id, cpp_bids)
+        c_read_raw_entries(asks, update_id, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: Union[List[List[Any]], np.ndarray], asks: Union[List[List[Any]], np.ndarray],
+                           update_id: int):
+        """
+        Applies a snapshot given in the exchange's own format. See apply_raw_diffs for the accepted formats.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_read_raw_entries(bids, update_id, cpp_bids)
+        c_read_raw_entries(asks, update_id, cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -321,142 +529,137 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t index
+            size_t num_levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+        num_levels = deref(cum_base).size()
+
+        index = c_first_index_at_least(deref(cum_base), volume)
+        if index < num_levels and deref(cum_base)[index] >= volume:
+            cumulative_volume = deref(cum_base)[index]
+            result_price = deref(prices)[index]
+        elif num_levels > 0:
+            cumulative_volume = deref(cum_base)[num_levels - 1]
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
+            size_t num_levels
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+        num_levels = deref(cum_base).size()
+
+        index = c_first_index_at_least(deref(cum_base), volume)
+        if index < num_levels and deref(cum_base)[index] >= volume:
+            # Take the full levels before the crossing level, and only the remainder from the crossing level itself.
+            if index > 0:
+                total_cost = deref(cum_quote)[index - 1]
+                total_volume = deref(cum_base)[index - 1]
+            total_cost += (volume - total_volume) * deref(prices)[index]
+            total_volume = volume
+            result_vwap = total_cost / total_volume
+        elif num_levels > 0:
+            total_volume = deref(cum_base)[num_levels - 1]
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t index
+            size_t num_levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+        num_levels = deref(cum_quote).size()
+
+        index = c_first_index_at_least(deref(cum_quote), quote_volume)
+        if index < num_levels and deref(cum_quote)[index] >= quote_volume:
+            cumulative_volume = deref(cum_quote)[index]
+            result_price = deref(prices)[index]
+        elif num_levels > 0:
+            cumulative_volume = deref(cum_quote)[num_levels - 1]
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
+            size_t num_levels
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+        num_levels = deref(cum_base).size()
+
+        index = c_first_index_at_least(deref(cum_base), base_amount)
+        if index < num_levels and deref(cum_base)[index] >= base_amount:
+            if index > 0:
+                cumulative_volume = deref(cum_quote)[index - 1]
+                cumulative_base_amount = deref(cum_base)[index - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[index]
+        elif num_levels > 0:
+            cumulative_volume = deref(cum_quote)[num_levels - 1]
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t num_levels
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        num_levels = c_count_prices_within(deref(prices), price, is_buy)
+        if num_levels == 0:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, deref(prices)[num_levels - 1], deref(cum_base)[num_levels - 1])
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t num_levels
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        num_levels = c_count_prices_within(deref(prices), price, is_buy)
+        if num_levels == 0:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, deref(prices)[num_levels - 1], deref(cum_quote)[num_levels - 1])
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -487,6 +690,12 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        if snapshot.has_raw_entries:
+            self.apply_raw_snapshot(snapshot.content["bids"], snapshot.content["asks"], snapshot.update_id)
+        else:
+            self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            if diff.has_raw_entries:
+                self.apply_raw_diffs(diff.content["bids"], diff.content["asks"], diff.update_id)
+            else:
+                self.apply_diffs(diff.bids, diff.asks, diff.update_id)
@@ -70,6 +70,16 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_raw_entries(self) -> bool:
+        """
+        True if content["bids"] and content["asks"] hold the exchange's [price, amount, ...] rows that the bids and
+        asks properties parse, so they can be given directly to OrderBook.apply_raw_diffs. Subclasses that override
+        bids or asks store their entries in a different format.
+        """
+        cls = type(self)
+        return cls.bids is OrderBookMessage.bids and cls.asks is OrderBookMessage.asks
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
 import logging
 import pandas as pd
@@ -10,13 +11,16 @@ from typing import (
     Dict,
     Deque,
     Optional,
+    Set,
     Tuple,
     List)
 import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -32,8 +36,33 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookTrackingMetrics:
+    """
+    Statistics of the message processing of one trading pair's order book.
+    Lags are measured from the message timestamp to the moment the diff is applied, in seconds.
+    """
+    queue_size: int = 0
+    max_queue_size: int = 0
+    queue_full_count: int = 0
+    diffs_applied: int = 0
+    diffs_coalesced: int = 0
+    last_diff_lag: float = 0.0
+    max_diff_lag: float = 0.0
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # When enabled, all the diffs waiting in a trading pair's queue are merged into one net update per price level
+    # and applied at once. Connectors opt in by overriding it.
+    COALESCE_DIFFS: bool = False
+    # Maximum number of messages waiting in a trading pair's queue. Once reached the messages routed to the trading
+    # pair are held back and merged until the book catches up, the routers never wait. 0 means unbounded.
+    MESSAGE_QUEUE_HIGH_WATER_MARK: int = 0
+    # Diffs received for a trading pair while its order book is being initialized are kept and applied on top of the
+    # snapshot.
+    PRE_INIT_DIFFS_SIZE: int = 1000
+    ORDER_BOOK_INIT_RETRY_INTERVAL: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -42,14 +71,30 @@ class OrderBookTracker(ABC):
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: Optional[bool] = None,
+                 message_queue_high_water_mark: Optional[int] = None,
+                 market_data_recorder: Optional[MarketDataRecorder] = None):
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = self.COALESCE_DIFFS if coalesce_diffs is None else coalesce_diffs
+        self._message_queue_high_water_mark: int = (self.MESSAGE_QUEUE_HIGH_WATER_MARK
+                                                    if message_queue_high_water_mark is None
+                                                    else message_queue_high_water_mark)
+        self._tracking_metrics: Dict[str, OrderBookTrackingMetrics] = {}
+        self._market_data_recorder: Optional[MarketDataRecorder] = market_data_recorder
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._ready_trading_pairs: Set[str] = set()
+        self._pre_init_diffs: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.PRE_INIT_DIFFS_SIZE))
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
+        self._overflow_messages: Dict[str, List[OrderBookMessage]] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
@@ -84,6 +129,29 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def tracking_metrics(self) -> Dict[str, OrderBookTrackingMetrics]:
+        """
+        Returns the message processing statistics per trading pair, with the current queue sizes.
+        """
+        for trading_pair, message_queue in self._tracking_message_queues.items():
+            self._metrics_for(trading_pair).queue_size = message_queue.qsize()
+        return self._tracking_metrics
+
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    @market_data_recorder.setter
+    def market_data_recorder(self, recorder: Optional[MarketDataRecorder]):
+        """
+        Records the snapshots, diffs and trades applied to the order books from now on, starting with the current
+        state of the order books already tracked.
+        """
+        self._market_data_recorder = recorder
+        for trading_pair in self._tracking_tasks:
+            self._record_order_book(trading_pair, self._order_books[trading_pair])
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -142,6 +210,11 @@ class OrderBookTracker(ABC):
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        self._ready_trading_pairs.clear()
+        self._pre_init_diffs.clear()
+        self._overflow_messages.clear()
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.close()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -175,19 +248,188 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. If the data source's snapshot requests share a throttler they are all requested at once
+        and the throttler sets the pace, otherwise they are requested one by one, a second apart.
+        Each order book is tracked as soon as its snapshot arrives.
         """
-        # self.logger().info(f"orderbooktracker init_order_books, trading_pairs {len(self._trading_pairs)}")
-        # raise IOError(f"orderbooktracker init_order_books, trading_pairs {len(self._trading_pairs)}")
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        if self._data_source.CONCURRENT_SNAPSHOT_REQUESTS:
+            await safe_gather(*[self._init_order_book(trading_pair) for trading_pair in self._trading_pairs])
+        else:
+            for trading_pair in self._trading_pairs:
+                await self._init_order_book(trading_pair)
+                await self._sleep(1.0)
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        while True:
+            try:
+                order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing the order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not fetch the order book snapshot for {trading_pair}. "
+                                    f"Retrying after {self.ORDER_BOOK_INIT_RETRY_INTERVAL} seconds."
+                )
+                await self._sleep(self.ORDER_BOOK_INIT_RETRY_INTERVAL)
+
+        pre_init_diffs: List[OrderBookMessage] = [
+            message for message in self._pre_init_diffs.pop(trading_pair, [])
+            if message.update_id > order_book.snapshot_uid
+        ]
+        if len(pre_init_diffs) > 0:
+            self._apply_diff_messages(trading_pair, order_book, pre_init_diffs)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = self._create_tracking_message_queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._ready_trading_pairs.add(trading_pair)
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._ready_trading_pairs)}/{len(self._trading_pairs)} completed.")
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
+
+    def _create_tracking_message_queue(self) -> asyncio.Queue:
+        return asyncio.Queue(maxsize=self._message_queue_high_water_mark)
+
+    def _metrics_for(self, trading_pair: str) -> OrderBookTrackingMetrics:
+        metrics = self._tracking_metrics.get(trading_pair)
+        if metrics is None:
+            metrics = OrderBookTrackingMetrics()
+            self._tracking_metrics[trading_pair] = metrics
+        return metrics
+
+    def _put_tracking_message(self, trading_pair: str, message_queue: asyncio.Queue, message: OrderBookMessage):
+        """
+        Queues a message for a trading pair's order book. It never waits, so that one order book falling behind
+        cannot hold up the routers for all the others: while the queue is at its high-water mark the messages are
+        held back instead, consecutive diffs merged into one and a snapshot superseding the older ones, and they are
+        queued as soon as there is room.
+        """
+        metrics = self._metrics_for(trading_pair)
+        self._queue_overflow_messages(trading_pair, message_queue)
+        if trading_pair not in self._overflow_messages and not message_queue.full():
+            message_queue.put_nowait(message)
+            metrics.max_queue_size = max(metrics.max_queue_size, message_queue.qsize())
+            return
+
+        metrics.queue_full_count += 1
+        overflow: List[OrderBookMessage] = self._overflow_messages.setdefault(trading_pair, [])
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            overflow[:] = [message] + [held_message for held_message in overflow
+                                       if held_message.type is OrderBookMessageType.DIFF
+                                       and held_message.update_id > message.update_id]
+        elif len(overflow) > 0 and overflow[-1].type is OrderBookMessageType.DIFF:
+            overflow[-1] = self._merge_diff_messages([overflow[-1], message])
+            metrics.diffs_coalesced += 1
+        else:
+            overflow.append(message)
+
+    def _queue_overflow_messages(self, trading_pair: str, message_queue: asyncio.Queue):
+        """
+        Moves the messages held back while a trading pair's queue was full to the queue, as far as there is room.
+        """
+        overflow: Optional[List[OrderBookMessage]] = self._overflow_messages.get(trading_pair)
+        if overflow is None:
+            return
+        while len(overflow) > 0 and not message_queue.full():
+            message_queue.put_nowait(overflow.pop(0))
+        if len(overflow) == 0:
+            del self._overflow_messages[trading_pair]
+
+    def _record_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Records the current state of an order book as a snapshot, if market data is recorded. The trackers overriding
+        _track_single_book() call it when they start tracking the order book.
+        """
+        if self._market_data_recorder is not None:
+            try:
+                self._market_data_recorder.record_order_book(trading_pair, order_book, time.time())
+            except Exception:
+                self.logger().error(f"Unexpected error recording the {trading_pair} order book.", exc_info=True)
+
+    def _record_tracked_message(self, message: OrderBookMessage):
+        """
+        Records a snapshot, diff or trade message, if market data is recorded. The trackers overriding
+        _track_single_book() call it for each message they take to apply to the order book.
+        """
+        if self._market_data_recorder is not None:
+            try:
+                self._market_data_recorder.record_message(message)
+            except Exception:
+                self.logger().error(f"Unexpected error recording a {message.trading_pair} order book message.",
+                                    exc_info=True)
+
+    def _pending_tracking_messages(self, message: OrderBookMessage, message_queue: asyncio.Queue) -> List[OrderBookMessage]:
+        """
+        Returns the message just received, followed by every message already waiting in the queue if diffs are
+        coalesced.
+        """
+        messages: List[OrderBookMessage] = [message]
+        if self._coalesce_diffs:
+            while not message_queue.empty():
+                messages.append(message_queue.get_nowait())
+        return messages
+
+    def _apply_diff_messages(self, trading_pair: str, order_book: OrderBook, diffs: List[OrderBookMessage]):
+        """
+        Applies diff messages to an order book. Several diffs are merged into one net update per price level first,
+        keeping the amount and the update id of the latest diff that touched each level.
+        """
+        if len(diffs) == 1:
+            message = diffs[0]
+            if message.has_raw_entries:
+                order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+            else:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        else:
+            bids, asks = self._merged_diff_levels(diffs)
+            order_book.apply_diffs(list(bids.values()), list(asks.values()), diffs[-1].update_id)
+
+        metrics = self._metrics_for(trading_pair)
+        metrics.diffs_applied += len(diffs)
+        metrics.diffs_coalesced += len(diffs) - 1
+        if diffs[-1].timestamp is not None:
+            metrics.last_diff_lag = max(0.0, time.time() - diffs[-1].timestamp)
+            metrics.max_diff_lag = max(metrics.max_diff_lag, metrics.last_diff_lag)
+
+    @staticmethod
+    def _merged_diff_levels(
+            diffs: List[OrderBookMessage]) -> Tuple[Dict[float, OrderBookRow], Dict[float, OrderBookRow]]:
+        """
+        Returns the net bid and ask updates of several diffs, one row per price level with the amount and the update
+        id of the latest diff that touched it.
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        for message in diffs:
+            raw_entries: bool = message.has_raw_entries
+            for levels, rows in ((bids, message.content["bids"] if raw_entries else message.bids),
+                                 (asks, message.content["asks"] if raw_entries else message.asks)):
+                for row in rows:
+                    price: float = float(row[0])
+                    levels[price] = OrderBookRow(price, float(row[1]), message.update_id)
+        return bids, asks
+
+    def _merge_diff_messages(self, diffs: List[OrderBookMessage]) -> OrderBookMessage:
+        """
+        Merges consecutive diffs into one diff message with their net update per price level.
+        """
+        bids, asks = self._merged_diff_levels(diffs)
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": diffs[-1].trading_pair,
+            "first_update_id": diffs[0].first_update_id,
+            "update_id": diffs[-1].update_id,
+            "bids": [[row.price, row.amount] for row in bids.values()],
+            "asks": [[row.price, row.amount] for row in asks.values()],
+        }, timestamp=diffs[-1].timestamp)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -195,14 +437,17 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # The order book is still being initialized
+                        self._pre_init_diffs[trading_pair].append(ob_message)
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -211,7 +456,7 @@ class OrderBookTracker(ABC):
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
                     continue
-                await message_queue.put(ob_message)
+                self._put_tracking_message(trading_pair, message_queue, ob_message)
                 messages_accepted += 1
 
                 # Log some statistics.
@@ -232,7 +477,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -240,7 +484,7 @@ class OrderBookTracker(ABC):
                 if trading_pair not in self._tracking_message_queues:
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                await message_queue.put(ob_message)
+                self._put_tracking_message(trading_pair, message_queue, ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -255,25 +499,39 @@ class OrderBookTracker(ABC):
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        self._record_order_book(trading_pair, order_book)
 
         while True:
             try:
                 message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                self._queue_overflow_messages(trading_pair, message_queue)
+                diffs: List[OrderBookMessage] = []
+                for message in self._pending_tracking_messages(message, message_queue):
+                    self._record_tracked_message(message)
+                    if message.type is OrderBookMessageType.DIFF:
+                        diffs.append(message)
+                        past_diffs_window.append(message)
+                        diff_messages_accepted += 1
+                    elif message.type is OrderBookMessageType.SNAPSHOT:
+                        if len(diffs) > 0:
+                            self._apply_diff_messages(trading_pair, order_book, diffs)
+                            diffs = []
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                        self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+
+                if len(diffs) > 0:
+                    self._apply_diff_messages(trading_pair, order_book, diffs)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        metrics: OrderBookTrackingMetrics = self._metrics_for(trading_pair)
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}. "
+                                            f"Queue size: {message_queue.qsize()}, "
+                                            f"last diff lag: {metrics.last_diff_lag:.3f}s.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -284,7 +542,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -303,6 +560,7 @@ class OrderBookTracker(ABC):
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                self._record_tracked_message(trade_message)
 
                 messages_accepted += 1
 
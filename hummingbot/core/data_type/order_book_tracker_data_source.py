@@ -14,6 +14,9 @@ from hummingbot.core.data_type.order_book import OrderBook
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
+    # Data sources whose order book snapshot requests all go through one shared throttler opt in to have the
+    # snapshots requested concurrently, leaving the pace to the throttler. The others are requested a second apart.
+    CONCURRENT_SNAPSHOT_REQUESTS: bool = False
 
     def __init__(self, trading_pairs: List[str]):
         self._trading_pairs: List[str] = trading_pairs
@@ -7,14 +7,12 @@ from cpython cimport(
     PyWeakref_GetObject
 )
 from cython.operator cimport(
-    postincrement as inc,
     dereference as deref,
     address
 )
-from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
+import weakref
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +22,40 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class _DeadListenerCallback:
+    """
+    Weak reference callback removing a listener from a PubSub once the listener is garbage collected. It only holds
+    weak references, to neither keep the PubSub nor the listener alive.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
+        object _listener_weakref
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag, object listener_weakref):
+        self._pubsub_ref = weakref.ref(pubsub)
+        self._event_tag = event_tag
+        self._listener_weakref = listener_weakref
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, _):
+        cdef PubSub pubsub = self._pubsub_ref()
+        if pubsub is not None:
+            pubsub.c_remove_listener_ref(self._event_tag, self._listener_weakref)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem by removing the dead event listeners.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Each listener is registered along with a second weak reference to it, whose callback removes the listener as soon
+    as it is garbage collected, so no O(n) sweep for dead listeners is needed on the hot paths.
+    c_remove_dead_listeners() can still be called to sweep them explicitly.
+
+    c_trigger_event() and c_get_listeners() iterate a per event tag snapshot (a tuple) of the listener weak references,
+    which is dropped each time a listener of the event tag is added or removed and rebuilt on the next lookup. The
+    snapshot holds weak references, not the listeners, so that it doesn't keep lapsed listeners alive; dead ones are
+    skipped until their callback runs.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +64,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self, *args, **kwargs):
+        # Set in __cinit__, as subclasses (e.g. TimeIterator) don't call PubSub.__init__()
+        self._listener_callback_refs = {}
+        self._listener_snapshots = {}
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -77,6 +91,7 @@ cdef class PubSub:
             EventListenersCollection *listeners_ptr
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
+            tuple callback_key = (event_tag, listener_weakref)
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
             deref(listeners_ptr).insert(listener_wrapper)
@@ -84,82 +99,88 @@ cdef class PubSub:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        if callback_key not in self._listener_callback_refs:
+            self._listener_callback_refs[callback_key] = PyWeakref_NewRef(
+                listener, _DeadListenerCallback(self, event_tag, listener_weakref))
+            self._listener_snapshots.pop(event_tag, None)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
+        self.c_remove_listener_ref(event_tag, PyWeakref_NewRef(listener, None))
+
+    cdef c_remove_listener_ref(self, int64_t event_tag, object listener_weakref):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
             EventListenersIterator lit
+        self._listener_callback_refs.pop((event_tag, listener_weakref), None)
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+            self._listener_snapshots.pop(event_tag, None)
+        if deref(listeners_ptr).size() < 1:
+            self._events.erase(it)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
             object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
+            list dead_listener_weakrefs = []
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
+        for pyref in deref(listeners_ptr):
+            listener_weakref = <object>pyref.get()
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+                dead_listener_weakrefs.append(listener_weakref)
+        for listener_weakref in dead_listener_weakrefs:
+            self.c_remove_listener_ref(event_tag, listener_weakref)
+
+    cdef tuple c_get_listener_refs(self, int64_t event_tag):
+        """
+        Returns the weak references to the listeners of the event tag, from the snapshot if there is one.
+        """
+        cdef:
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            EventsIterator it
+            list listener_refs = []
+        if snapshot is not None:
+            return snapshot
+        it = self._events.find(event_tag)
+        if it != self._events.end():
+            for pyref in deref(it).second:
+                listener_refs.append(<object>pyref.get())
+        snapshot = tuple(listener_refs)
+        self._listener_snapshots[event_tag] = snapshot
+        return snapshot
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
-            return []
+            object listener
+            list retval = []
 
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in self.c_get_listener_refs(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The snapshot is immutable - listeners are allowed to call c_remove_listener() while the event is dispatched,
+        # which replaces the snapshot instead of changing the one being iterated.
+        for listener_weakref in self.c_get_listener_refs(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
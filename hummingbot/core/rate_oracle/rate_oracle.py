@@ -1,12 +1,15 @@
 import asyncio
 import logging
+import time
 
 from decimal import Decimal
 from enum import Enum
 from typing import (
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
 )
 
 import aiohttp
@@ -19,9 +22,16 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import convert_from_excha
     kucoin_convert_from_exchange_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.rate_oracle_streams import (
+    BinanceRateOracleStream,
+    KucoinRateOracleStream,
+    RateOracleStream,
+    TickerUpdates,
+)
+from hummingbot.core.rate_oracle.utils import RateConversionGraph
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.web_assistant.connections.client_session_pool import ClientSessionPool
 from hummingbot.logger import HummingbotLogger
 
 
@@ -39,17 +49,28 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    A RateConversionGraph is built on each new set of prices to find (and memoize) a rate on a given pair.
+    When streaming is enabled and the source has a websocket stream, the prices of the trading pairs the looked up rates
+    are converted with are then followed through the stream, the whole ticker being fetched again only if it fails.
+    Streamed prices are applied to the graph in place, so only the rates routed through them are computed again.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
     global_token: str = "USDT"
     global_token_symbol: str = "$"
+    streaming: bool = False
+
+    STREAM_CHECK_INTERVAL = 1.0
+    STREAM_RETRY_INTERVAL = 30.0
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
+    _cached_rate_graph: Optional[RateConversionGraph] = None
+    _stream_classes: Dict[RateOracleSource, type] = {
+        RateOracleSource.binance: BinanceRateOracleStream,
+        RateOracleSource.kucoin: KucoinRateOracleStream,
+    }
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
     binance_us_price_url = "https://api.binance.us/api/v3/ticker/bookTicker"
@@ -75,7 +96,12 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
+        self._fetched_prices: Dict[str, Decimal] = {}
         self._prices: Dict[str, Decimal] = {}
+        self._rate_graph: RateConversionGraph = RateConversionGraph(self._prices)
+        self._ticker_updates: TickerUpdates = {}
+        self._streams: Dict[RateOracleSource, RateOracleStream] = {}
+        self._stream_retry_timestamp: float = 0
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
 
@@ -84,9 +110,7 @@ class RateOracle(NetworkBase):
 
     @classmethod
     async def _http_client(cls) -> aiohttp.ClientSession:
-        if cls._shared_client is None:
-            cls._shared_client = aiohttp.ClientSession()
-        return cls._shared_client
+        return await ClientSessionPool.get_instance().get_client()
 
     async def get_ready(self):
         """
@@ -110,6 +134,8 @@ class RateOracle(NetworkBase):
         """
         Actual prices retrieved from URL
         """
+        if self._ticker_updates:
+            self._apply_ticker_updates()
         return self._prices.copy()
 
     def rate(self, pair: str) -> Decimal:
@@ -119,7 +145,19 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        if self._ticker_updates:
+            self._apply_ticker_updates()
+        return self._rate_graph.rate(pair)
+
+    def precompute_rates(self, pairs: Iterable[str]):
+        """
+        Computes the conversion rates of the given pairs (e.g. the pairs of all the configured markets) at once, and
+        again each time the prices are refreshed, so that their lookups are dictionary hits.
+        :param pairs: Trading pairs, e.g. BTC-USDT
+        """
+        if self._ticker_updates:
+            self._apply_ticker_updates()
+        self._rate_graph.precompute(pairs)
 
     @classmethod
     async def rate_async(cls, pair: str) -> Decimal:
@@ -130,7 +168,7 @@ class RateOracle(NetworkBase):
         :return A conversion rate
         """
         prices = await cls.get_prices()
-        return find_rate(prices, pair)
+        return cls._rate_graph_for(prices).rate(pair)
 
     @classmethod
     async def global_rate(cls, token: str) -> Decimal:
@@ -141,7 +179,18 @@ class RateOracle(NetworkBase):
         """
         prices = await cls.get_prices()
         pair = token + "-" + cls.global_token
-        return find_rate(prices, pair)
+        return cls._rate_graph_for(prices).rate(pair)
+
+    @classmethod
+    def _rate_graph_for(cls, prices: Dict[str, Decimal]) -> RateConversionGraph:
+        """
+        Returns the rate graph of the given prices, which is shared by the calls made while the prices are cached
+        """
+        graph = cls._cached_rate_graph
+        if graph is None or graph.prices is not prices:
+            graph = RateConversionGraph(prices, previous=graph)
+            cls._cached_rate_graph = graph
+        return graph
 
     @classmethod
     async def global_value(cls, token: str, amount: Decimal) -> Decimal:
@@ -158,9 +207,13 @@ class RateOracle(NetworkBase):
     async def fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self.get_prices()
-                if self._prices:
-                    self._ready_event.set()
+                stream_trading_pairs = self._stream_trading_pairs()
+                if stream_trading_pairs:
+                    await self._stream_prices(stream_trading_pairs)
+                else:
+                    self._set_prices(await self.get_prices())
+                    if self._prices:
+                        self._ready_event.set()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -168,6 +221,60 @@ class RateOracle(NetworkBase):
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
             await asyncio.sleep(1)
 
+    def _stream_trading_pairs(self) -> Set[str]:
+        """
+        Returns the trading pairs to follow through the source stream, none if the prices are to be fetched from REST
+        """
+        if (not self.streaming
+                or self.source not in self._stream_classes
+                or not self._prices
+                or time.time() < self._stream_retry_timestamp):
+            return set()
+        return self._rate_graph.route_pairs()
+
+    async def _stream_prices(self, trading_pairs: Set[str]):
+        """
+        Follows the prices of the trading pairs through the source stream, until other trading pairs are needed or the
+        source changes. If the stream fails, the prices are fetched from REST for the next STREAM_RETRY_INTERVAL.
+        """
+        source = self.source
+        stream = self._streams.get(source)
+        if stream is None:
+            stream = self._stream_classes[source]()
+            self._streams[source] = stream
+        listen_task = asyncio.ensure_future(stream.listen(trading_pairs, self._ticker_updates))
+        try:
+            while not listen_task.done():
+                await asyncio.wait([listen_task], timeout=self.STREAM_CHECK_INTERVAL)
+                if self.source != source or not self._rate_graph.route_pairs() <= trading_pairs:
+                    return
+            listen_task.result()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._stream_retry_timestamp = time.time() + self.STREAM_RETRY_INTERVAL
+            self.logger().network(f"Error streaming prices from {source.name}, fetching them from REST instead.",
+                                  exc_info=True,
+                                  app_warning_msg=f"Couldn't stream prices from {source.name}.")
+        finally:
+            listen_task.cancel()
+
+    def _apply_ticker_updates(self):
+        prices: Dict[str, Decimal] = {}
+        for trading_pair, (bid, ask) in self._ticker_updates.items():
+            bid, ask = Decimal(bid), Decimal(ask)
+            if bid > 0 and ask > 0:
+                prices[trading_pair] = (bid + ask) / Decimal("2")
+        self._ticker_updates.clear()
+        self._rate_graph.update_prices(prices)
+
+    def _set_prices(self, prices: Dict[str, Decimal]):
+        if prices is not self._fetched_prices:
+            self._fetched_prices = prices
+            # A copy, as the streamed prices are applied to it in place and the fetched prices may be shared by a cache
+            self._prices = prices.copy()
+            self._rate_graph = RateConversionGraph(self._prices, previous=self._rate_graph)
+
     @classmethod
     async def get_prices(cls) -> Dict[str, Decimal]:
         """
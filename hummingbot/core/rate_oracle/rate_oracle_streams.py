@@ -0,0 +1,167 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.connector.exchange.kucoin.kucoin_utils import (
+    convert_from_exchange_trading_pair as kucoin_convert_from_exchange_pair,
+    convert_to_exchange_trading_pair as kucoin_convert_to_exchange_pair,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.web_assistant.connections.client_session_pool import ClientSessionPool
+from hummingbot.core.web_assistant.connections.data_types import WSRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+# The best bid and ask of each trading pair, as received from the exchange (decoded only when a rate is needed)
+TickerUpdates = Dict[str, Tuple[str, str]]
+
+
+class RateOracleStream(ABC):
+    """
+    Websocket stream of the best bid and ask prices of the trading pairs of a RateOracle source. It is used in place of
+    the source's whole ticker REST endpoint, to only receive the prices of the trading pairs the oracle converts with.
+    """
+
+    SUBSCRIPTIONS_PER_REQUEST = 100
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+
+    def __init__(self, api_factory: Optional[WebAssistantsFactory] = None):
+        self._api_factory: WebAssistantsFactory = api_factory or WebAssistantsFactory()
+
+    @abstractmethod
+    async def listen(self, trading_pairs: Set[str], updates: TickerUpdates):
+        """
+        Subscribes to the tickers of the trading pairs and stores their updates until the connection is closed.
+        Raises an exception if the connection fails or is closed by the exchange.
+        :param trading_pairs: the trading pairs to follow the prices of
+        :param updates: the dictionary the updates are stored in, keyed by trading pair
+        """
+        raise NotImplementedError
+
+    def _chunks(self, items: List[Any]) -> List[List[Any]]:
+        size = self.SUBSCRIPTIONS_PER_REQUEST
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class BinanceRateOracleStream(RateOracleStream):
+    """
+    Follows the individual book ticker streams of binance.com and, for the USD quoted trading pairs, of binance.us
+    """
+
+    WSS_URL = "wss://stream.binance.{}:9443/ws"
+
+    async def listen(self, trading_pairs: Set[str], updates: TickerUpdates):
+        us_trading_pairs = {trading_pair for trading_pair in trading_pairs if trading_pair.split("-")[1] == "USD"}
+        tasks = [self._listen_domain(trading_pairs - us_trading_pairs, updates, "com"),
+                 self._listen_domain(us_trading_pairs, updates, "us")]
+        tasks = [asyncio.ensure_future(task) for task in tasks]
+        try:
+            # Returns as soon as one of the domains stops
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await safe_gather(*tasks, return_exceptions=True)
+
+    async def _listen_domain(self, trading_pairs: Set[str], updates: TickerUpdates, domain: str):
+        if len(trading_pairs) == 0:
+            await asyncio.Event().wait()
+        symbol_map = await BinanceAPIOrderBookDataSource.trading_pair_symbol_map(domain=domain)
+        symbols = {symbol_map.inverse[trading_pair]: trading_pair
+                   for trading_pair in trading_pairs if trading_pair in symbol_map.inverse}
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        try:
+            await ws.connect(ws_url=self.WSS_URL.format(domain), ping_timeout=self.PING_TIMEOUT,
+                             message_timeout=self.MESSAGE_TIMEOUT)
+            await self._listen(ws, symbols, updates)
+        finally:
+            await ws.disconnect()
+
+    async def _listen(self, ws: WSAssistant, symbols: Dict[str, str], updates: TickerUpdates):
+        """
+        :param symbols: the trading pairs, keyed by exchange symbol
+        """
+        for request_id, chunk in enumerate(self._chunks(list(symbols)), start=1):
+            payload = {
+                "method": "SUBSCRIBE",
+                "params": [f"{symbol.lower()}@bookTicker" for symbol in chunk],
+                "id": request_id
+            }
+            await ws.send(WSRequest(payload=payload))
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            trading_pair = symbols.get(data.get("s"))
+            if trading_pair is not None:
+                updates[trading_pair] = (data["b"], data["a"])
+        raise ConnectionError("The Binance rate stream was disconnected.")
+
+
+class KucoinRateOracleStream(RateOracleStream):
+    """
+    Follows the ticker topics of KuCoin, which requires a connection token and to be pinged at a given interval
+    """
+
+    BULLET_PUBLIC_URL = "https://api.kucoin.com/api/v1/bullet-public"
+    TICKER_TOPIC = "/market/ticker:"
+
+    async def listen(self, trading_pairs: Set[str], updates: TickerUpdates):
+        client = await ClientSessionPool.get_instance().get_client()
+        async with client.request("POST", self.BULLET_PUBLIC_URL) as resp:
+            if resp.status != 200:
+                raise IOError(f"Error fetching KuCoin websocket connection data. HTTP status is {resp.status}.")
+            connection_data = (await resp.json())["data"]
+        server = connection_data["instanceServers"][0]
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        ping_task: Optional[asyncio.Task] = None
+        try:
+            await ws.connect(ws_url=f"{server['endpoint']}?token={connection_data['token']}",
+                             ping_timeout=self.PING_TIMEOUT, message_timeout=self.MESSAGE_TIMEOUT)
+            ping_task = safe_ensure_future(self._ping_loop(ws, server["pingInterval"] / 1e3))
+            await self._listen(ws, trading_pairs, updates)
+        finally:
+            if ping_task is not None:
+                ping_task.cancel()
+            await ws.disconnect()
+
+    async def _listen(self, ws: WSAssistant, trading_pairs: Set[str], updates: TickerUpdates):
+        symbols = {kucoin_convert_to_exchange_pair(trading_pair): trading_pair for trading_pair in trading_pairs}
+        for chunk in self._chunks(list(symbols)):
+            payload = {
+                "id": self._nonce(),
+                "type": "subscribe",
+                "topic": self.TICKER_TOPIC + ",".join(chunk),
+                "privateChannel": False,
+                "response": False
+            }
+            await ws.send(WSRequest(payload=payload))
+        topic_prefix_length = len(self.TICKER_TOPIC)
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            if data.get("type") != "message":
+                continue
+            symbol = data["topic"][topic_prefix_length:]
+            trading_pair = symbols.get(symbol) or kucoin_convert_from_exchange_pair(symbol)
+            ticker = data["data"]
+            updates[trading_pair] = (ticker["bestBid"], ticker["bestAsk"])
+        raise ConnectionError("The KuCoin rate stream was disconnected.")
+
+    async def _ping_loop(self, ws: WSAssistant, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await ws.send(WSRequest(payload={"id": self._nonce(), "type": "ping"}))
+
+    @staticmethod
+    def _nonce() -> str:
+        return str(int(time.time() * 1e6))
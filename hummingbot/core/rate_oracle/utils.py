@@ -1,5 +1,9 @@
-from typing import Dict
+from collections import deque
 from decimal import Decimal
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+# A conversion step: the trading pair whose price is used, and whether the price is divided by (instead of multiplied)
+RouteStep = Tuple[str, bool]
 
 
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
@@ -21,12 +25,142 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     reverse_pair = f"{quote}-{base}"
     if reverse_pair in prices:
         return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = base_pair.split("-")[1]
-        link_pair = f"{link_quote}-{quote}"
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = f"{quote}-{link_quote}"
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateConversionGraph(prices).rate(pair)
+
+
+class RateConversionGraph:
+    """
+    Graph of the assets linked by the trading pairs of a dictionary of prices, used to find the conversion rate between
+    any two connected assets. The rate of a pair follows the route with the fewest conversions (up to
+    `MAX_ROUTE_HOPS`), preferring the pairs in the order of the prices dictionary when several routes are as short.
+
+    Rates are memoized, so repeated lookups of a pair are dictionary hits. A graph created for new prices with the
+    previous graph carries over its routes when the trading pairs did not change, and precomputes the rates of all the
+    pairs looked up on the previous graph, so that rate lookups keep costing nothing as prices refresh. Prices of a few
+    trading pairs can also be updated in place, only the memoized rates routed through them being computed again.
+    """
+
+    MAX_ROUTE_HOPS = 4
+
+    def __init__(self, prices: Dict[str, Decimal], previous: Optional["RateConversionGraph"] = None):
+        """
+        :param prices: the dictionary of trading pairs and their prices, it should only be modified through
+        update_prices afterwards
+        :param previous: the graph of the previous prices
+        """
+        self._prices: Dict[str, Decimal] = prices
+        self._rates: Dict[str, Optional[Decimal]] = {}
+        # The memoized pairs whose rates are computed with the price of each trading pair
+        self._dependent_pairs: Dict[str, Set[str]] = {}
+        if previous is not None and previous._prices.keys() == prices.keys():
+            self._links: Dict[str, List[Tuple[str, RouteStep]]] = previous._links
+            self._routes: Dict[str, Optional[List[RouteStep]]] = previous._routes
+        else:
+            self._links = self._build_links(prices)
+            self._routes = {}
+        if previous is not None:
+            self.precompute(previous._rates.keys())
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate of a trading pair, e.g. BTC-USDT, or None if the assets are not connected
+        """
+        try:
+            return self._rates[pair]
+        except KeyError:
+            rate = self._find_rate(pair)
+            self._rates[pair] = rate
+            for step_pair, _ in self.route(pair) or []:
+                self._dependent_pairs.setdefault(step_pair, set()).add(pair)
+            return rate
+
+    def route(self, pair: str) -> Optional[List[RouteStep]]:
+        """
+        Returns the conversions the rate of a trading pair is computed with, or None if the assets are not connected
+        """
+        if pair not in self._routes:
+            self._routes[pair] = self._find_route(pair)
+        return self._routes[pair]
+
+    def route_pairs(self) -> Set[str]:
+        """
+        Returns the trading pairs whose prices the rates looked up so far are computed with
+        """
+        return {step_pair for pair in self._rates for step_pair, _ in self.route(pair) or []}
+
+    def precompute(self, pairs: Iterable[str]):
+        """
+        Computes the rates of the given trading pairs ahead of their lookups
+        """
+        for pair in list(pairs):
+            self.rate(pair)
+
+    def update_prices(self, prices: Dict[str, Decimal]):
+        """
+        Updates the prices of trading pairs of the graph in place, and computes again the memoized rates routed through
+        them. Trading pairs that are not in the graph are ignored, as they would change its routes.
+        """
+        stale_pairs: Set[str] = set()
+        for step_pair, price in prices.items():
+            if step_pair in self._prices:
+                self._prices[step_pair] = price
+                stale_pairs.update(self._dependent_pairs.get(step_pair, ()))
+        for pair in stale_pairs:
+            self._rates[pair] = self._find_rate(pair)
+
+    def _find_rate(self, pair: str) -> Optional[Decimal]:
+        route: Optional[List[RouteStep]] = self.route(pair)
+        if route is None:
+            return None
+        if len(route) == 0:
+            return Decimal("1")
+        rate: Optional[Decimal] = None
+        for step_pair, inverted in route:
+            price: Decimal = self._prices[step_pair]
+            if not price:
+                return None
+            if rate is None:
+                rate = Decimal("1") / price if inverted else price
+            else:
+                rate = rate / price if inverted else rate * price
+        return rate
+
+    def _find_route(self, pair: str) -> Optional[List[RouteStep]]:
+        base, quote = pair.split("-")
+        if base == quote:
+            return []
+        if base not in self._links or quote not in self._links:
+            return None
+        # Breadth first search, so that the first route found is one of the shortest ones
+        previous_steps: Dict[str, Tuple[str, RouteStep]] = {base: (base, ("", False))}
+        frontier: Deque[Tuple[str, int]] = deque([(base, 0)])
+        while frontier:
+            asset, hops = frontier.popleft()
+            if hops == self.MAX_ROUTE_HOPS:
+                continue
+            for next_asset, step in self._links[asset]:
+                if next_asset in previous_steps:
+                    continue
+                previous_steps[next_asset] = (asset, step)
+                if next_asset == quote:
+                    route: List[RouteStep] = []
+                    while next_asset != base:
+                        next_asset, step = previous_steps[next_asset]
+                        route.append(step)
+                    route.reverse()
+                    return route
+                frontier.append((next_asset, hops + 1))
+        return None
+
+    @staticmethod
+    def _build_links(prices: Dict[str, Decimal]) -> Dict[str, List[Tuple[str, RouteStep]]]:
+        links: Dict[str, List[Tuple[str, RouteStep]]] = {}
+        for pair in prices:
+            base, quote = pair.split("-")
+            links.setdefault(base, []).append((quote, (pair, False)))
+            links.setdefault(quote, []).append((base, (pair, True)))
+        return links
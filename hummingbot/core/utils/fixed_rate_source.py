@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph
 
 
 class FixedRateSource:
@@ -9,6 +9,7 @@ class FixedRateSource:
         super().__init__()
 
         self._known_rates: dict = {}
+        self._rate_graph: RateConversionGraph = RateConversionGraph(self._known_rates)
 
     def __str__(self):
         return "fixed rates"
@@ -18,7 +19,8 @@ class FixedRateSource:
         :param token_pair: A trading pair, e.g. BTC-USDT
         :param rate: The rate to associate to the token pair
         """
-        self._known_rates[token_pair] = rate
+        self._known_rates = {**self._known_rates, token_pair: rate}
+        self._rate_graph = RateConversionGraph(self._known_rates, previous=self._rate_graph)
 
     def rate(self, pair: str) -> Decimal:
         """
@@ -27,4 +29,4 @@ class FixedRateSource:
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._known_rates, pair)
+        return self._rate_graph.rate(pair)
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+import aiohttp
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    limit: int = 0
+    limit_per_host: int = 0
+    acquired_connections: int = 0
+    idle_connections: int = 0
+    acquired_per_host: Dict[str, int] = field(default_factory=dict)
+    connections_created: int = 0
+    connections_reused: int = 0
+    connection_queued_count: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+
+class ClientSessionPool:
+    """
+    Process-wide pool of HTTP connections, shared by the `web_assistant` layer and the other components doing REST
+    requests, so that requests to the same host reuse already established (keep-alive) TLS connections instead of
+    each component opening its own session.
+
+    The underlying `aiohttp.TCPConnector` limits the connections in total and per host (the `http_connection_limit`
+    and `http_connection_limit_per_host` global configs), caches DNS resolutions for `TTL_DNS_CACHE` seconds and
+    keeps idle connections alive for `KEEPALIVE_TIMEOUT` seconds. aiohttp enables TCP_NODELAY on every connection it
+    opens.
+    Websockets hold their connection for as long as they are open, so they get a session of their own, outside of
+    the limits: they can not use up the connections available to the REST requests to the same host.
+    """
+
+    # Defaults of the connection limits, when they are not set in the global config
+    LIMIT = 100
+    LIMIT_PER_HOST = 20
+    TTL_DNS_CACHE = 300
+    KEEPALIVE_TIMEOUT = 30.0
+    PREWARM_TIMEOUT = 5.0
+
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["ClientSessionPool"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "ClientSessionPool":
+        if cls._shared_instance is None:
+            cls._shared_instance = ClientSessionPool()
+        return cls._shared_instance
+
+    def __init__(self,
+                 limit: Optional[int] = None,
+                 limit_per_host: Optional[int] = None,
+                 ttl_dns_cache: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None):
+        """
+        :param limit: total number of simultaneous connections (0 for no limit)
+        :param limit_per_host: number of simultaneous connections to the same host (0 for no limit)
+        :param ttl_dns_cache: seconds a DNS resolution is cached for
+        :param keepalive_timeout: seconds an idle connection is kept open for reuse
+        """
+        self._limit: int = self._configured_limit("http_connection_limit", self.LIMIT) if limit is None else limit
+        self._limit_per_host: int = (self._configured_limit("http_connection_limit_per_host", self.LIMIT_PER_HOST)
+                                     if limit_per_host is None
+                                     else limit_per_host)
+        self._ttl_dns_cache: int = self.TTL_DNS_CACHE if ttl_dns_cache is None else ttl_dns_cache
+        self._keepalive_timeout: float = self.KEEPALIVE_TIMEOUT if keepalive_timeout is None else keepalive_timeout
+        self._client: Optional[aiohttp.ClientSession] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_client: Optional[aiohttp.ClientSession] = None
+        self._ws_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._metrics: ConnectionPoolMetrics = ConnectionPoolMetrics()
+
+    @staticmethod
+    def _configured_limit(key: str, default: int) -> int:
+        from hummingbot.client.config.global_config_map import global_config_map  # avoids chance of circular import
+        config_var = global_config_map.get(key)
+        if config_var is None or config_var.value is None:
+            return default
+        return int(config_var.value)
+
+    async def get_client(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session, creating it if it does not exist yet, was closed, or belongs to another event loop.
+        """
+        loop = asyncio.get_event_loop()
+        if self._client is None or self._client.closed or self._client_loop is not loop:
+            await self._close_client(self._client)
+            self._client = self._create_client()
+            self._client_loop = loop
+        return self._client
+
+    async def get_ws_client(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session for websocket connections, kept apart from the REST connections pool.
+        """
+        loop = asyncio.get_event_loop()
+        if self._ws_client is None or self._ws_client.closed or self._ws_client_loop is not loop:
+            await self._close_client(self._ws_client)
+            self._ws_client = self._create_ws_client()
+            self._ws_client_loop = loop
+        return self._ws_client
+
+    async def prewarm(self, urls: List[str]):
+        """
+        Opens connections to the hosts of the given urls, so that the first requests sent to them do not pay for the
+        TCP and TLS handshakes. Failures are only logged, the requests will open the connections again if needed.
+        :param urls: urls of cheap endpoints (i.e. ping endpoints) of the hosts to connect to
+        """
+        client = await self.get_client()
+        await safe_gather(*[self._prewarm_url(client, url) for url in urls], return_exceptions=True)
+
+    def pool_metrics(self) -> ConnectionPoolMetrics:
+        """
+        Returns the current state of the connection pool, along with the counters of the connection events
+        """
+        metrics = self._metrics
+        connector: Optional[aiohttp.TCPConnector] = (self._client.connector
+                                                     if self._client is not None and not self._client.closed
+                                                     else None)
+        metrics.limit = self._limit
+        metrics.limit_per_host = self._limit_per_host
+        metrics.acquired_connections = 0
+        metrics.idle_connections = 0
+        metrics.acquired_per_host = {}
+        if connector is not None:
+            # aiohttp has no public API for the state of the pool, its attributes might change between versions
+            try:
+                metrics.acquired_connections = len(connector._acquired)
+                metrics.idle_connections = sum(len(connections) for connections in connector._conns.values())
+                metrics.acquired_per_host = {f"{key.host}:{key.port}": len(connections)
+                                             for key, connections in connector._acquired_per_host.items()
+                                             if len(connections) > 0}
+            except (AttributeError, TypeError):
+                self.logger().debug("Could not read the state of the connection pool.", exc_info=True)
+        return metrics
+
+    async def close(self):
+        await self._close_client(self._client)
+        await self._close_client(self._ws_client)
+        self._client = None
+        self._ws_client = None
+
+    async def _close_client(self, client: Optional[aiohttp.ClientSession]):
+        if client is None or client.closed:
+            return
+        try:
+            await client.close()
+        except Exception:
+            # The session of an event loop already closed can not close its connections any more
+            self.logger().debug("Error closing a previous HTTP session.", exc_info=True)
+
+    def _create_client(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=self._limit,
+                                         limit_per_host=self._limit_per_host,
+                                         ttl_dns_cache=self._ttl_dns_cache,
+                                         keepalive_timeout=self._keepalive_timeout)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+
+    def _create_ws_client(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=self._ttl_dns_cache)
+        return aiohttp.ClientSession(connector=connector)
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    async def _prewarm_url(self, client: aiohttp.ClientSession, url: str):
+        try:
+            async with client.get(url, timeout=aiohttp.ClientTimeout(total=self.PREWARM_TIMEOUT)) as response:
+                await response.read()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug(f"Could not open a connection to {url} in advance.", exc_info=True)
+
+    async def _on_connection_created(self, session, trace_config_ctx, params):
+        self._metrics.connections_created += 1
+
+    async def _on_connection_reused(self, session, trace_config_ctx, params):
+        self._metrics.connections_reused += 1
+
+    async def _on_connection_queued(self, session, trace_config_ctx, params):
+        self._metrics.connection_queued_count += 1
+
+    async def _on_dns_cache_hit(self, session, trace_config_ctx, params):
+        self._metrics.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, trace_config_ctx, params):
+        self._metrics.dns_cache_misses += 1
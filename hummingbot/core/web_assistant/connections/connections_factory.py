@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Any, Callable, List, Optional
 
 import aiohttp
+from hummingbot.core.web_assistant.connections.client_session_pool import ClientSessionPool, ConnectionPoolMetrics
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -15,21 +16,26 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
-    """
 
-    def __init__(self):
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+    All the factories share the process-wide `ClientSessionPool`, so connections to a host are kept alive and reused
+    across connectors and components. Websockets use the pool's separate websocket session.
+    """
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
         connection = RESTConnection(aiohttp_client_session=shared_client)
         return connection
 
-    async def get_ws_connection(self) -> WSConnection:
-        shared_client = await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+    async def get_ws_connection(self, json_decoder: Optional[Callable[[str], Any]] = None) -> WSConnection:
+        shared_client = await ClientSessionPool.get_instance().get_ws_client()
+        connection = WSConnection(aiohttp_client_session=shared_client, json_decoder=json_decoder)
         return connection
 
+    async def prewarm(self, urls: List[str]):
+        await ClientSessionPool.get_instance().prewarm(urls)
+
+    def pool_metrics(self) -> ConnectionPoolMetrics:
+        return ClientSessionPool.get_instance().pool_metrics()
+
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
-        return self._shared_client
+        return await ClientSessionPool.get_instance().get_client()
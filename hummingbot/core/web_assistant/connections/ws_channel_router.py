@@ -0,0 +1,42 @@
+import asyncio
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+
+class WSChannelRouter:
+    """Routes raw WebSocket text frames to per-channel queues before they are decoded.
+
+    Each route is a marker, a substring identifying the channel (e.g. `'"e":"depthUpdate"'` for Binance order book
+    diffs), and the queue its messages are put in. Only the first `scan_length` characters of a frame are searched
+    for the markers, which is enough when the exchange sends the channel first and much cheaper than decoding the
+    whole frame to inspect it.
+
+    Once a `WSConnection` has a router, it decodes the frames matching a route only once and puts the decoded message
+    in the route's queue, without returning it from `receive()`. The frames matching no route are returned by
+    `receive()` as usual if `pass_unmatched` is set, and dropped without being decoded otherwise.
+    """
+
+    DEFAULT_SCAN_LENGTH = 64
+
+    def __init__(self, scan_length: int = DEFAULT_SCAN_LENGTH, pass_unmatched: bool = True):
+        self._scan_length = scan_length
+        self._pass_unmatched = pass_unmatched
+        self._routes: List[Tuple[str, asyncio.Queue]] = []
+
+    @property
+    def pass_unmatched(self) -> bool:
+        return self._pass_unmatched
+
+    def add_route(self, marker: str, queue: asyncio.Queue):
+        self._routes.append((marker, queue))
+
+    def queue_for(self, raw_message: str) -> Optional[asyncio.Queue]:
+        """Returns the queue of the first route whose marker is found in the start of the frame, if any."""
+        prefix = raw_message[:self._scan_length]
+        for marker, queue in self._routes:
+            if marker in prefix:
+                return queue
+        return None
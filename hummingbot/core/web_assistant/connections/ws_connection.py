@@ -1,14 +1,29 @@
 import asyncio
+import json
 import time
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import aiohttp
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.ws_channel_router import WSChannelRouter
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    """Text frames are decoded with `json_decoder`, which can be swapped for a faster JSON library's `loads` (e.g.
+    `orjson.loads` or `ujson.loads`) by the connectors whose messages it decodes accurately.
+
+    If a `WSChannelRouter` is set, the frames it recognizes are decoded and put in their channel's queue instead of
+    being returned by `receive()`; see `WSChannelRouter`.
+    """
+
+    def __init__(
+        self,
+        aiohttp_client_session: aiohttp.ClientSession,
+        json_decoder: Optional[Callable[[str], Any]] = None,
+    ):
         self._client_session = aiohttp_client_session
+        self._json_decoder = json_decoder or json.loads
+        self._channel_router: Optional[WSChannelRouter] = None
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -22,6 +37,14 @@ class WSConnection:
     def connected(self) -> bool:
         return self._connected
 
+    @property
+    def channel_router(self) -> Optional[WSChannelRouter]:
+        return self._channel_router
+
+    @channel_router.setter
+    def channel_router(self, channel_router: Optional[WSChannelRouter]):
+        self._channel_router = channel_router
+
     async def connect(
         self,
         ws_url: str,
@@ -56,6 +79,7 @@ class WSConnection:
         while self._connected:
             msg = await self._read_message()
             msg = await self._process_message(msg)
+            msg = self._route_message(msg)
             if msg is not None:
                 response = self._build_resp(msg)
                 break
@@ -112,11 +136,20 @@ class WSConnection:
     def _update_last_recv_time(self, _: aiohttp.WSMessage):
         self._last_recv_time = time.time()
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _route_message(self, msg: Optional[aiohttp.WSMessage]) -> Optional[aiohttp.WSMessage]:
+        if msg is not None and self._channel_router is not None and msg.type == aiohttp.WSMsgType.TEXT:
+            queue = self._channel_router.queue_for(msg.data)
+            if queue is not None:
+                queue.put_nowait(self._json_decoder(msg.data))
+                msg = None
+            elif not self._channel_router.pass_unmatched:
+                msg = None
+        return msg
+
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
-            data = msg.json()
+            data = self._json_decoder(msg.data)
         response = WSResponse(data)
         return response
@@ -1,6 +1,10 @@
 import abc
+import logging
+from typing import Dict, Optional
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.connections.data_types import RESTResponse
+from hummingbot.logger import HummingbotLogger
 
 
 class RESTPostProcessorBase(abc.ABC):
@@ -13,3 +17,56 @@ class RESTPostProcessorBase(abc.ABC):
     @abc.abstractmethod
     async def post_process(self, response: RESTResponse) -> RESTResponse:
         ...
+
+
+class RateLimitUsageRESTPostProcessor(RESTPostProcessorBase):
+    """Feeds the rate limit usage reported by the server back into an `AsyncThrottler`.
+
+    Exchanges such as Binance report the weight used by the client's IP in response headers
+    (i.e. `X-MBX-USED-WEIGHT-1M`). Usage the throttler has not counted itself, like requests sent before a restart
+    or by other bots on the same IP, is added to its accounting so it slows down before reaching the server limit.
+    When the server still rejects a request for exceeding its limits, the limits are blocked for the duration given
+    in the `Retry-After` header.
+    """
+
+    RATE_LIMIT_EXCEEDED_STATUSES = (418, 429)
+    DEFAULT_RETRY_AFTER = 60.0
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, throttler: AsyncThrottlerBase, usage_headers: Dict[str, str]):
+        """
+        :param throttler: the throttler used to rate limit the requests
+        :param usage_headers: maps each usage response header to the limit_id it reports on
+        """
+        self._throttler = throttler
+        self._usage_headers = usage_headers
+
+    async def post_process(self, response: RESTResponse) -> RESTResponse:
+        headers = response.headers or {}
+        for header, limit_id in self._usage_headers.items():
+            used_weight = headers.get(header)
+            if used_weight is not None:
+                try:
+                    self._throttler.update_used_capacity(limit_id, int(used_weight))
+                except ValueError:
+                    self.logger().debug(f"Unexpected value for the {header} header: {used_weight}")
+        if response.status in self.RATE_LIMIT_EXCEEDED_STATUSES:
+            retry_after = self._retry_after(headers)
+            self.logger().warning(f"API rate limits exceeded ({response.method} {response.url} returned "
+                                  f"{response.status}). Holding requests for {retry_after} seconds.")
+            for limit_id in self._usage_headers.values():
+                self._throttler.block_limit(limit_id, retry_after)
+        return response
+
+    def _retry_after(self, headers) -> float:
+        try:
+            return float(headers.get("Retry-After", self.DEFAULT_RETRY_AFTER))
+        except ValueError:
+            return self.DEFAULT_RETRY_AFTER
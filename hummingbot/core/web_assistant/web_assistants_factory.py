@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
@@ -27,6 +27,7 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        ws_json_decoder: Optional[Callable[[str], Any]] = None,
     ):
         self._connections_factory = ConnectionsFactory()
         self._rest_pre_processors = rest_pre_processors or []
@@ -34,6 +35,7 @@ class WebAssistantsFactory:
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
+        self._ws_json_decoder = ws_json_decoder
 
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
@@ -42,8 +44,12 @@ class WebAssistantsFactory:
         )
         return assistant
 
+    async def prewarm_connections(self, urls: List[str]):
+        """Opens connections to the hosts of the urls in advance, to avoid handshake latency on the first requests."""
+        await self._connections_factory.prewarm(urls)
+
     async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+        connection = await self._connections_factory.get_ws_connection(json_decoder=self._ws_json_decoder)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
@@ -2,6 +2,7 @@ from copy import deepcopy
 from typing import AsyncGenerator, List, Optional
 
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.ws_channel_router import WSChannelRouter
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
@@ -14,6 +15,9 @@ class WSAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `WSPreProcessorBase` and `WSPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    The messages routed to a queue by the `WSChannelRouter` set with `set_channel_router()` are neither returned nor
+    post-processed.
     """
 
     def __init__(
@@ -32,6 +36,9 @@ class WSAssistant:
     def last_recv_time(self) -> float:
         return self._connection.last_recv_time
 
+    def set_channel_router(self, channel_router: Optional[WSChannelRouter]):
+        self._connection.channel_router = channel_router
+
     async def connect(
         self,
         ws_url: str,
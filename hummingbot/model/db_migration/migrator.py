@@ -27,10 +27,11 @@ class Migrator:
         original_db_name = Path(original_db_path).stem
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
+        # Move the content of the write-ahead log into the database file before copying it
+        db_handle.engine.execute("PRAGMA wal_checkpoint(FULL)")
+        db_handle.engine.dispose()
         copyfile(original_db_path, new_db_path)
         copyfile(original_db_path, backup_db_path)
-
-        db_handle.engine.dispose()
         new_db_handle = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, new_db_path, original_db_name, True)
 
         relevant_transformations = [t for t in self.transformations
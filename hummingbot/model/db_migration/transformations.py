@@ -134,3 +134,25 @@ class ConvertPriceAndAmountColumnsToBigint(DatabaseTransformation):
     @property
     def to_version(self):
         return 20220130
+
+
+class AddConfigMarketTimestampIndexToOrders(DatabaseTransformation):
+    index_queries = [
+        'create index if not exists o_config_market_timestamp_index on "Order" '
+        '(config_file_path, market, creation_timestamp);',
+        'create index if not exists tf_config_timestamp_index on TradeFill (config_file_path, timestamp);',
+        'analyze;',
+    ]
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        for query in self.index_queries:
+            db_handle.engine.execute(query)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddConfigMarketTimestampIndexToOrders"
+
+    @property
+    def to_version(self):
+        return 20220301
@@ -6,6 +6,7 @@ from typing import Optional
 
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
@@ -15,6 +16,7 @@ from sqlalchemy.orm import (
     Session,
     sessionmaker,
 )
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
 from hummingbot import data_path
@@ -33,7 +35,21 @@ class SQLConnectionManager:
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20220130"
+    LOCAL_DB_VERSION_VALUE = "20220301"
+
+    # SQLite profile applied to every connection of the trades database.
+    # WAL lets the readers (history, startup queries) run alongside the MarketsRecorder writer, and with WAL the
+    # NORMAL synchronous level is still safe against corruption (only the last transactions can be lost on power
+    # failure). cache_size is in KiB when negative, mmap_size in bytes.
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }
+    SQLITE_POOL_SIZE = 5
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -73,7 +89,18 @@ class SQLConnectionManager:
         if "sqlite" in dialect:
             db_path = params.get("db_path")
 
-            return create_engine(f"{dialect}:///{db_path}")
+            if db_path in ("", ":memory:"):
+                # In memory databases only live as long as their connection, they keep SQLAlchemy defaults
+                return create_engine(f"{dialect}:///{db_path}")
+
+            # Keep a few connections open instead of reconnecting (and applying the pragmas) for every session.
+            # Sessions are used from the MarketsRecorder writer thread as well as from the main thread.
+            engine = create_engine(f"{dialect}:///{db_path}",
+                                   poolclass=QueuePool,
+                                   pool_size=cls.SQLITE_POOL_SIZE,
+                                   connect_args={"check_same_thread": False})
+            event.listen(engine, "connect", cls._apply_sqlite_pragmas)
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -83,6 +110,13 @@ class SQLConnectionManager:
 
             return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
 
+    @classmethod
+    def _apply_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in cls.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
     def __init__(self,
                  connection_type: SQLConnectionType,
                  db_path: Optional[str] = None,
@@ -150,14 +184,15 @@ class SQLConnectionManager:
                     version_info: LocalMetadata = LocalMetadata(key=self.LOCAL_DB_VERSION_KEY,
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
-                    session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE))
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                    return
+                local_db_version_value: str = local_db_version.value
+
+        # The session is closed before migrating, the Migrator replaces the database file and no connection should
+        # remain open on it (with its write-ahead log) while it does
+        if local_db_version_value < self.LOCAL_DB_VERSION_VALUE:
+            was_migration_successful = Migrator().migrate_db_to_version(
+                self, int(local_db_version_value), int(self.LOCAL_DB_VERSION_VALUE))
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
@@ -1,11 +1,11 @@
 import asyncio
 import traceback
-from multiprocessing import Queue
 from typing import List, Optional, Dict, Any, Callable
 from decimal import Decimal
 from statistics import mean, median
 from operator import itemgetter
 
+from .script_channel import ScriptChannel
 from .script_interface import (
     OnTick,
     OnStatus,
@@ -28,9 +28,8 @@ class ScriptBase:
     A user defined script should derive from this base class to get all its functionality.
     """
     def __init__(self):
-        self._parent_queue: Queue = None
-        self._child_queue: Queue = None
-        self._queue_check_interval: float = 0.0
+        self._parent_queue: ScriptChannel = None
+        self._child_queue: ScriptChannel = None
         self.mid_prices: List[Decimal] = []
         self.max_mid_prices_length: int = 86400  # 60 * 60 * 24 = 1 day of prices
         self.pmm_parameters: PMMParameters = None
@@ -41,10 +40,9 @@ class ScriptBase:
         # all_available_balances has the same data structure as all_total_balances
         self.all_available_balances: Dict[str, Dict[str, Decimal]] = None
 
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+    def assign_init(self, parent_queue: ScriptChannel, child_queue: ScriptChannel):
         self._parent_queue = parent_queue
         self._child_queue = child_queue
-        self._queue_check_interval = queue_check_interval
 
     @property
     def mid_price(self):
@@ -54,47 +52,45 @@ class ScriptBase:
         return self.mid_prices[-1]
 
     async def run(self):
-        asyncio.ensure_future(self.listen_to_parent())
-
-    async def listen_to_parent(self):
-        while True:
-            try:
-                if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._parent_queue.get()
-                # print(f"child gets {str(item)}")
-                if item is None:
-                    # print("child exiting..")
-                    asyncio.get_event_loop().stop()
-                    break
-                if isinstance(item, OnTick):
-                    self.mid_prices.append(item.mid_price)
-                    if len(self.mid_prices) > self.max_mid_prices_length:
-                        self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
-                    self.pmm_parameters = item.pmm_parameters
+        self._parent_queue.start_listening(self.process_parent_item)
+
+    def process_parent_item(self, item: Any):
+        try:
+            # print(f"child gets {str(item)}")
+            if item is None:
+                # print("child exiting..")
+                self._parent_queue.stop_listening()
+                asyncio.get_event_loop().stop()
+                return
+            if isinstance(item, OnTick):
+                self.mid_prices.append(item.mid_price)
+                if len(self.mid_prices) > self.max_mid_prices_length:
+                    self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
+                if self.pmm_parameters is None:
+                    self.pmm_parameters = PMMParameters()
+                self.pmm_parameters.apply_updates(item.pmm_parameters)
+                if item.all_total_balances is not None:
                     self.all_total_balances = item.all_total_balances
+                if item.all_available_balances is not None:
                     self.all_available_balances = item.all_available_balances
-                    self.on_tick()
-                elif isinstance(item, BuyOrderCompletedEvent):
-                    self.on_buy_order_completed(item)
-                elif isinstance(item, SellOrderCompletedEvent):
-                    self.on_sell_order_completed(item)
-                elif isinstance(item, OnStatus):
-                    status_msg = self.on_status()
-                    if status_msg:
-                        self.notify(f"Script status: {status_msg}")
-                elif isinstance(item, OnCommand):
-                    self.on_command(item.cmd, item.args)
-                elif isinstance(item, PmmMarketInfo):
-                    self.pmm_market_info = item
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                # Capturing traceback here and put it as part of ScriptError, which can then be reported in the parent
-                # process.
-                tb = "".join(traceback.TracebackException.from_exception(e).format())
-                self._child_queue.put(ScriptError(e, tb))
+                self.on_tick()
+            elif isinstance(item, BuyOrderCompletedEvent):
+                self.on_buy_order_completed(item)
+            elif isinstance(item, SellOrderCompletedEvent):
+                self.on_sell_order_completed(item)
+            elif isinstance(item, OnStatus):
+                status_msg = self.on_status()
+                if status_msg:
+                    self.notify(f"Script status: {status_msg}")
+            elif isinstance(item, OnCommand):
+                self.on_command(item.cmd, item.args)
+            elif isinstance(item, PmmMarketInfo):
+                self.pmm_market_info = item
+        except Exception as e:
+            # Capturing traceback here and put it as part of ScriptError, which can then be reported in the parent
+            # process.
+            tb = "".join(traceback.TracebackException.from_exception(e).format())
+            self._child_queue.put(ScriptError(e, tb))
 
     def notify(self, msg: str):
         """
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from multiprocessing import Pipe
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class ScriptChannel:
+    """
+    One way channel between the Hummingbot and the script processes, over a multiprocessing pipe.
+    The receiving process registers the pipe with its event loop, so that the messages are handled as soon as they
+    arrive instead of polling for them (event loops without add_reader support, e.g. the Windows proactor loop, read
+    the pipe from a thread instead). The messages put during the same event loop iteration are sent together, as a
+    single batch, from a sender thread so that a full pipe never blocks the event loop.
+    """
+
+    READER_THREAD_POLL_INTERVAL = 0.5
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self):
+        self._reader, self._writer = Pipe(duplex=False)
+        self._init_state()
+
+    def __getstate__(self):
+        # Only the pipe is passed on to the other process
+        return {"_reader": self._reader, "_writer": self._writer}
+
+    def __setstate__(self, state):
+        self._reader = state["_reader"]
+        self._writer = state["_writer"]
+        self._init_state()
+
+    def _init_state(self):
+        self._pending_items: List[Any] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._sender: Optional[ThreadPoolExecutor] = None
+        self._last_send: Optional[Future] = None
+        self._listening_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader_thread_stop: Optional[threading.Event] = None
+
+    def put(self, item: Any):
+        """
+        Queues the item to be sent on the next event loop iteration, or sends it right away if the loop isn't
+        running.
+        """
+        self._pending_items.append(item)
+        if self._flush_handle is None:
+            ev_loop = asyncio.get_event_loop()
+            if ev_loop.is_running():
+                self._flush_handle = ev_loop.call_soon(self._send_pending_items)
+            else:
+                self.flush()
+
+    def flush(self):
+        """
+        Sends the pending items right away, once the batches handed to the sender thread are sent. It blocks until
+        the items are written to the pipe, e.g. before the process exits.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._last_send is not None:
+            wait([self._last_send])
+            self._last_send = None
+        if len(self._pending_items) > 0:
+            items, self._pending_items = self._pending_items, []
+            self._writer.send(items)
+
+    def start_listening(self, callback: Callable[[Any], None]):
+        """
+        Calls back with each item received, from the current event loop.
+        """
+        self._listening_loop = asyncio.get_event_loop()
+        try:
+            self._listening_loop.add_reader(self._reader.fileno(), self._read_items, callback)
+        except NotImplementedError:
+            self._reader_thread_stop = threading.Event()
+            threading.Thread(target=self._read_items_in_thread,
+                             args=(self._listening_loop, callback, self._reader_thread_stop),
+                             daemon=True).start()
+
+    def stop_listening(self):
+        if self._reader_thread_stop is not None:
+            self._reader_thread_stop.set()
+            self._reader_thread_stop = None
+        elif self._listening_loop is not None:
+            self._listening_loop.remove_reader(self._reader.fileno())
+        self._listening_loop = None
+
+    def _send_pending_items(self):
+        self._flush_handle = None
+        if len(self._pending_items) > 0:
+            items, self._pending_items = self._pending_items, []
+            if self._sender is None:
+                # A single worker, so that the batches are sent in order
+                self._sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="script_channel")
+            self._last_send = self._sender.submit(self._send_items, items)
+
+    def _send_items(self, items: List[Any]):
+        try:
+            self._writer.send(items)
+        except Exception:
+            self.logger().error("Unexpected error sending items to the script channel.", exc_info=True)
+
+    def _read_items(self, callback: Callable[[Any], None]):
+        while self._reader.poll():
+            try:
+                items = self._reader.recv()
+            except EOFError:
+                self.stop_listening()
+                return
+            for item in items:
+                callback(item)
+
+    def _read_items_in_thread(self,
+                              ev_loop: asyncio.AbstractEventLoop,
+                              callback: Callable[[Any], None],
+                              stop_event: threading.Event):
+        while not stop_event.is_set():
+            try:
+                if not self._reader.poll(self.READER_THREAD_POLL_INTERVAL):
+                    continue
+                items = self._reader.recv()
+            except EOFError:
+                return
+            ev_loop.call_soon_threadsafe(self._call_back, callback, items, stop_event)
+
+    @staticmethod
+    def _call_back(callback: Callable[[Any], None], items: List[Any], stop_event: threading.Event):
+        for item in items:
+            if stop_event.is_set():
+                return
+            callback(item)
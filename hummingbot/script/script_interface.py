@@ -1,4 +1,5 @@
-from typing import Dict, List
+import time
+from typing import Any, Dict, List, Optional
 from decimal import Decimal
 
 child_queue = None
@@ -12,12 +13,14 @@ def set_child_queue(queue):
 class StrategyParameter(object):
     """
     A strategy parameter class that is used as a property for the collection class with its get and set method.
-    The set method detects if there is a value change it will put itself into the child queue.
+    The set method detects if there is a value change it will put itself into the child queue, along with the time it
+    was set at, used to measure how long it takes for the strategy to apply it.
     """
     def __init__(self, attr):
         self.name = attr
         self.attr = "_" + attr
         self.updated_value = None
+        self.updated_timestamp = None
 
     def __get__(self, obj, objtype):
         return getattr(obj, self.attr)
@@ -27,6 +30,7 @@ class StrategyParameter(object):
         old_value = getattr(obj, self.attr)
         if old_value is not None and old_value != value:
             self.updated_value = value
+            self.updated_timestamp = time.time()
             child_queue.put(self)
         setattr(obj, self.attr, value)
 
@@ -101,6 +105,16 @@ class PMMParameters:
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
+    def apply_updates(self, parameter_updates: Dict[str, Any]):
+        """
+        Sets the parameters received from the strategy, bypassing StrategyParameter so they aren't sent back.
+        """
+        for name, value in parameter_updates.items():
+            setattr(self, "_" + name, value)
+
+
+PMM_PARAMETER_NAMES = [name for name, value in PMMParameters.__dict__.items() if isinstance(value, StrategyParameter)]
+
 
 class PmmMarketInfo:
     def __init__(self, exchange: str,
@@ -113,10 +127,14 @@ class PmmMarketInfo:
 
 
 class OnTick:
+    """
+    To keep the messages small, pmm_parameters only has the parameters which changed since the previous tick, by
+    name, and the balances are None if they haven't changed.
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]],
-                 all_available_balances: Dict[str, Dict[str, Decimal]],
+                 pmm_parameters: Dict[str, Any],
+                 all_total_balances: Optional[Dict[str, Dict[str, Decimal]]],
+                 all_available_balances: Optional[Dict[str, Dict[str, Decimal]]],
                  ):
         self.mid_price = mid_price
         self.pmm_parameters = pmm_parameters
@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
 from hummingbot.core.time_iterator cimport TimeIterator
 
 
@@ -8,7 +9,6 @@ cdef class ScriptIterator(TimeIterator):
         str _script_file_path
         object _strategy
         object _markets
-        double _queue_check_interval
         object _event_pairs
         object _did_complete_buy_order_forwarder
         object _did_complete_sell_order_forwarder
@@ -17,5 +17,13 @@ cdef class ScriptIterator(TimeIterator):
         object _child_queue
         object _ev_loop
         object _script_process
-        object _listen_to_child_task
         bint _is_unit_testing_mode
+        dict _sent_parameters
+        object _sent_total_balances
+        object _sent_available_balances
+        int64_t _parameter_update_count
+        double _last_parameter_update_latency
+        double _total_parameter_update_latency
+        double _max_parameter_update_latency
+
+    cdef c_record_parameter_update_latency(self, double latency)
@@ -1,10 +1,15 @@
 # distutils: language=c++
 
-from typing import List
+from copy import deepcopy
+from typing import (
+    Any,
+    Dict,
+    List,
+)
 import asyncio
 import logging
-import traceback
-from multiprocessing import Process, Queue
+import time
+from multiprocessing import Process
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
@@ -14,12 +19,12 @@ from hummingbot.core.event.events import (
     MarketEvent,
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.script.script_channel import ScriptChannel
 from hummingbot.script.script_process import run_script
 from hummingbot.script.script_interface import (
     StrategyParameter,
-    PMMParameters,
+    PMM_PARAMETER_NAMES,
     OnTick,
     OnStatus,
     OnCommand,
@@ -33,6 +38,14 @@ sir_logger = None
 
 
 cdef class ScriptIterator(TimeIterator):
+    """
+    Runs the script in its own process and relays the strategy state and events to it, applying the strategy
+    parameters it updates.
+    The processes communicate through ScriptChannels, each handling the messages as soon as they are received. Each
+    tick only sends the strategy parameters and balances which changed since the previous one, and the latency
+    between the script setting a parameter and the strategy applying it is tracked.
+    """
+
     @classmethod
     def logger(cls):
         global sir_logger
@@ -44,14 +57,19 @@ cdef class ScriptIterator(TimeIterator):
                  script_file_path: str,
                  markets: List[ExchangeBase],
                  strategy: PureMarketMakingStrategy,
-                 queue_check_interval: float = 0.01,
                  is_unit_testing_mode: bool = False):
         super().__init__()
         self._script_file_path = script_file_path
         self._markets = markets
         self._strategy = strategy
         self._is_unit_testing_mode = is_unit_testing_mode
-        self._queue_check_interval = queue_check_interval
+        self._sent_parameters = {}
+        self._sent_total_balances = None
+        self._sent_available_balances = None
+        self._parameter_update_count = 0
+        self._last_parameter_update_latency = 0
+        self._total_parameter_update_latency = 0
+        self._max_parameter_update_latency = 0
         self._did_complete_buy_order_forwarder = SourceInfoEventForwarder(self._did_complete_buy_order)
         self._did_complete_sell_order_forwarder = SourceInfoEventForwarder(self._did_complete_sell_order)
         self._event_pairs = [
@@ -59,13 +77,13 @@ cdef class ScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
-        self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
+        self._parent_queue = ScriptChannel()
+        self._child_queue = ScriptChannel()
+        self._child_queue.start_listening(self.process_child_item)
 
         self._script_process = Process(
             target=run_script,
-            args=(script_file_path, self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(script_file_path, self._parent_queue, self._child_queue,)
         )
         self.logger().info(f"starting script in {script_file_path}")
         self._script_process.start()
@@ -74,6 +92,19 @@ cdef class ScriptIterator(TimeIterator):
     def strategy(self):
         return self._strategy
 
+    @property
+    def parameter_update_latency(self) -> Dict[str, Any]:
+        """
+        The count and the last, mean and max latencies (in seconds) of the strategy parameter updates from the script
+        """
+        return {
+            "count": self._parameter_update_count,
+            "last": self._last_parameter_update_latency,
+            "mean": (self._total_parameter_update_latency / self._parameter_update_count
+                     if self._parameter_update_count > 0 else 0),
+            "max": self._max_parameter_update_latency,
+        }
+
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
         for market in self._markets:
@@ -85,22 +116,34 @@ cdef class ScriptIterator(TimeIterator):
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._parent_queue.put(None)
-        self._child_queue.put(None)
+        self._parent_queue.flush()
         self._script_process.join()
-        if self._listen_to_child_task is not None:
-            self._listen_to_child_task.cancel()
+        self._child_queue.stop_listening()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+        cdef:
+            dict parameter_updates = {}
+            object all_total_balances = self.all_total_balances()
+            object all_available_balances = self.all_available_balances()
+        for name in PMM_PARAMETER_NAMES:
+            param_value = getattr(self._strategy, name)
+            if name not in self._sent_parameters or self._sent_parameters[name] != param_value:
+                # Copied, so that changes made in place (e.g. to order_override) are detected
+                self._sent_parameters[name] = deepcopy(param_value)
+                parameter_updates[name] = param_value
+        if all_total_balances == self._sent_total_balances:
+            all_total_balances = None
+        else:
+            self._sent_total_balances = all_total_balances
+        if all_available_balances == self._sent_available_balances:
+            all_available_balances = None
+        else:
+            self._sent_available_balances = all_available_balances
+        cdef object on_tick = OnTick(self.strategy.get_mid_price(), parameter_updates,
+                                     all_total_balances, all_available_balances)
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
@@ -115,30 +158,30 @@ cdef class ScriptIterator(TimeIterator):
                                  event: SellOrderCompletedEvent):
         self._parent_queue.put(event)
 
-    async def listen_to_child_queue(self):
-        while True:
-            try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._child_queue.get()
-                if item is None:
-                    break
-                if isinstance(item, StrategyParameter):
-                    self.logger().info(f"received: {str(item)}")
-                    setattr(self._strategy, item.name, item.updated_value)
-                elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
-                    # ignore this on unit testing as the below import will mess up unit testing.
-                    from hummingbot.client.hummingbot_application import HummingbotApplication
-                    HummingbotApplication.main_application()._notify(item.msg)
-                elif isinstance(item, CallLog):
-                    self.logger().info(f"script - {item.msg}")
-                elif isinstance(item, ScriptError):
-                    self.logger().info(f"{item}")
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().info("Unexpected error listening to child queue.", exc_info=True)
+    def process_child_item(self, item: Any):
+        try:
+            if isinstance(item, StrategyParameter):
+                self.c_record_parameter_update_latency(time.time() - item.updated_timestamp)
+                self.logger().info(f"received: {str(item)} "
+                                   f"(latency {self._last_parameter_update_latency * 1e3:.3f} ms)")
+                setattr(self._strategy, item.name, item.updated_value)
+            elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
+                # ignore this on unit testing as the below import will mess up unit testing.
+                from hummingbot.client.hummingbot_application import HummingbotApplication
+                HummingbotApplication.main_application()._notify(item.msg)
+            elif isinstance(item, CallLog):
+                self.logger().info(f"script - {item.msg}")
+            elif isinstance(item, ScriptError):
+                self.logger().info(f"{item}")
+        except Exception:
+            self.logger().info("Unexpected error processing script message.", exc_info=True)
+
+    cdef c_record_parameter_update_latency(self, double latency):
+        self._parameter_update_count += 1
+        self._last_parameter_update_latency = latency
+        self._total_parameter_update_latency += latency
+        if latency > self._max_parameter_update_latency:
+            self._max_parameter_update_latency = latency
 
     def request_status(self):
         self._parent_queue.put(OnStatus())
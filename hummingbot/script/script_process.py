@@ -3,16 +3,16 @@ import importlib
 import inspect
 import os
 
-from multiprocessing import Queue
 from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_channel import ScriptChannel
 from hummingbot.script.script_interface import set_child_queue, CallNotify
 
 
-def run_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_script(script_file_name: str, parent_queue: ScriptChannel, child_queue: ScriptChannel):
     try:
         script_class = import_script_sub_class(script_file_name)
         script = script_class()
-        script.assign_init(parent_queue, child_queue, queue_check_interval)
+        script.assign_init(parent_queue, child_queue)
         set_child_queue(child_queue)
         policy = asyncio.get_event_loop_policy()
         policy.set_event_loop(policy.new_event_loop())
@@ -23,6 +23,7 @@ def run_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, q
     except Exception as ex:
         child_queue.put(CallNotify(f'Failed to start script {script_file_name}:'))
         child_queue.put(CallNotify(f'{ex}'))
+        child_queue.flush()
 
 
 def import_script_sub_class(script_file_name: str):
@@ -9,13 +9,30 @@ cdef class RingBuffer:
         int64_t _stop_index
         int64_t _length
         bint _is_full
+        int64_t _valid_count
+        double _shift
+        double _shifted_sum
+        double _shifted_sum_of_squares
+        bint _track_extremes
+        int64_t _added_count
+        object _min_deque
+        object _max_deque
 
-    cdef void c_add_value(self, float val)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_index(self)
+    cdef void c_add_to_stats(self, double val)
+    cdef void c_remove_from_stats(self, double val)
+    cdef void c_add_to_extremes(self, double val)
+    cdef void c_recompute_stats(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef int64_t c_size(self)
+    cdef double c_sum_value(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef double c_min_value(self)
+    cdef double c_max_value(self)
+    cdef tuple c_get_segments(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
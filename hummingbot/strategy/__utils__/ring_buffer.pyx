@@ -1,11 +1,21 @@
 import numpy as np
 import logging
+from collections import deque
+from libc.math cimport isnan, sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last samples added to it, with running statistics.
+    The sum and sum of squares are kept shifted by a value close to the mean (re-centered each time the buffer wraps
+    around, when they are recomputed from the samples to drop accumulated rounding errors), so that the mean and
+    variance are O(1) without the cancellation of raw sums of squares. If track_extremes is set, the minimum and
+    maximum are also kept, through monotonic deques.
+    NaN samples are not part of the running sums, but as with numpy the statistics are NaN while the buffer holds one.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,19 +23,36 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int length, bint track_extremes=False):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._valid_count = 0
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
+        self._track_extremes = track_extremes
+        self._added_count = 0
+        self._min_deque = deque()
+        self._max_deque = deque()
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        if self._is_full:
+            # The oldest sample is about to be overwritten
+            self.c_remove_from_stats(self._buffer[self._stop_index])
         self._buffer[self._stop_index] = val
+        self.c_add_to_stats(val)
+        if self._track_extremes:
+            self.c_add_to_extremes(val)
+        self._added_count += 1
         self.c_increment_index()
+        if self._stop_index == 0:
+            self.c_recompute_stats()
 
     cdef void c_increment_index(self):
         self._stop_index = (self._stop_index + 1) % self._length
@@ -33,6 +60,53 @@ cdef class RingBuffer:
             self._is_full = True
             self._start_index = (self._start_index + 1) % self._length
 
+    cdef void c_add_to_stats(self, double val):
+        cdef double shifted
+        if isnan(val):
+            return
+        if self._valid_count == 0:
+            self._shift = val
+            self._shifted_sum = 0
+            self._shifted_sum_of_squares = 0
+        shifted = val - self._shift
+        self._valid_count += 1
+        self._shifted_sum += shifted
+        self._shifted_sum_of_squares += shifted * shifted
+
+    cdef void c_remove_from_stats(self, double val):
+        cdef double shifted
+        if isnan(val):
+            return
+        shifted = val - self._shift
+        self._valid_count -= 1
+        self._shifted_sum -= shifted
+        self._shifted_sum_of_squares -= shifted * shifted
+
+    cdef void c_add_to_extremes(self, double val):
+        cdef int64_t oldest_index = self._added_count - self._length
+        if not isnan(val):
+            while self._min_deque and self._min_deque[-1][1] >= val:
+                self._min_deque.pop()
+            self._min_deque.append((self._added_count, val))
+            while self._max_deque and self._max_deque[-1][1] <= val:
+                self._max_deque.pop()
+            self._max_deque.append((self._added_count, val))
+        while self._min_deque and self._min_deque[0][0] <= oldest_index:
+            self._min_deque.popleft()
+        while self._max_deque and self._max_deque[0][0] <= oldest_index:
+            self._max_deque.popleft()
+
+    cdef void c_recompute_stats(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+            np.ndarray[np.double_t, ndim=1] shifted
+        values = values[~np.isnan(values)]
+        self._valid_count = values.size
+        self._shift = np.mean(values) if values.size > 0 else 0
+        shifted = values - self._shift
+        self._shifted_sum = np.sum(shifted)
+        self._shifted_sum_of_squares = np.sum(np.square(shifted))
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (self._start_index==self._stop_index)
 
@@ -44,40 +118,72 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        if self._is_full:
+            return self._length
+        return self._stop_index - self._start_index
+
+    cdef double c_sum_value(self):
+        if self._valid_count < self.c_size():
+            return np.nan
+        return self._shifted_sum + self._valid_count * self._shift
+
     cdef double c_mean_value(self):
         result = np.nan
-        if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+        if self._is_full and self._valid_count == self._length:
+            result = self._shift + self._shifted_sum / self._length
         return result
 
     cdef double c_variance(self):
+        cdef double shifted_mean
         result = np.nan
-        if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+        if self._is_full and self._valid_count == self._length:
+            shifted_mean = self._shifted_sum / self._length
+            result = max(self._shifted_sum_of_squares / self._length - shifted_mean * shifted_mean, 0.0)
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
-        if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+        if self._is_full and self._valid_count == self._length:
+            result = sqrt(self.c_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef double c_min_value(self):
+        if self.c_is_empty() or self._valid_count < self.c_size():
+            return np.nan
+        if self._track_extremes:
+            return self._min_deque[0][1]
+        return np.min(self.c_get_as_numpy_array())
 
-        if not self._is_full:
-            indexes = np.arange(self._start_index, stop=self._stop_index, dtype=np.int16)
+    cdef double c_max_value(self):
+        if self.c_is_empty() or self._valid_count < self.c_size():
+            return np.nan
+        if self._track_extremes:
+            return self._max_deque[0][1]
+        return np.max(self.c_get_as_numpy_array())
+
+    cdef tuple c_get_segments(self):
+        """
+        Returns the samples as two read-only views of the buffer, the oldest ones first, which are only valid until the
+        next value is added. The second one is empty unless the samples wrap around the end of the buffer.
+        """
+        cdef:
+            np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
+            np.ndarray[np.double_t, ndim=1] older
+            np.ndarray[np.double_t, ndim=1] newer
+        if self._is_full:
+            # The oldest sample is the next one to be overwritten
+            older = buffer[self._stop_index:]
+            newer = buffer[:self._stop_index]
         else:
-            indexes = np.arange(self._start_index, stop=self._start_index + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            older = buffer[self._start_index:self._stop_index]
+            newer = buffer[:0]
+        older.flags.writeable = False
+        newer.flags.writeable = False
+        return older, newer
 
-    def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._start_index = 0
-        self._stop_index = 0
-        self._is_full = False
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return np.concatenate(self.c_get_segments())
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,6 +191,9 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_segments(self):
+        return self.c_get_segments()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -92,6 +201,14 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self):
+        return self.c_size()
+
+    @property
+    def sum_value(self):
+        return self.c_sum_value()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -103,3 +220,11 @@ cdef class RingBuffer:
     @property
     def variance(self):
         return self.c_variance()
+
+    @property
+    def min_value(self):
+        return self.c_min_value()
+
+    @property
+    def max_value(self):
+        return self.c_max_value()
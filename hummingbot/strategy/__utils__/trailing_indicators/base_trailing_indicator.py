@@ -34,7 +34,9 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        if self._processing_buffer.size == 0:
+            return np.nan
+        return self._processing_buffer.sum_value / self._processing_buffer.size
 
     @property
     def current_value(self) -> float:
@@ -1,18 +1,31 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log returns between consecutive prices of the sampling buffer
+        self._log_returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+        self._last_log_price = None
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
+        log_price = np.log(self._sampling_buffer.get_last_value())
+        if self._last_log_price is not None:
+            self._log_returns_buffer.add_value(log_price - self._last_log_price)
+        self._last_log_price = log_price
+        if self._log_returns_buffer.is_full:
+            return self._log_returns_buffer.variance
+        log_returns = self._log_returns_buffer.get_as_numpy_array()
+        if log_returns.size > 0:
             return np.var(log_returns)
+        return np.nan
 
     def _processing_calculation(self) -> float:
+        mean = self._processing_buffer.mean_value
+        if not np.isnan(mean):
+            return np.sqrt(mean)
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
@@ -1,17 +1,28 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The squared differences between consecutive samples of the sampling buffer
+        self._squared_diffs_buffer = RingBuffer(max(sampling_length - 1, 1))
+        self._previous_sample = None
 
     def _indicator_calculation(self) -> float:
         # The variance should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        samples_count = self._sampling_buffer.size
+        last_sample = self._sampling_buffer.get_last_value()
+        if self._previous_sample is not None:
+            self._squared_diffs_buffer.add_value((last_sample - self._previous_sample) ** 2)
+        self._previous_sample = last_sample
+        if samples_count > 1:
+            vol = np.sqrt(self._squared_diffs_buffer.sum_value / samples_count)
+        else:
+            vol = 0.0
         return vol
 
     def _processing_calculation(self) -> float:
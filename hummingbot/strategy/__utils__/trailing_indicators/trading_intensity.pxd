@@ -5,11 +5,23 @@ cdef class TradingIntensityIndicator():
     cdef:
         double _alpha
         double _kappa
-        list _trades
-        object _bids_df
-        object _asks_df
+        object _trades
+        object _bids
+        object _asks
         int _sampling_length
         int _samples_length
+        bint _nonlinear_fit
+        dict _volumes
+        dict _trade_counts
+        double _sum_levels
+        double _sum_squared_levels
+        double _sum_log_volumes
+        double _sum_level_log_volumes
+        int64_t _samples_since_recompute
 
-    cdef c_simulate_execution(self, bids_df, asks_df)
+    cdef c_simulate_execution(self, bids, asks)
+    cdef c_add_trades(self, list levels, list amounts)
+    cdef c_remove_trades(self, list levels, list amounts)
+    cdef c_add_level_contribution(self, double level, double volume, double sign)
+    cdef c_recompute_sums(self)
     cdef c_estimate_intensity(self)
@@ -1,162 +1,228 @@
-from decimal import Decimal
-from math import floor, ceil
+from collections import deque
+from libc.math cimport exp, log
 import numpy as np
 import pandas as pd
 from scipy.optimize import curve_fit
 from scipy.optimize import OptimizeWarning
 from typing import (
     Tuple,
+    Union,
 )
 import warnings
 
+# Volume used in place of zero to be able to calculate its log
+cdef double MIN_VOLUME = 1e-10
 
-cdef class TradingIntensityIndicator():
 
-    def __init__(self, sampling_length: int = 30):
+cdef class TradingIntensityIndicator():
+    """
+    Estimates the trading intensity, lambda = alpha * exp(-kappa * price_level), from the market orders which would
+    explain the changes between consecutive order book samples.
+    The volume executed at each price level over the sampling window is consolidated incrementally, as are the sums of
+    a least squares fit of log(lambda) on the price level, so that each sample costs O(depth). If nonlinear_fit is set,
+    alpha and kappa are instead fitted with scipy's curve_fit on the consolidated volumes, as the indicator used to.
+    """
+
+    def __init__(self, sampling_length: int = 30, nonlinear_fit: bool = False):
         self._alpha = 0
         self._kappa = 0
-        self._trades = []
-        self._bids_df = None
-        self._asks_df = None
+        # The (price levels, amounts) of the market orders estimated for each of the last samples
+        self._trades = deque()
+        self._bids = None
+        self._asks = None
         self._sampling_length = sampling_length
         self._samples_length = 0
+        self._nonlinear_fit = nonlinear_fit
+        self._volumes = {}
+        self._trade_counts = {}
+        self._sum_levels = 0
+        self._sum_squared_levels = 0
+        self._sum_log_volumes = 0
+        self._sum_level_log_volumes = 0
+        self._samples_since_recompute = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
-    def _simulate_execution(self, bids_df, asks_df):
-        self.c_simulate_execution(bids_df, asks_df)
+    def _simulate_execution(self, bids, asks):
+        bids, asks = self._depth_arrays((bids, asks))
+        self.c_simulate_execution(bids, asks)
 
-    cdef c_simulate_execution(self, new_bids_df, new_asks_df):
+    cdef c_simulate_execution(self, bids, asks):
         cdef:
-            object _bids_df = self._bids_df
-            object _asks_df = self._asks_df
-            object bids_df = new_bids_df
-            object asks_df = new_asks_df
-            int _sampling_length = self._sampling_length
-            object bid
-            object ask
-            object price
-            object bid_prev
-            object ask_prev
-            object price_prev
-            list trades
+            double bid = bids[0, 0]
+            double ask = asks[0, 0]
+            double price_prev = (self._bids[0, 0] + self._asks[0, 0]) / 2
+            Py_ssize_t bids_filled
+            Py_ssize_t asks_filled
+            list levels_list
+            list amounts_list
+            list removed_levels
+            list removed_amounts
 
         # Estimate market orders that happened
         # Assume every movement in the BBO is caused by a market order and its size is the volume differential
 
-        bid = bids_df["price"].iloc[0]
-        ask = asks_df["price"].iloc[0]
-        price = (bid + ask) / 2
-
-        bid_prev = _bids_df["price"].iloc[0]
-        ask_prev = _asks_df["price"].iloc[0]
-        price_prev = (bid_prev + ask_prev) / 2
-
-        trades = []
-
         # Higher bids were filled - someone matched them - a determined seller
         # Equal bids - if amount lower - partially filled
-        for index, row in _bids_df[_bids_df['price'] >= bid].iterrows():
-            if row['price'] == bid:
-                if bids_df["amount"].iloc[0] < row['amount']:
-                    amount = row['amount'] - bids_df["amount"].iloc[0]
-                    price_level = abs(row['price'] - price_prev)
-                    trades += [{'price_level': price_level, 'amount': amount}]
-            else:
-                amount = row['amount']
-                price_level = abs(row['price'] - price_prev)
-                trades += [{'price_level': price_level, 'amount': amount}]
+        bids_filled = np.searchsorted(-self._bids[:, 0], -bid, side="right")
+        filled_bids = self._bids[:bids_filled]
+        bid_amounts = filled_bids[:, 1].copy()
+        bid_partially_filled = filled_bids[:, 0] == bid
+        bid_amounts[bid_partially_filled] -= bids[0, 1]
+        bid_executed = ~bid_partially_filled | (bid_amounts > 0)
 
         # Lower asks were filled - someone matched them - a determined buyer
         # Equal asks - if amount lower - partially filled
-        for index, row in _asks_df[_asks_df['price'] <= ask].iterrows():
-            if row['price'] == ask:
-                if asks_df["amount"].iloc[0] < row['amount']:
-                    amount = row['amount'] - asks_df["amount"].iloc[0]
-                    price_level = abs(row['price'] - price_prev)
-                    trades += [{'price_level': price_level, 'amount': amount}]
-            else:
-                amount = row['amount']
-                price_level = abs(row['price'] - price_prev)
-                trades += [{'price_level': price_level, 'amount': amount}]
+        asks_filled = np.searchsorted(self._asks[:, 0], ask, side="right")
+        filled_asks = self._asks[:asks_filled]
+        ask_amounts = filled_asks[:, 1].copy()
+        ask_partially_filled = filled_asks[:, 0] == ask
+        ask_amounts[ask_partially_filled] -= asks[0, 1]
+        ask_executed = ~ask_partially_filled | (ask_amounts > 0)
+
+        levels = np.abs(np.concatenate((filled_bids[bid_executed, 0], filled_asks[ask_executed, 0])) - price_prev)
+        amounts = np.concatenate((bid_amounts[bid_executed], ask_amounts[ask_executed]))
+        levels_list = levels.tolist()
+        amounts_list = amounts.tolist()
 
         # Add trades
-        self._trades += [trades]
-        if len(self._trades) > _sampling_length:
-            self._trades = self._trades[1:]
+        if len(self._trades) == self._sampling_length:
+            removed_levels, removed_amounts = self._trades.popleft()
+            self.c_remove_trades(removed_levels, removed_amounts)
+        self._trades.append((levels_list, amounts_list))
+        self.c_add_trades(levels_list, amounts_list)
+
+        self._samples_since_recompute += 1
+        if self._samples_since_recompute >= self._sampling_length:
+            # Drops the rounding errors accumulated by adding and removing volumes
+            self.c_recompute_sums()
+
+    cdef c_add_trades(self, list levels, list amounts):
+        cdef:
+            double level
+            double amount
+        for level, amount in zip(levels, amounts):
+            volume = self._volumes.get(level)
+            if volume is None:
+                self._trade_counts[level] = 1
+                volume = amount
+            else:
+                self._trade_counts[level] += 1
+                self.c_add_level_contribution(level, volume, -1)
+                volume += amount
+            self._volumes[level] = volume
+            self.c_add_level_contribution(level, volume, 1)
+
+    cdef c_remove_trades(self, list levels, list amounts):
+        cdef:
+            double level
+            double amount
+        for level, amount in zip(levels, amounts):
+            volume = self._volumes[level]
+            self.c_add_level_contribution(level, volume, -1)
+            self._trade_counts[level] -= 1
+            if self._trade_counts[level] == 0:
+                del self._trade_counts[level]
+                del self._volumes[level]
+            else:
+                volume -= amount
+                self._volumes[level] = volume
+                self.c_add_level_contribution(level, volume, 1)
+
+    cdef c_add_level_contribution(self, double level, double volume, double sign):
+        cdef double log_volume = log(volume if volume > 0 else MIN_VOLUME)
+        self._sum_levels += sign * level
+        self._sum_squared_levels += sign * level * level
+        self._sum_log_volumes += sign * log_volume
+        self._sum_level_log_volumes += sign * level * log_volume
+
+    cdef c_recompute_sums(self):
+        self._sum_levels = 0
+        self._sum_squared_levels = 0
+        self._sum_log_volumes = 0
+        self._sum_level_log_volumes = 0
+        for level, volume in self._volumes.items():
+            self.c_add_level_contribution(level, volume, 1)
+        self._samples_since_recompute = 0
 
     def _estimate_intensity(self):
         self.c_estimate_intensity()
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
+            Py_ssize_t n = len(self._volumes)
+            double denominator
+            double slope
             list price_levels
+            list lambdas_adj
+
+        if self._nonlinear_fit:
+            price_levels = sorted(self._volumes, reverse=True)
+            # Adjust to be able to calculate log
+            lambdas_adj = [self._volumes[price_level] or MIN_VOLUME for price_level in price_levels]
+
+            # Fit the probability density function; reuse previously calculated parameters as initial values
+            try:
+                params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+                                   price_levels,
+                                   lambdas_adj,
+                                   p0=(self._alpha, self._kappa),
+                                   method='dogbox',
+                                   bounds=([0, 0], [np.inf, np.inf]))
+
+                self._kappa = params[0][1]
+                self._alpha = params[0][0]
+            except (RuntimeError, ValueError) as e:
+                pass
+            return
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for tick in self._trades:
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            if len(lambdas) == 0:
-                lambdas += [trades_consolidated[price_level]]
-            else:
-                lambdas += [trades_consolidated[price_level]]
-
-        # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
-
-    def add_sample(self, value: Tuple[pd.DataFrame, pd.DataFrame]):
-        bids_df = value[0]
-        asks_df = value[1]
-
-        if bids_df.empty or asks_df.empty:
+        # Least squares fit of log(lambda) = log(alpha) - kappa * price_level
+        if n < 2:
+            return
+        denominator = n * self._sum_squared_levels - self._sum_levels * self._sum_levels
+        if denominator <= 0:
+            return
+        slope = (n * self._sum_level_log_volumes - self._sum_levels * self._sum_log_volumes) / denominator
+        self._kappa = max(-slope, 0)
+        self._alpha = exp((self._sum_log_volumes + self._kappa * self._sum_levels) / n)
+
+    @staticmethod
+    def _depth_arrays(value: Tuple[Union[np.ndarray, pd.DataFrame], Union[np.ndarray, pd.DataFrame]]):
+        depth_arrays = []
+        for side in value:
+            if isinstance(side, pd.DataFrame):
+                side = side[["price", "amount"]]
+            depth_arrays.append(np.asarray(side, dtype=np.float64)[:, :2])
+        return depth_arrays
+
+    def add_sample(self, value: Tuple[Union[np.ndarray, pd.DataFrame], Union[np.ndarray, pd.DataFrame]]):
+        """
+        :param value: the bids and asks of the order book, either as the top levels arrays of
+        OrderBook.depth_arrays (or any array whose first columns are the price and amount) or as snapshot DataFrames
+        """
+        bids, asks = self._depth_arrays(value)
+
+        if bids.shape[0] == 0 or asks.shape[0] == 0:
             return
 
         # Skip snapshots where no trades occured
-        if self._bids_df is not None and self._bids_df.equals(bids_df):
+        if self._bids is not None and np.array_equal(self._bids, bids):
             return
 
-        if self._asks_df is not None and self._asks_df.equals(asks_df):
+        if self._asks is not None and np.array_equal(self._asks, asks):
             return
 
-        if self._bids_df is not None and self._asks_df is not None:
+        if self._bids is not None and self._asks is not None:
             # Retrieve previous order book, evaluate execution
-            self.c_simulate_execution(bids_df, asks_df)
+            self.c_simulate_execution(bids, asks)
 
             if self.is_sampling_buffer_full:
                 # Estimate alpha and kappa
                 self.c_estimate_intensity()
 
-        # Store the orderbook
-        self._bids_df = bids_df
-        self._asks_df = asks_df
+        # Store the orderbook, the arrays passed may be buffers reused by the caller
+        self._bids = bids.copy()
+        self._asks = asks.copy()
 
     @property
     def current_value(self) -> Tuple[float, float]:
@@ -46,6 +46,8 @@ NaN = float("nan")
 s_decimal_zero = Decimal(0)
 s_decimal_neg_one = Decimal(-1)
 s_decimal_one = Decimal(1)
+# Number of levels of each side of the order book sampled for trading intensity estimation
+TRADING_INTENSITY_DEPTH_LEVELS = 500
 pmm_logger = None
 
 
@@ -662,9 +664,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._last_sampling_timestamp = timestamp
 
         price = self.get_price()
-        snapshot = self.get_order_book_snapshot()
+        depth = self._market_info.order_book.depth_arrays(TRADING_INTENSITY_DEPTH_LEVELS)
         self._avg_vol.add_sample(price)
-        self._trading_intensity.add_sample(snapshot)
+        self._trading_intensity.add_sample(depth)
         # Calculate adjustment factor to have 0.01% of inventory resolution
         base_balance = market.get_balance(base_asset)
         quote_balance = market.get_balance(quote_asset)
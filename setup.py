@@ -143,7 +143,8 @@ def main():
           ],
           scripts=[
               "bin/hummingbot.py",
-              "bin/hummingbot_quickstart.py"
+              "bin/hummingbot_quickstart.py",
+              "bin/hummingbot_sweep.py"
           ],
           cmdclass={'build_ext': BuildExt},
           )
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""
+Measures AsyncThrottler acquire latency with 10k tasks logged in the sliding window, and compares the capacity check
+against a full scan of the task logs (the accounting the throttler did before TaskLogWindow).
+
+Usage: python test/debug/benchmark_async_throttler.py
+"""
+
+import asyncio
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+
+NUM_LOGGED_TASKS = 10000
+NUM_ACQUIRES = 2000
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+RATE_LIMITS = [
+    RateLimit(limit_id=REQUEST_WEIGHT, limit=10 ** 9, time_interval=60),
+    RateLimit(limit_id="ORDERS", limit=10 ** 9, time_interval=10),
+    RateLimit(limit_id="/api/v3/depth", limit=10 ** 9, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 10)]),
+    RateLimit(limit_id="/api/v3/order", limit=10 ** 9, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 1), LinkedLimitWeightPair("ORDERS", 1)]),
+]
+
+
+def full_scan_capacity_check(task_logs, related_limits, safety_margin_pct: float) -> bool:
+    now = time.time()
+    for rate_limit, weight in related_limits:
+        capacity_used = sum([task.weight
+                             for task in task_logs
+                             if rate_limit.limit_id == task.rate_limit.limit_id and
+                             now - task.timestamp - (task.rate_limit.time_interval * safety_margin_pct) <= task.rate_limit.time_interval])
+        if capacity_used + weight > rate_limit.limit:
+            return False
+    return True
+
+
+async def acquire_many(throttler: AsyncThrottler):
+    for _ in range(NUM_ACQUIRES):
+        async with throttler.execute_task("/api/v3/order"):
+            pass
+
+
+def main():
+    throttler = AsyncThrottler(RATE_LIMITS)
+    now = time.time()
+    for i in range(NUM_LOGGED_TASKS):
+        rate_limit = throttler._id_to_limit_map[RATE_LIMITS[i % len(RATE_LIMITS)].limit_id]
+        throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=1))
+    logged_tasks = list(throttler._task_logs)
+    _, related_limits = throttler.get_related_limits("/api/v3/order")
+
+    start = time.perf_counter()
+    for _ in range(NUM_ACQUIRES // 20):
+        full_scan_capacity_check(logged_tasks, related_limits, throttler._safety_margin_pct)
+    full_scan = (time.perf_counter() - start) / (NUM_ACQUIRES // 20)
+
+    start = time.perf_counter()
+    asyncio.get_event_loop().run_until_complete(acquire_many(throttler))
+    acquire = (time.perf_counter() - start) / NUM_ACQUIRES
+
+    print(f"{NUM_LOGGED_TASKS} logged tasks, {len(related_limits)} related limits per request")
+    print(f"  full scan capacity check: {full_scan * 1e6:10.2f} us")
+    print(f"  acquire (TaskLogWindow):  {acquire * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Replays a synthetic recorded market (a snapshot, then a diff every 100 ms and a trade every second) through a
+BacktestExchange with a pure market making strategy on a BACKTEST mode clock, and measures how much faster than real
+time it runs.
+
+Usage: python test/debug/benchmark_backtest_replay.py [simulated hours, defaults to 1]
+"""
+
+import random
+import time
+from decimal import Decimal
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+from typing import Iterator
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.exchange.paper_trade.replay_order_book_tracker import (
+    ReplayOrderBookTracker,
+    message_from_record,
+)
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "COINALPHA-HBOT"
+START_TIMESTAMP = 1640995200.0
+DIFF_INTERVAL = 0.1
+DEPTH_LEVELS = 50
+PRICE_STEP = 0.01
+
+
+def recorded_messages(duration: float) -> Iterator[OrderBookMessage]:
+    mid_price = 100.0
+    levels = [i * PRICE_STEP for i in range(1, DEPTH_LEVELS + 1)]
+    yield message_from_record({
+        "type": "snapshot", "timestamp": START_TIMESTAMP, "trading_pair": TRADING_PAIR, "update_id": 1,
+        "bids": [[mid_price - level, random.uniform(1, 10)] for level in levels],
+        "asks": [[mid_price + level, random.uniform(1, 10)] for level in levels]})
+    update_id = 1
+    trade_id = 0
+    timestamp = START_TIMESTAMP
+    while timestamp < START_TIMESTAMP + duration:
+        timestamp += DIFF_INTERVAL
+        update_id += 1
+        mid_price = max(1.0, round(mid_price + random.choice((-PRICE_STEP, 0, PRICE_STEP)), 2))
+        yield message_from_record({
+            "type": "diff", "timestamp": timestamp, "trading_pair": TRADING_PAIR, "update_id": update_id,
+            "bids": [[mid_price - level, random.uniform(0, 10)] for level in random.sample(levels, 5)],
+            "asks": [[mid_price + level, random.uniform(0, 10)] for level in random.sample(levels, 5)]})
+        if update_id % 10 == 0:
+            trade_id += 1
+            yield message_from_record({
+                "type": "trade", "timestamp": timestamp, "trading_pair": TRADING_PAIR, "trade_id": trade_id,
+                "trade_type": random.choice(("buy", "sell")), "price": mid_price, "amount": random.uniform(0.1, 2)})
+
+
+def main():
+    duration = float(sys.argv[1]) * 3600 if len(sys.argv) > 1 else 3600.0
+    tracker = ReplayOrderBookTracker(recorded_messages(duration), [TRADING_PAIR], "binance")
+    market = BacktestExchange(tracker, MarketConfig.default_config(), BinanceExchange)
+    market.set_balance("COINALPHA", Decimal("1000"))
+    market.set_balance("HBOT", Decimal("100000"))
+    market.set_quantization_param(QuantizationParams(TRADING_PAIR, 6, 6, 6, 6))
+    strategy = PureMarketMakingStrategy()
+    strategy.init_params(
+        MarketTradingPairTuple(market, TRADING_PAIR, "COINALPHA", "HBOT"),
+        bid_spread=Decimal("0.001"),
+        ask_spread=Decimal("0.001"),
+        order_amount=Decimal("1"),
+        order_refresh_time=5.0,
+        filled_order_delay=5.0,
+        order_levels=3,
+        order_level_spread=Decimal("0.001"),
+        minimum_spread=-1,
+    )
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + duration)
+    clock.add_iterator(market)
+    clock.add_iterator(strategy)
+
+    start = time.perf_counter()
+    clock.backtest()
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {duration / 3600:.1f} hours, {tracker.replayed_messages_count} messages, in {elapsed:.1f} s: "
+          f"{tracker.replayed_messages_count / elapsed:,.0f} messages/s, {duration / elapsed:,.0f}x real time")
+    print(f"Balances: {market.get_all_balances()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+Records a synthetic stream of order book diffs and trades with MarketDataRecorder, then reads it back through the
+memory mapped MarketDataReader, and compares both with writing and parsing the same messages as JSON lines.
+
+Usage: python test/debug/benchmark_market_data_recorder.py [message count, defaults to 200000]
+"""
+
+import json
+import random
+import tempfile
+import time
+from os.path import getsize, join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+from typing import List
+
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataReader,
+    MarketDataRecorder,
+    data_file_path,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def synthetic_messages(count: int) -> List[OrderBookMessage]:
+    messages = []
+    timestamp = 1640995200.0
+    for update_id in range(1, count + 1):
+        timestamp += 0.01
+        if update_id % 10 == 0:
+            messages.append(OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": TRADING_PAIR, "trade_type": 1.0, "trade_id": update_id, "update_id": update_id,
+                "price": f"{random.uniform(99, 101):.2f}", "amount": f"{random.uniform(0, 2):.4f}"}, timestamp))
+        else:
+            messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": TRADING_PAIR, "update_id": update_id,
+                "bids": [[f"{random.uniform(95, 100):.2f}", f"{random.uniform(0, 10):.4f}"] for _ in range(5)],
+                "asks": [[f"{random.uniform(100, 105):.2f}", f"{random.uniform(0, 10):.4f}"] for _ in range(5)]},
+                timestamp))
+    return messages
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    messages = synthetic_messages(count)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        recorder = MarketDataRecorder(directory)
+        for message in messages:
+            recorder.record_message(message)
+        recorder.close()
+        record_time = time.perf_counter() - start
+
+        json_path = join(directory, "messages.jsonl")
+        start = time.perf_counter()
+        with open(json_path, "w") as json_file:
+            for message in messages:
+                json_file.write(json.dumps({"type": message.type.name, "timestamp": message.timestamp,
+                                            **message.content}) + "\n")
+        json_write_time = time.perf_counter() - start
+
+        path = data_file_path(directory, TRADING_PAIR)
+        start = time.perf_counter()
+        reader = MarketDataReader(path)
+        columns = reader.read()
+        traded_volume = columns["amount"][columns["row_type"] >= 4].sum()
+        read_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(json_path) as json_file:
+            json_volume = sum(float(record["amount"]) for record in map(json.loads, json_file)
+                              if record["type"] == "TRADE")
+        json_read_time = time.perf_counter() - start
+
+        print(f"{count} messages, {reader.row_count} rows")
+        print(f"Record: {record_time:.3f} s ({count / record_time:,.0f} messages/s), {getsize(path) / 1e6:.1f} MB | "
+              f"JSON lines: {json_write_time:.3f} s, {getsize(json_path) / 1e6:.1f} MB")
+        print(f"Traded volume: mmap read {read_time * 1e3:.1f} ms | JSON lines parse {json_read_time * 1e3:.1f} ms "
+              f"({traded_volume:.4f} vs {json_volume:.4f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""
+Measures the OrderBook volume queries (price / VWAP for volume) on a deep book, comparing the cumulative depth index
+against walking the book entry by entry.
+
+Usage: python test/debug/benchmark_order_book_depth_queries.py
+"""
+
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+NUM_LEVELS = 5000
+NUM_QUERIES = 10000
+
+
+def walk_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def build_order_book() -> OrderBook:
+    order_book = OrderBook()
+    prices = np.arange(1, NUM_LEVELS + 1, dtype=np.float64)
+    amounts = np.random.uniform(0.1, 2.0, NUM_LEVELS)
+    update_ids = np.ones(NUM_LEVELS)
+    bids = np.column_stack([100 - prices * 0.01, amounts, update_ids])
+    asks = np.column_stack([100 + prices * 0.01, amounts, update_ids])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def main():
+    order_book = build_order_book()
+    volumes = np.random.uniform(1, NUM_LEVELS, NUM_QUERIES)
+
+    start = time.perf_counter()
+    for volume in volumes:
+        order_book.get_price_for_volume(True, volume)
+        order_book.get_vwap_for_volume(False, volume)
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for volume in volumes[:NUM_QUERIES // 100]:
+        walk_price_for_volume(order_book, True, volume)
+        walk_price_for_volume(order_book, False, volume)
+    walked = (time.perf_counter() - start) * 100
+
+    # Every query after a diff has to rebuild the index once.
+    diff = np.array([[100 + 0.005, 1.0, 2]], dtype=np.float64)
+    start = time.perf_counter()
+    for volume in volumes[:NUM_QUERIES // 10]:
+        order_book.apply_numpy_diffs(np.empty((0, 3)), diff)
+        order_book.get_price_for_volume(True, volume)
+    rebuilt = (time.perf_counter() - start) * 10
+
+    print(f"{NUM_LEVELS} levels, {NUM_QUERIES} x 2 queries")
+    print(f"  depth index:            {indexed * 1e6 / (NUM_QUERIES * 2):10.2f} us/query")
+    print(f"  entry walk:             {walked * 1e6 / (NUM_QUERIES * 2):10.2f} us/query")
+    print(f"  diff + index rebuild:   {rebuilt * 1e6 / NUM_QUERIES:10.2f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""
+Compares applying exchange diffs through OrderBookMessage.bids/asks + OrderBook.apply_diffs with the raw
+ingestion path, OrderBook.apply_raw_diffs, on Binance-like depth update payloads.
+
+Usage: python test/debug/benchmark_order_book_diff_ingestion.py
+"""
+
+import random
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+NUM_MESSAGES = 20000
+LEVELS_PER_SIDE = 20
+
+
+def random_levels(mid: float):
+    return [[f"{mid + random.uniform(-1, 1):.8f}", f"{random.choice([0, random.uniform(0, 10)]):.8f}"]
+            for _ in range(LEVELS_PER_SIDE)]
+
+
+def build_messages():
+    return [OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "BTC-USDT",
+        "update_id": update_id,
+        "bids": random_levels(99),
+        "asks": random_levels(101),
+    }, timestamp=update_id) for update_id in range(NUM_MESSAGES)]
+
+
+def main():
+    messages = build_messages()
+
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    rows = time.perf_counter() - start
+
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+    raw = time.perf_counter() - start
+
+    print(f"{NUM_MESSAGES} diffs with {LEVELS_PER_SIDE} levels per side")
+    print(f"  OrderBookRow path:  {rows * 1e6 / NUM_MESSAGES:8.2f} us/diff")
+    print(f"  raw path:           {raw * 1e6 / NUM_MESSAGES:8.2f} us/diff")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+"""
+Places a 20 level grid of limit orders on each of 20 trading pairs of a paper trade exchange, then times the available
+balance lookups budget checks do.
+
+Usage: python test/debug/benchmark_paper_trade_balances.py
+"""
+
+import time
+from decimal import Decimal
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.core.event.events import OrderType
+from test.mock.mock_paper_exchange import MockPaperExchange
+
+PAIR_COUNT = 20
+LEVELS = 20
+LOOKUPS = 10000
+
+
+def main():
+    market = MockPaperExchange()
+    trading_pairs = [f"COIN{i}-HBOT" for i in range(PAIR_COUNT)]
+    market.set_balance("HBOT", Decimal("1e9"))
+    for trading_pair in trading_pairs:
+        market.set_balanced_order_book(trading_pair, 100, 50, 150, 1, 10)
+        market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        market.set_balance(trading_pair.split("-")[0], Decimal("1e6"))
+        for level in range(1, LEVELS + 1):
+            market.buy(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(100 - level))
+            market.sell(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(100 + level))
+
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        market.get_available_balance("HBOT")
+    elapsed = time.perf_counter() - start
+    print(f"{len(market.limit_orders)} open orders: {elapsed / LOOKUPS * 1e6:.2f} us per available balance lookup, "
+          f"HBOT available {market.get_available_balance('HBOT')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""
+Compares the column-wise performance report (PerformanceMetrics.create_from_frame, with the trades read by
+HistoryCommand._get_trades_frame_from_session) with the Decimal one (PerformanceMetrics.create, with the trades read as
+TradeFill objects), on the fills of a perpetual market making bot.
+
+Usage: python test/debug/benchmark_performance_metrics.py [number of fills]
+"""
+
+import asyncio
+import json
+import sqlite3
+import tempfile
+import time
+from decimal import Decimal
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import numpy as np
+
+from hummingbot.client.command.export_command import ExportCommand
+from hummingbot.client.command.history_command import HistoryCommand
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+NUM_FILLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+# The Decimal report is timed on the most recent fills only
+NUM_DECIMAL_FILLS = min(NUM_FILLS, 50000)
+CONFIG_FILE = "conf_perpetual_mm_1.yml"
+EXCHANGE = "benchmark_perpetual"
+TRADING_PAIR = "BTC-USDT"
+BALANCES = {"BTC": Decimal("0"), "USDT": Decimal("100000")}
+
+
+def populate(db_path: str):
+    rng = np.random.default_rng(42)
+    start_timestamp = 1600000000000
+    prices = (50000 + np.cumsum(rng.normal(0, 5, NUM_FILLS))) * 1e6
+    amounts = rng.integers(1000, 100000, NUM_FILLS) * 1e1
+    is_buy = rng.random(NUM_FILLS) < 0.5
+    is_open = rng.random(NUM_FILLS) < 0.5
+    fee = json.dumps({"percent": 0.0002, "percent_token": None, "flat_fees": []})
+    conn = sqlite3.connect(db_path)
+    rows = []
+    order_index = 0
+    for i in range(NUM_FILLS):
+        # Orders are filled in one to three steps
+        if i == 0 or rng.random() < 0.5:
+            order_index = i
+        rows.append((CONFIG_FILE, "perpetual_market_making", EXCHANGE, TRADING_PAIR, "BTC", "USDT",
+                     start_timestamp + i * 100, f"order-{order_index}", "BUY" if is_buy[order_index] else "SELL",
+                     "LIMIT", int(prices[i]), int(amounts[i]), 1, fee, f"T{i}",
+                     "OPEN" if is_open[order_index] else "CLOSE"))
+    conn.executemany('insert into TradeFill (config_file_path, strategy, market, symbol, base_asset, '
+                     'quote_asset, timestamp, order_id, trade_type, order_type, price, amount, leverage, '
+                     'trade_fee, exchange_trade_id, position) '
+                     'values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+    conn.commit()
+    conn.close()
+    return start_timestamp
+
+
+def main():
+    ev_loop = asyncio.get_event_loop()
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_path = join(db_dir, "trades.sqlite")
+        sql_manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+        start = time.perf_counter()
+        start_timestamp = populate(db_path)
+        print(f"Populated {NUM_FILLS} fills in {time.perf_counter() - start:.1f}s")
+
+        with sql_manager.get_new_session() as session:
+            start = time.perf_counter()
+            trades_frame = HistoryCommand._get_trades_frame_from_session(None, start_timestamp, session, CONFIG_FILE)
+            frame_load_time = time.perf_counter() - start
+            start = time.perf_counter()
+            frame_metrics = ev_loop.run_until_complete(
+                PerformanceMetrics.create_from_frame(EXCHANGE, TRADING_PAIR, trades_frame, BALANCES))
+            frame_metrics_time = time.perf_counter() - start
+
+            decimal_start_timestamp = start_timestamp + (NUM_FILLS - NUM_DECIMAL_FILLS) * 100
+            start = time.perf_counter()
+            trades = ExportCommand._get_trades_from_session(None, decimal_start_timestamp, session,
+                                                            config_file_path=CONFIG_FILE)
+            decimal_load_time = time.perf_counter() - start
+            start = time.perf_counter()
+            decimal_metrics = ev_loop.run_until_complete(
+                PerformanceMetrics.create(EXCHANGE, TRADING_PAIR, trades, BALANCES))
+            decimal_metrics_time = time.perf_counter() - start
+            recent_frame_metrics = ev_loop.run_until_complete(
+                PerformanceMetrics.create_from_frame(EXCHANGE, TRADING_PAIR,
+                                                     trades_frame.iloc[NUM_FILLS - NUM_DECIMAL_FILLS:], BALANCES))
+        sql_manager.engine.dispose()
+
+    print(f"Column-wise report, {NUM_FILLS} fills:")
+    print(f"  load:    {frame_load_time * 1e3:10.1f} ms")
+    print(f"  metrics: {frame_metrics_time * 1e3:10.1f} ms")
+    print(f"  trade P&L {PerformanceMetrics.smart_round(frame_metrics.trade_pnl)}, "
+          f"fees {PerformanceMetrics.smart_round(frame_metrics.fee_in_quote)}")
+    print(f"Decimal report, {NUM_DECIMAL_FILLS} fills:")
+    print(f"  load:    {decimal_load_time * 1e3:10.1f} ms")
+    print(f"  metrics: {decimal_metrics_time * 1e3:10.1f} ms")
+    print(f"  trade P&L {PerformanceMetrics.smart_round(decimal_metrics.trade_pnl)} "
+          f"(column-wise {PerformanceMetrics.smart_round(recent_frame_metrics.trade_pnl)})")
+
+
+if __name__ == "__main__":
+    main()
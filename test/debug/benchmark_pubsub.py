@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""
+Measures PubSub.trigger_event with 1 to 50 listeners per event tag, and trigger_event after each listener change.
+
+Usage: python test/debug/benchmark_pubsub.py
+"""
+
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+from test.mock.mock_events import MockEventType, MockEvent
+
+LISTENER_COUNTS = [1, 5, 10, 50]
+NUM_EVENTS = 100000
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg):
+        self.count += 1
+
+
+def main():
+    event_tag = MockEventType.EVENT_ZERO
+    event = MockEvent(payload=1)
+    for listener_count in LISTENER_COUNTS:
+        pubsub = PubSub()
+        listeners = [CountingListener() for _ in range(listener_count)]
+        for listener in listeners:
+            pubsub.add_listener(event_tag, listener)
+
+        start = time.perf_counter()
+        for _ in range(NUM_EVENTS):
+            pubsub.trigger_event(event_tag, event)
+        trigger_duration = time.perf_counter() - start
+
+        extra_listener = CountingListener()
+        start = time.perf_counter()
+        for i in range(NUM_EVENTS // 10):
+            if i % 2 == 0:
+                pubsub.add_listener(event_tag, extra_listener)
+            else:
+                pubsub.remove_listener(event_tag, extra_listener)
+            pubsub.trigger_event(event_tag, event)
+        churn_duration = time.perf_counter() - start
+
+        print(f"{listener_count:3d} listeners: "
+              f"trigger_event {trigger_duration * 1e6 / NUM_EVENTS:8.3f} us "
+              f"({NUM_EVENTS / trigger_duration:12.0f} events/s) | "
+              f"add/remove + trigger_event {churn_duration * 1e6 / (NUM_EVENTS // 10):8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""
+Measures the RingBuffer statistics and the trailing indicators built on it, comparing the running statistics against
+recomputing them from a copy of the buffer on every sample.
+
+Usage: python test/debug/benchmark_ring_buffer.py
+"""
+
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+BUFFER_LENGTHS = [30, 1000, 30000]
+NUM_SAMPLES = 20000
+
+
+def main():
+    for length in BUFFER_LENGTHS:
+        samples = np.random.normal(100, 1, length + NUM_SAMPLES)
+
+        buffer = RingBuffer(length)
+        for sample in samples[:length]:
+            buffer.add_value(sample)
+        start = time.perf_counter()
+        for sample in samples[length:]:
+            buffer.add_value(sample)
+            buffer.mean_value
+            buffer.std_dev
+        running = time.perf_counter() - start
+
+        buffer = RingBuffer(length)
+        for sample in samples[:length]:
+            buffer.add_value(sample)
+        start = time.perf_counter()
+        for sample in samples[length:]:
+            buffer.add_value(sample)
+            copy = buffer.get_as_numpy_array()
+            np.mean(copy)
+            np.std(copy)
+        copied = time.perf_counter() - start
+
+        indicators = {
+            "instant volatility": InstantVolatilityIndicator(length, 1),
+            "historical volatility": HistoricalVolatilityIndicator(length, 15),
+        }
+        indicator_timings = {}
+        for name, indicator in indicators.items():
+            for sample in samples[:length]:
+                indicator.add_sample(sample)
+            start = time.perf_counter()
+            for sample in samples[length:]:
+                indicator.add_sample(sample)
+                indicator.current_value
+            indicator_timings[name] = time.perf_counter() - start
+
+        print(f"{length} samples buffer, {NUM_SAMPLES} additions")
+        print(f"  running mean/std dev:   {running * 1e6 / NUM_SAMPLES:10.2f} us/sample")
+        print(f"  copied mean/std dev:    {copied * 1e6 / NUM_SAMPLES:10.2f} us/sample")
+        for name, timing in indicator_timings.items():
+            print(f"  {name + ':':<24}{timing * 1e6 / NUM_SAMPLES:10.2f} us/sample")
+
+
+if __name__ == "__main__":
+    main()
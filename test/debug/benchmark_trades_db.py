@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+"""
+Compares the trades database SQLite profile (WAL, pragmas, pooled connections and the
+(config_file_path, market, creation_timestamp) index on Order) with a plain SQLite engine, on a database filled with
+1M trade fills and their orders.
+
+Measures the queries MarketsRecorder runs at startup and the time to commit a trade fill.
+
+Usage: python test/debug/benchmark_trades_db.py [number of fills]
+"""
+
+import json
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from os.path import join, realpath
+from types import SimpleNamespace
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+NUM_FILLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+NUM_CONFIGS = 20
+MARKETS = ["binance", "kucoin", "ascend_ex", "gate_io", "huobi"]
+NUM_QUERIES = 20
+NUM_COMMITS = 200
+
+
+def populate(db_path: str):
+    conn = sqlite3.connect(db_path)
+    start_timestamp = 1600000000000
+    fee = json.dumps({"percent": "0.001", "flat_fees": []})
+    batch_size = 100000
+    for batch_start in range(0, NUM_FILLS, batch_size):
+        orders, fills = [], []
+        for i in range(batch_start, min(NUM_FILLS, batch_start + batch_size)):
+            config = f"conf_pure_mm_{i % NUM_CONFIGS}.yml"
+            market = MARKETS[(i // NUM_CONFIGS) % len(MARKETS)]
+            timestamp = start_timestamp + i * 1000
+            order_id = f"buy-BTC-USDT-{timestamp * 1000}"
+            orders.append((order_id, config, "pure_market_making", market, "BTC-USDT", "BTC", "USDT", timestamp,
+                           "LIMIT", 1000000, 1, 50000000000, "BuyOrderCompleted", timestamp,
+                           f"EOID{i}" if random.random() < 0.9 else None, "NIL"))
+            fills.append((config, "pure_market_making", market, "BTC-USDT", "BTC", "USDT", timestamp, order_id,
+                          "BUY", "LIMIT", 50000000000, 1000000, 1, fee, f"T{i}", "NIL"))
+        conn.executemany('insert into "Order" (id, config_file_path, strategy, market, symbol, base_asset, '
+                         'quote_asset, creation_timestamp, order_type, amount, leverage, price, last_status, '
+                         'last_update_timestamp, exchange_order_id, position) '
+                         'values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', orders)
+        conn.executemany('insert into TradeFill (config_file_path, strategy, market, symbol, base_asset, '
+                         'quote_asset, timestamp, order_id, trade_type, order_type, price, amount, leverage, '
+                         'trade_fee, exchange_trade_id, position) '
+                         'values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', fills)
+        conn.commit()
+    conn.execute("analyze")
+    conn.commit()
+    conn.close()
+
+
+def startup_queries(sql_manager) -> float:
+    recorder = SimpleNamespace(_sql_manager=sql_manager)
+    start = time.perf_counter()
+    for i in range(NUM_QUERIES):
+        config = f"conf_pure_mm_{i % NUM_CONFIGS}.yml"
+        MarketsRecorder.get_trades_for_config(recorder, config, 2000)
+        for market in MARKETS:
+            MarketsRecorder.get_orders_for_config_and_market(
+                recorder, config, SimpleNamespace(display_name=market), True, 2000)
+    return (time.perf_counter() - start) / NUM_QUERIES
+
+
+def commit_fills(sql_manager) -> float:
+    start = time.perf_counter()
+    for i in range(NUM_COMMITS):
+        with sql_manager.get_new_session() as session:
+            with session.begin():
+                session.add(TradeFill(config_file_path="conf_pure_mm_0.yml", strategy="pure_market_making",
+                                      market="binance", symbol="BTC-USDT", base_asset="BTC", quote_asset="USDT",
+                                      timestamp=int(time.time() * 1e3), order_id=f"bench-order-{i}",
+                                      trade_type="BUY", order_type="LIMIT", price=50000, amount=1, leverage=1,
+                                      trade_fee={}, exchange_trade_id=f"bench-{i}", position="NIL"))
+                session.query(Order).filter(Order.id == f"bench-order-{i}").one_or_none()
+    return (time.perf_counter() - start) / NUM_COMMITS
+
+
+def main():
+    with tempfile.TemporaryDirectory() as db_dir:
+        tuned_path = join(db_dir, "tuned.sqlite")
+        plain_path = join(db_dir, "plain.sqlite")
+
+        SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=tuned_path).engine.dispose()
+        start = time.perf_counter()
+        populate(tuned_path)
+        print(f"Populated {NUM_FILLS} fills in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(tuned_path) / 1e6:.0f} MB)")
+
+        shutil.copyfile(tuned_path, plain_path)
+        conn = sqlite3.connect(plain_path)
+        conn.execute("pragma journal_mode=DELETE")
+        conn.execute("drop index o_config_market_timestamp_index")
+        conn.commit()
+        conn.close()
+        plain_engine = create_engine(f"sqlite:///{plain_path}")
+        plain_manager = SimpleNamespace(get_new_session=sessionmaker(bind=plain_engine))
+
+        tuned_manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=tuned_path)
+
+        print(f"Startup queries ({len(MARKETS)} markets, 2000 rows each):")
+        print(f"  plain engine:  {startup_queries(plain_manager) * 1e3:10.2f} ms")
+        print(f"  tuned profile: {startup_queries(tuned_manager) * 1e3:10.2f} ms")
+        print("Trade fill commit:")
+        print(f"  plain engine:  {commit_fills(plain_manager) * 1e3:10.2f} ms")
+        print(f"  tuned profile: {commit_fills(tuned_manager) * 1e3:10.2f} ms")
+
+        plain_engine.dispose()
+        tuned_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
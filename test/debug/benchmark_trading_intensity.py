@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+"""
+Measures TradingIntensityIndicator.add_sample on deep order books, with the incremental log-linear fit and with the
+nonlinear fit, from depth arrays and from snapshot DataFrames.
+
+Usage: python test/debug/benchmark_trading_intensity.py
+"""
+
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+NUM_LEVELS = 500
+NUM_SAMPLES = 2000
+SAMPLING_LENGTH = 200
+PRICE_STEP = 0.01
+
+
+def make_books():
+    books = []
+    mid_prices = 100 + np.cumsum(np.random.normal(0, 0.05, NUM_SAMPLES))
+    for mid_price in mid_prices:
+        bid = np.floor(mid_price / PRICE_STEP) * PRICE_STEP
+        ask = bid + PRICE_STEP
+        levels = np.arange(NUM_LEVELS) * PRICE_STEP
+        bids = np.column_stack([bid - levels, np.random.uniform(0.1, 2, NUM_LEVELS), np.ones(NUM_LEVELS)])
+        asks = np.column_stack([ask + levels, np.random.uniform(0.1, 2, NUM_LEVELS), np.ones(NUM_LEVELS)])
+        books.append((bids, asks))
+    return books
+
+
+def measure(indicator: TradingIntensityIndicator, samples) -> float:
+    start = time.perf_counter()
+    for sample in samples:
+        indicator.add_sample(sample)
+    return (time.perf_counter() - start) * 1e6 / len(samples)
+
+
+def main():
+    books = make_books()
+    data_frames = [tuple(pd.DataFrame(side[:, :2], columns=["price", "amount"]) for side in book) for book in books]
+
+    print(f"{NUM_LEVELS} levels books, {NUM_SAMPLES} samples, sampling length {SAMPLING_LENGTH}")
+    print(f"  log-linear, arrays:       {measure(TradingIntensityIndicator(SAMPLING_LENGTH), books):10.2f} us/sample")
+    print(f"  log-linear, data frames:  "
+          f"{measure(TradingIntensityIndicator(SAMPLING_LENGTH), data_frames):10.2f} us/sample")
+    print(f"  nonlinear, arrays:        "
+          f"{measure(TradingIntensityIndicator(SAMPLING_LENGTH, nonlinear_fit=True), books):10.2f} us/sample")
+
+
+if __name__ == "__main__":
+    main()
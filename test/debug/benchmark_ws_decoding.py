@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+Measures the decoding of Binance-like full depth WebSocket frames for 100 pairs, with the stdlib and ujson decoders,
+and the cost of routing them with WSChannelRouter, decoding only the frames of the subscribed channels.
+
+Usage: python test/debug/benchmark_ws_decoding.py
+"""
+
+import asyncio
+import json
+import random
+import time
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import ujson
+
+from hummingbot.core.web_assistant.connections.ws_channel_router import WSChannelRouter
+
+NUM_PAIRS = 100
+NUM_FRAMES = 20000
+DEPTH_LEVELS = 20
+
+
+def make_frames():
+    frames = []
+    for i in range(NUM_FRAMES):
+        symbol = f"PAIR{i % NUM_PAIRS}USDT"
+        if i % 4 == 0:
+            message = {"e": "trade", "E": 1640000000000 + i, "s": symbol, "t": i, "p": "100.01", "q": "0.5",
+                       "b": i, "a": i + 1, "T": 1640000000000 + i, "m": True, "M": True}
+        else:
+            message = {"e": "depthUpdate", "E": 1640000000000 + i, "s": symbol, "U": i, "u": i + 1,
+                       "b": [[f"{100 - random.random():.8f}", f"{random.random():.8f}"] for _ in range(DEPTH_LEVELS)],
+                       "a": [[f"{100 + random.random():.8f}", f"{random.random():.8f}"] for _ in range(DEPTH_LEVELS)]}
+        frames.append(json.dumps(message, separators=(",", ":")))
+    return frames
+
+
+def measure_decoding(frames, decoder) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        decoder(frame)
+    return (time.perf_counter() - start) * 1e6 / len(frames)
+
+
+def measure_routing(frames, decoder) -> float:
+    diffs_queue = asyncio.Queue()
+    router = WSChannelRouter(pass_unmatched=False)
+    router.add_route('"e":"depthUpdate"', diffs_queue)
+    start = time.perf_counter()
+    for frame in frames:
+        queue = router.queue_for(frame)
+        if queue is not None:
+            queue.put_nowait(decoder(frame))
+    return (time.perf_counter() - start) * 1e6 / len(frames)
+
+
+def main():
+    frames = make_frames()
+    print(f"{NUM_FRAMES} frames, {NUM_PAIRS} pairs, {DEPTH_LEVELS} levels per side in the diffs")
+    print(f"  decode all, json:            {measure_decoding(frames, json.loads):8.2f} us/frame")
+    print(f"  decode all, ujson:           {measure_decoding(frames, ujson.loads):8.2f} us/frame")
+    print(f"  route diffs only, json:      {measure_routing(frames, json.loads):8.2f} us/frame")
+    print(f"  route diffs only, ujson:     {measure_routing(frames, ujson.loads):8.2f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 import unittest
 from copy import deepcopy
@@ -9,7 +10,11 @@ from unittest.mock import patch, MagicMock, AsyncMock
 from hummingbot.client.config.config_helpers import read_system_configs_from_yml
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 from test.mock.mock_cli import CLIMockingAssistant
 
@@ -104,3 +109,85 @@ class HistoryCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the balances retrieval to complete. See logs for more details."
             )
         )
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_calculate_profitability_uses_performance_tracker(self,
+                                                              get_current_balances_mock: AsyncMock,
+                                                              get_last_price_mock: AsyncMock):
+        get_last_price_mock.return_value = Decimal("2")
+        get_current_balances_mock.return_value = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+        global_config_map["other_commands_timeout"].value = 1
+        self.app._strategy_file_name = "some-strategy.yml"
+        self.app.markets_recorder = MagicMock()
+        self.app.performance_tracker = PerformanceTracker([], "some-strategy.yml", self.app.init_time, self.get_trades())
+
+        expected_return = self.async_run_with_timeout(
+            self.app.history_report(start_time=self.app.init_time, trades=self.get_trades(), display_report=False)
+        )
+        profitability = self.async_run_with_timeout(self.app.calculate_profitability())
+
+        self.assertEqual(expected_return, profitability)
+        self.app.markets_recorder.flush.assert_not_called()
+
+    @patch("hummingbot.client.command.history_command.HistoryCommand.history_frame_report", new_callable=AsyncMock)
+    def test_calculate_profitability_awaits_markets_recorder_flush(self, history_frame_report_mock: AsyncMock):
+        history_frame_report_mock.return_value = Decimal("1")
+        self.app._strategy_file_name = "some-strategy.yml"
+        self.app.markets_recorder = MagicMock()
+        self.app.markets_recorder.flush = AsyncMock()
+        self.app.trade_fill_db = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path="")
+
+        profitability = self.async_run_with_timeout(self.app.calculate_profitability())
+
+        self.assertEqual(Decimal("1"), profitability)
+        self.app.markets_recorder.flush.assert_awaited_once()
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_history_frame_report_matches_history_report(self,
+                                                         get_current_balances_mock: AsyncMock,
+                                                         get_last_price_mock: AsyncMock):
+        get_last_price_mock.return_value = Decimal("2")
+        get_current_balances_mock.return_value = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+        global_config_map["other_commands_timeout"].value = 1
+        sql_manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path="")
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+        with sql_manager.get_new_session() as session:
+            with session.begin():
+                for i in range(10):
+                    session.add(TradeFill(
+                        config_file_path="some-strategy.yml",
+                        strategy="pure_market_making",
+                        market="binance" if i % 3 else "kucoin",
+                        symbol="BTC-USDT",
+                        base_asset="BTC",
+                        quote_asset="USDT",
+                        timestamp=1640000000000 + i,
+                        order_id=f"someId{i}",
+                        trade_type="BUY" if i % 2 else "SELL",
+                        order_type="LIMIT",
+                        price=Decimal("1.5") + i,
+                        amount=Decimal("0.123456") * (i + 1),
+                        leverage=1,
+                        trade_fee=trade_fee.to_json(),
+                        exchange_trade_id=f"someExchangeId{i}",
+                    ))
+
+        with sql_manager.get_new_session() as session:
+            trades = self.app._get_trades_from_session(1640000000000, session=session,
+                                                       config_file_path="some-strategy.yml")
+            trades_frame = self.app._get_trades_frame_from_session(1640000000000, session=session,
+                                                                   config_file_path="some-strategy.yml")
+
+            self.assertEqual(10, len(trades_frame))
+            self.assertEqual([float(trade.price) for trade in trades], trades_frame["price"].tolist())
+            self.assertEqual([float(trade.amount) for trade in trades], trades_frame["amount"].tolist())
+            self.assertEqual(trade_fee.to_json(), json.loads(trades_frame["trade_fee"].iloc[0]))
+
+            expected_return = self.async_run_with_timeout(
+                self.app.history_report(start_time=time.time(), trades=trades, display_report=False))
+        frame_return = self.async_run_with_timeout(
+            self.app.history_frame_report(start_time=time.time(), trades=trades_frame, display_report=False))
+
+        self.assertAlmostEqual(float(expected_return), float(frame_return), places=9)
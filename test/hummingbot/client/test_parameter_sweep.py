@@ -0,0 +1,118 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.client.config.config_helpers import get_strategy_config_map
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.parameter_sweep import (
+    BacktestSpec,
+    ParameterSweep,
+    RESULT_COLUMNS,
+    parameter_grid_runs,
+    run_backtest,
+)
+from hummingbot.connector.exchange.paper_trade.replay_order_book_tracker import (
+    message_from_record,
+    write_recorded_messages,
+)
+
+
+class ParameterSweepTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.main_app = HummingbotApplication._main_app
+        self.config_values = {key: cvar.value for key, cvar in get_strategy_config_map("pure_market_making").items()}
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recording_path = os.path.join(self.temp_dir.name, f"{self.trading_pair}.jsonl")
+        write_recorded_messages(self.recording_path, [message_from_record(record) for record in [
+            {"type": "snapshot", "timestamp": self.start_timestamp, "trading_pair": self.trading_pair,
+             "update_id": 1, "bids": [["99.9", "10"], ["99", "10"]], "asks": [["100.1", "10"], ["101", "10"]]},
+            {"type": "trade", "timestamp": self.start_timestamp + 30, "trading_pair": self.trading_pair,
+             "trade_id": 1, "trade_type": "sell", "price": "99", "amount": "5"},
+        ]])
+
+    def tearDown(self) -> None:
+        HummingbotApplication._main_app = self.main_app
+        for key, cvar in get_strategy_config_map("pure_market_making").items():
+            cvar.value = self.config_values[key]
+        asyncio.set_event_loop(self.ev_loop)
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def spec(self, parameters) -> BacktestSpec:
+        config_values = {key: cvar.default for key, cvar in get_strategy_config_map("pure_market_making").items()}
+        config_values.update(exchange="binance",
+                             market=self.trading_pair,
+                             bid_spread=Decimal("1"),
+                             ask_spread=Decimal("1"),
+                             order_refresh_time=10.0,
+                             order_amount=Decimal("1"))
+        return BacktestSpec(strategy="pure_market_making",
+                            strategy_file_name="conf_pure_mm_1.yml",
+                            config_values=config_values,
+                            recording_file_paths=[self.recording_path],
+                            start_balances={"COINALPHA": Decimal("100"), "HBOT": Decimal("10000")},
+                            start_time=self.start_timestamp,
+                            end_time=self.start_timestamp + 60,
+                            parameters=parameters)
+
+    def test_parameter_grid_runs(self):
+        runs = parameter_grid_runs({"bid_spread": [0.1, 0.2], "order_levels": [1, 2, 3]})
+
+        self.assertEqual(6, len(runs))
+        self.assertEqual({"bid_spread": 0.1, "order_levels": 1}, runs[0])
+        self.assertEqual({"bid_spread": 0.2, "order_levels": 3}, runs[-1])
+        self.assertEqual([{}], parameter_grid_runs({}))
+
+    @patch("hummingbot.client.parameter_sweep.load_strategy_config")
+    def test_unknown_parameters_rejected(self, load_strategy_config_mock):
+        load_strategy_config_mock.return_value = ("pure_market_making", {"bid_spread": Decimal("1")})
+        sweep = ParameterSweep("conf_pure_mm_1.yml", {"bid_spread": [1], "spread": [1]}, [self.recording_path],
+                               {}, self.start_timestamp, self.start_timestamp + 60)
+
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(sweep.specs())
+
+    @patch("hummingbot.client.parameter_sweep.load_strategy_config")
+    def test_specs_per_run(self, load_strategy_config_mock):
+        load_strategy_config_mock.return_value = ("pure_market_making", {"bid_spread": Decimal("1"),
+                                                                         "order_levels": 1})
+        sweep = ParameterSweep("conf/conf_pure_mm_1.yml", {"bid_spread": ["0.1", "0.2"]}, [self.recording_path],
+                               {"HBOT": Decimal("100")}, self.start_timestamp, self.start_timestamp + 60)
+
+        specs = self.ev_loop.run_until_complete(sweep.specs())
+
+        self.assertEqual([{"bid_spread": "0.1"}, {"bid_spread": "0.2"}], [spec.parameters for spec in specs])
+        self.assertEqual("conf_pure_mm_1.yml", specs[0].strategy_file_name)
+        self.assertEqual({"bid_spread": Decimal("1"), "order_levels": 1}, specs[0].config_values)
+
+    def test_run_backtest_over_recorded_market(self):
+        new_event_loop = asyncio.new_event_loop
+        run_loops = []
+
+        def create_loop():
+            run_loops.append(new_event_loop())
+            return run_loops[-1]
+
+        with patch("asyncio.new_event_loop", side_effect=create_loop):
+            results = run_backtest(self.spec({"bid_spread": "0.4"}))
+
+        self.assertEqual(1, len(run_loops))
+        self.assertTrue(run_loops[0].is_closed())
+        self.assertIs(self.main_app, HummingbotApplication._main_app)
+
+        self.assertEqual(1, len(results))
+        result = results[0]
+        self.assertTrue(set(result.keys()) <= set(RESULT_COLUMNS))
+        self.assertEqual("binance_Backtest", result["market"])
+        self.assertEqual(self.trading_pair, result["trading_pair"])
+        self.assertEqual(1, result["trades"])
+        self.assertEqual(Decimal("101"), result["end_base_balance"])
+        self.assertEqual(Decimal("0.4"), get_strategy_config_map("pure_market_making")["bid_spread"].value)
@@ -1,14 +1,26 @@
 import asyncio
+import json
+import random
 import time
 import unittest
 from decimal import Decimal
+from typing import List
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+import pandas as pd
+
+from hummingbot.client.performance import (
+    PerformanceAccumulator,
+    PerformanceMetrics,
+    PerformanceTracker,
+    TRADES_FRAME_COLUMNS,
+)
+from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
-from hummingbot.core.event.events import PositionAction
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent, OrderType, PositionAction, TradeType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — OrderStatus needs to be defined for Order
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -230,3 +242,264 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
 
         value = PerformanceMetrics.smart_round(Decimal("0.123456"), 2)
         self.assertEqual(value, Decimal("0.12"))
+
+
+class PerformanceAccumulatorUnitTest(unittest.TestCase):
+    @staticmethod
+    def trade_fill(order_id: str, trade_type: str, price, amount, position: str = PositionAction.NIL.value,
+                   trade_fee: AddedToCostTradeFee = AddedToCostTradeFee()) -> TradeFill:
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=int(time.time()),
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"{order_id}-{price}-{amount}",
+            position=position,
+        )
+
+    def performance_metrics(self, trades: List[TradeFill], cur_bals):
+        accumulator = PerformanceAccumulator("hbot_exchange", trading_pair)
+        for trade in trades:
+            accumulator.add_trade_fill(trade)
+        return asyncio.get_event_loop().run_until_complete(accumulator.performance_metrics(cur_bals))
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, actual: PerformanceMetrics):
+        for field in ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                      "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                      "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price",
+                      "cur_price", "hold_value", "cur_value", "trade_pnl", "fee_in_quote", "total_pnl",
+                      "return_pct"]:
+            self.assertAlmostEqual(float(getattr(expected, field)), float(getattr(actual, field)), places=6,
+                                   msg=field)
+        self.assertEqual(expected.fees.keys(), actual.fees.keys())
+
+    def test_spot_metrics_match_performance_metrics(self):
+        rng = random.Random(42)
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])
+        trades = [self.trade_fill(f"someId{i}", rng.choice(["BUY", "SELL"]), rng.randint(90, 110),
+                                  rng.randint(1, 20), trade_fee=trade_fee)
+                  for i in range(200)]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        metrics = self.performance_metrics(trades, cur_bals)
+        expected = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create("hbot_exchange", trading_pair, trades, cur_bals))
+
+        self.assert_same_metrics(expected, metrics)
+        self.assertAlmostEqual(float(expected.fees[quote]), float(metrics.fees[quote]), places=6)
+        self.assertEqual(Decimal("2"), metrics.fees["BNB"])
+
+    def test_derivative_metrics_match_performance_metrics(self):
+        # PerformanceMetrics.create aggregates the fills of the orders in place before computing the percent fees
+        trade_fee = AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.1"))])
+        rng = random.Random(42)
+        trades = []
+        order_ids = {}
+        for i in range(300):
+            # Fills are grouped by order, and the orders are filled in several steps
+            trade_type, position = rng.choice([("BUY", "OPEN"), ("SELL", "CLOSE"), ("SELL", "OPEN"), ("BUY", "CLOSE")])
+            if (trade_type, position) in order_ids and rng.random() < 0.5:
+                order_id = order_ids[(trade_type, position)]
+            else:
+                order_id = f"someId{i}"
+                order_ids[(trade_type, position)] = order_id
+            trades.append(self.trade_fill(order_id, trade_type, rng.randint(90, 110), rng.randint(1, 20),
+                                          position=position, trade_fee=trade_fee))
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        metrics = self.performance_metrics(trades, cur_bals)
+        expected = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create("hbot_exchange", trading_pair, trades, cur_bals))
+
+        self.assert_same_metrics(expected, metrics)
+
+    def test_derivative_positions_pnl(self):
+        trades = [
+            self.trade_fill("order1", "BUY", 10, 50, position="OPEN"),
+            self.trade_fill("order2", "SELL", 15, 100, position="CLOSE"),
+            self.trade_fill("order3", "SELL", 20, 100, position="OPEN",
+                            trade_fee=AddedToCostTradeFee(Decimal("0.1"))),
+            self.trade_fill("order4", "BUY", 15, 100, position="CLOSE",
+                            trade_fee=AddedToCostTradeFee(Decimal("0.1"))),
+            # Second fill of order1 changes the average price and the amount of the open long position
+            self.trade_fill("order1", "BUY", 12, 50, position="OPEN"),
+        ]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        metrics = self.performance_metrics(trades, cur_bals)
+
+        self.assertEqual(5, metrics.num_trades)
+        self.assertEqual(Decimal("400") + Decimal("500"), metrics.trade_pnl)
+        self.assertEqual(Decimal("350"), metrics.fee_in_quote)
+        self.assertEqual(Decimal("550"), metrics.total_pnl)
+
+    def test_add_order_filled_event(self):
+        accumulator = PerformanceAccumulator("hbot_exchange", trading_pair)
+        accumulator.add_order_filled_event(OrderFilledEvent(
+            timestamp=1640000000,
+            order_id="someId0",
+            trading_pair=trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("10"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("BNB", Decimal("1"))]),
+        ))
+        accumulator.add_order_filled_event(OrderFilledEvent(
+            timestamp=1640000001,
+            order_id="someId1",
+            trading_pair=trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("120"),
+            amount=Decimal("15"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+        self.assertEqual(1, accumulator.num_buys)
+        self.assertEqual(1, accumulator.num_sells)
+        self.assertEqual(Decimal("10"), accumulator.b_vol_base)
+        self.assertEqual(Decimal("-15"), accumulator.s_vol_base)
+        self.assertEqual(Decimal("-1000"), accumulator.b_vol_quote)
+        self.assertEqual(Decimal("1800"), accumulator.s_vol_quote)
+        self.assertEqual({quote: Decimal("10"), "BNB": Decimal("1")}, accumulator.fees)
+        self.assertEqual(Decimal("100"), accumulator.start_price)
+        self.assertEqual(Decimal("120"), accumulator.last_price)
+        self.assertFalse(accumulator.are_derivatives)
+
+    @patch("hummingbot.client.performance.get_last_price")
+    def test_performance_metrics_at_given_current_price(self, get_last_price_mock):
+        accumulator = PerformanceAccumulator("hbot_exchange", trading_pair)
+        accumulator.add_trade_fill(self.trade_fill("someId0", "BUY", 100, 10))
+        cur_bals = {base: Decimal("10"), quote: Decimal("0")}
+
+        metrics = asyncio.get_event_loop().run_until_complete(
+            accumulator.performance_metrics(cur_bals, current_price=Decimal("110")))
+
+        get_last_price_mock.assert_not_called()
+        self.assertEqual(Decimal("110"), metrics.cur_price)
+        self.assertEqual(Decimal("1100"), metrics.cur_value)
+        self.assertEqual(Decimal("100"), metrics.trade_pnl)
+
+
+class PerformanceTrackerUnitTest(unittest.TestCase):
+    def test_tracker_adds_recorded_trades_and_market_fills(self):
+        market = ConnectorBase()
+        trades = [PerformanceAccumulatorUnitTest.trade_fill("someId0", "BUY", 100, 10)]
+        tracker = PerformanceTracker([market], "some-strategy.yml", 1640000000.0, trades)
+        fill = OrderFilledEvent(
+            timestamp=1640000001,
+            order_id="someId1",
+            trading_pair=trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("120"),
+            amount=Decimal("15"),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+        market.trigger_event(MarketEvent.OrderFilled, fill)
+        self.assertEqual(1, tracker.num_trades)
+
+        tracker.start()
+        market.trigger_event(MarketEvent.OrderFilled, fill)
+
+        self.assertEqual(2, tracker.num_trades)
+        self.assertEqual(1, tracker.accumulators[("binance", trading_pair)].num_buys)
+        self.assertEqual(1, tracker.accumulators[(market.display_name, trading_pair)].num_sells)
+
+        tracker.stop()
+        market.trigger_event(MarketEvent.OrderFilled, fill)
+
+        self.assertEqual(2, tracker.num_trades)
+
+
+class PerformanceMetricsFromFrameUnitTest(unittest.TestCase):
+    @staticmethod
+    def trades_frame(trades: List[TradeFill]) -> pd.DataFrame:
+        return pd.DataFrame([[trade.order_id, trade.trade_type, float(trade.price), float(trade.amount),
+                              json.dumps(trade.trade_fee), trade.position]
+                             for trade in trades],
+                            columns=TRADES_FRAME_COLUMNS)
+
+    def assert_same_as_decimal_path(self, trades: List[TradeFill]):
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        frame = self.trades_frame(trades)
+
+        expected = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create("hbot_exchange", trading_pair, trades, cur_bals))
+        metrics = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create_from_frame("hbot_exchange", trading_pair, frame, cur_bals))
+
+        for field in ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                      "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                      "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price",
+                      "cur_price", "start_base_ratio_pct", "cur_base_ratio_pct", "hold_value", "cur_value",
+                      "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"]:
+            self.assertEqual(PerformanceMetrics.smart_round(Decimal(getattr(expected, field)), 6),
+                             PerformanceMetrics.smart_round(Decimal(getattr(metrics, field)), 6),
+                             msg=field)
+        self.assertEqual(expected.fees.keys(), metrics.fees.keys())
+        for fee_token in expected.fees:
+            self.assertAlmostEqual(float(expected.fees[fee_token]), float(metrics.fees[fee_token]), places=6)
+
+    def test_spot_metrics(self):
+        rng = random.Random(42)
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])
+        trades = [PerformanceAccumulatorUnitTest.trade_fill(f"someId{i}", rng.choice(["BUY", "SELL"]),
+                                                            Decimal(rng.randint(9000, 11000)) / 100,
+                                                            Decimal(rng.randint(1, 2000)) / 100,
+                                                            trade_fee=trade_fee)
+                  for i in range(500)]
+
+        self.assert_same_as_decimal_path(trades)
+
+    def test_derivative_metrics(self):
+        rng = random.Random(42)
+        trade_fee = AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.1"))])
+        trades = []
+        order_ids = {}
+        for i in range(500):
+            trade_type, position = rng.choice([("BUY", "OPEN"), ("SELL", "CLOSE"), ("SELL", "OPEN"),
+                                               ("BUY", "CLOSE")])
+            if (trade_type, position) in order_ids and rng.random() < 0.5:
+                order_id = order_ids[(trade_type, position)]
+            else:
+                order_id = f"someId{i}"
+                order_ids[(trade_type, position)] = order_id
+            trades.append(PerformanceAccumulatorUnitTest.trade_fill(order_id, trade_type,
+                                                                    Decimal(rng.randint(9000, 11000)) / 100,
+                                                                    Decimal(rng.randint(1, 2000)) / 100,
+                                                                    position=position,
+                                                                    trade_fee=trade_fee))
+
+        self.assert_same_as_decimal_path(trades)
+
+    def test_derivative_positions_pnl(self):
+        trades = [
+            PerformanceAccumulatorUnitTest.trade_fill("order1", "BUY", 10, 50, position="OPEN"),
+            PerformanceAccumulatorUnitTest.trade_fill("order2", "SELL", 15, 100, position="CLOSE"),
+            PerformanceAccumulatorUnitTest.trade_fill("order3", "SELL", 20, 100, position="OPEN",
+                                                      trade_fee=AddedToCostTradeFee(Decimal("0.1"))),
+            PerformanceAccumulatorUnitTest.trade_fill("order4", "BUY", 15, 100, position="CLOSE",
+                                                      trade_fee=AddedToCostTradeFee(Decimal("0.1"))),
+            PerformanceAccumulatorUnitTest.trade_fill("order1", "BUY", 12, 50, position="OPEN"),
+        ]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        metrics = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create_from_frame("hbot_exchange", trading_pair, self.trades_frame(trades), cur_bals))
+
+        self.assertEqual(5, metrics.num_trades)
+        self.assertEqual(Decimal("900"), metrics.trade_pnl)
+        self.assertEqual(Decimal("350"), metrics.fee_in_quote)
+        self.assertEqual(Decimal("550"), metrics.total_pnl)
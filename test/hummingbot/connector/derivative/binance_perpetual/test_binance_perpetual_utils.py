@@ -13,7 +13,9 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils i
     BROKER_ID,
     BinancePerpetualRESTPreProcessor,
 )
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -102,3 +104,14 @@ class BinancePerpetualUtilsUnitTests(unittest.TestCase):
         self.assertIsNone(api_factory._auth)
 
         self.assertTrue(1, len(api_factory._rest_pre_processors))
+        self.assertEqual(0, len(api_factory._rest_post_processors))
+
+    def test_build_api_factory_with_throttler(self):
+        throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
+        api_factory = utils.build_api_factory(throttler=throttler)
+
+        self.assertEqual(1, len(api_factory._rest_post_processors))
+        post_processor = api_factory._rest_post_processors[0]
+        self.assertIsInstance(post_processor, RateLimitUsageRESTPostProcessor)
+        self.assertEqual(throttler, post_processor._throttler)
+        self.assertEqual(CONSTANTS.REQUEST_WEIGHT, post_processor._usage_headers["X-MBX-USED-WEIGHT-1M"])
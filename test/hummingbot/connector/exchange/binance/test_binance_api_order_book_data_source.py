@@ -421,6 +421,31 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_routes_trades_and_order_diffs_to_their_queues(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self._trade_update_event(), separators=(",", ":")))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self._order_diff_event(), separators=(",", ":")))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        trades_queue = self.data_source._message_queue[CONSTANTS.TRADE_EVENT_TYPE]
+        diffs_queue = self.data_source._message_queue[CONSTANTS.DIFF_EVENT_TYPE]
+        self.assertEqual(1, trades_queue.qsize())
+        self.assertEqual(self._trade_update_event(), trades_queue.get_nowait())
+        self.assertEqual(1, diffs_queue.qsize())
+        self.assertEqual(self._order_diff_event(), diffs_queue.get_nowait())
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import re
+import time
 from decimal import Decimal
 from typing import Awaitable, NamedTuple, Optional
 from unittest import TestCase
@@ -163,6 +164,17 @@ class BinanceExchangeTests(TestCase):
 
         self.assertEqual(NetworkStatus.NOT_CONNECTED, status)
 
+    @aioresponses()
+    def test_rate_limit_usage_headers_update_throttler(self, mock_api):
+        url = binance_utils.private_rest_url(CONSTANTS.PING_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        mock_api.get(regex_url, body=json.dumps({}), headers={"X-MBX-USED-WEIGHT-1M": "500"})
+
+        self.async_run_with_timeout(self.exchange.check_network())
+
+        self.assertEqual(500, self.exchange._throttler._task_logs.used_capacity(CONSTANTS.REQUEST_WEIGHT, time.time()))
+
     @aioresponses()
     def test_check_network_raises_cancel_exception(self, mock_api):
         url = binance_utils.private_rest_url(CONSTANTS.PING_PATH_URL)
@@ -8,6 +8,7 @@ from typing import (
     Optional,
     Union,
 )
+from unittest.mock import MagicMock
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
@@ -228,3 +229,22 @@ class BinanceOrderBookTrackerUnitTests(unittest.TestCase):
 
         self.assertEqual(0, self.tracker.order_books[self.trading_pair].snapshot_uid)
         self.assertEqual(2, self.tracker.order_books[self.trading_pair].last_diff_uid)
+
+    def test_track_single_book_records_messages(self):
+        recorder = MagicMock()
+        self.tracker.market_data_recorder = recorder
+        saved_diff_msg: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 1, "bids": [["0.0024", "10"]], "asks": []})
+        diff_msg: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 2, "bids": [], "asks": [["0.0026", "100"]]})
+        self._simulate_message_enqueue(self.tracker._saved_message_queues[self.trading_pair], saved_diff_msg)
+        self._simulate_message_enqueue(self.tracker._tracking_message_queues[self.trading_pair], diff_msg)
+
+        self.tracking_task = self.ev_loop.create_task(
+            self.tracker._track_single_book(self.trading_pair)
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        recorder.record_order_book.assert_called_once()
+        self.assertEqual(self.trading_pair, recorder.record_order_book.call_args[0][0])
+        self.assertEqual([saved_diff_msg, diff_msg], [call[0][0] for call in recorder.record_message.call_args_list])
@@ -0,0 +1,61 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.events import OrderBookTradeEvent, OrderType, TradeType
+from test.mock.mock_paper_exchange import MockPaperExchange
+
+
+class PaperTradeExchangeOnHoldBalancesTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.market = MockPaperExchange()
+        self.market.set_balanced_order_book(self.trading_pair, 100, 50, 150, 1, 10)
+        self.market.set_balance("COINALPHA", Decimal("10"))
+        self.market.set_balance("HBOT", Decimal("1000"))
+        self.market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp)
+
+    def test_limit_orders_put_balances_on_hold(self):
+        self.market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("90"))
+        self.market.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("80"))
+        self.market.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("110"))
+
+        self.assertEqual(Decimal("260"), self.market.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("3"), self.market.on_hold_balances["COINALPHA"])
+        self.assertEqual(Decimal("740"), self.market.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("7"), self.market.get_available_balance("COINALPHA"))
+        self.assertEqual({"HBOT": Decimal("740"), "COINALPHA": Decimal("7")}, self.market.available_balances)
+        self.assertEqual(Decimal("0"), self.market.get_available_balance("ETH"))
+
+    def test_cancelled_orders_release_balances(self):
+        buy_order_id = self.market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("90"))
+        sell_order_id = self.market.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("110"))
+
+        self.market.cancel(self.trading_pair, buy_order_id)
+        self.market.cancel(self.trading_pair, sell_order_id)
+
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(Decimal("0"), self.market.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("0"), self.market.on_hold_balances["COINALPHA"])
+        self.assertEqual(Decimal("1000"), self.market.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("10"), self.market.get_available_balance("COINALPHA"))
+
+    def test_filled_orders_release_balances(self):
+        self.market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("90"))
+        self.market.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("80"))
+
+        self.market.match_trade_to_limit_orders(OrderBookTradeEvent(
+            self.trading_pair, self.start_timestamp, TradeType.SELL, 85.0, 5.0))
+
+        self.assertEqual(1, len(self.market.limit_orders))
+        self.assertEqual(Decimal("80"), self.market.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("820"), self.market.get_balance("HBOT"))
+        self.assertEqual(Decimal("740"), self.market.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("12"), self.market.get_available_balance("COINALPHA"))
@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.replay_order_book_tracker import (
+    ReplayOrderBookTracker,
+    message_from_record,
+    read_recorded_messages,
+    record_from_message,
+    write_recorded_messages,
+)
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.market_data_recorder import MarketDataReader, MarketDataRecorder, data_file_path
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent, OrderType
+
+
+class ReplayOrderBookTrackerTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def snapshot_record(self, timestamp: float, update_id: int, bid: str = "99", ask: str = "101"):
+        return {"type": "snapshot", "timestamp": timestamp, "trading_pair": self.trading_pair, "update_id": update_id,
+                "bids": [[bid, "10"], ["98", "10"]], "asks": [[ask, "10"], ["102", "10"]]}
+
+    def diff_record(self, timestamp: float, update_id: int, bids, asks):
+        return {"type": "diff", "timestamp": timestamp, "trading_pair": self.trading_pair, "update_id": update_id,
+                "bids": bids, "asks": asks}
+
+    def trade_record(self, timestamp: float, trade_id: int, trade_type: str, price: str, amount: str):
+        return {"type": "trade", "timestamp": timestamp, "trading_pair": self.trading_pair, "trade_id": trade_id,
+                "trade_type": trade_type, "price": price, "amount": amount}
+
+    def messages(self):
+        records = [
+            self.diff_record(self.start_timestamp, 1, [["99.5", "1"]], []),
+            self.snapshot_record(self.start_timestamp + 1, 10),
+            self.diff_record(self.start_timestamp + 2, 9, [["99.7", "1"]], []),
+            self.diff_record(self.start_timestamp + 3, 11, [["99.5", "2"]], [["101", "0"]]),
+            self.trade_record(self.start_timestamp + 4, 1, "sell", "99.5", "1.5"),
+        ]
+        return [message_from_record(record) for record in records]
+
+    def test_not_ready_until_the_first_snapshot(self):
+        tracker = ReplayOrderBookTracker(self.messages(), [self.trading_pair], "binance")
+
+        tracker.advance_to(self.start_timestamp)
+
+        self.assertFalse(tracker.ready)
+        self.assertEqual({}, tracker.order_books)
+        self.assertEqual(1, tracker.replayed_messages_count)
+
+        tracker.advance_to(self.start_timestamp + 1)
+
+        self.assertTrue(tracker.ready)
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+        self.assertEqual(10, order_book.snapshot_uid)
+
+    def test_replays_messages_up_to_the_timestamp(self):
+        tracker = ReplayOrderBookTracker(self.messages(), [self.trading_pair], "binance")
+
+        tracker.advance_to(self.start_timestamp + 2)
+        order_book = tracker.order_books[self.trading_pair]
+        # The diff older than the snapshot is skipped
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(self.start_timestamp + 3, tracker.next_message_timestamp)
+
+        tracker.advance_to(self.start_timestamp + 3)
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(102, order_book.get_price(True))
+
+    def test_replays_trades(self):
+        tracker = ReplayOrderBookTracker(self.messages(), [self.trading_pair], "binance")
+        tracker.advance_to(self.start_timestamp + 3)
+        trade_logger = EventLogger()
+        tracker.order_books[self.trading_pair].add_listener(OrderBookEvent.TradeEvent, trade_logger)
+
+        tracker.advance_to(self.start_timestamp + 10)
+
+        self.assertEqual(1, len(trade_logger.event_log))
+        self.assertEqual(99.5, trade_logger.event_log[0].price)
+        self.assertEqual(1.5, trade_logger.event_log[0].amount)
+        self.assertEqual(99.5, tracker.order_books[self.trading_pair].last_trade_price)
+        self.assertIsNone(tracker.next_message_timestamp)
+
+    def test_record_round_trip(self):
+        messages = self.messages()
+        for message in messages:
+            self.assertEqual(message.type, message_from_record(record_from_message(message)).type)
+        self.assertEqual(OrderBookMessageType.TRADE, message_from_record(record_from_message(messages[-1])).type)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "recording.jsonl.gz")
+            write_recorded_messages(file_path, messages)
+            read_messages = list(read_recorded_messages(file_path))
+
+        self.assertEqual([message.timestamp for message in messages], [message.timestamp for message in read_messages])
+        self.assertEqual([[float(price), float(amount)] for price, amount in messages[1].content["bids"]],
+                         [[float(price), float(amount)] for price, amount in read_messages[1].content["bids"]])
+
+    def test_read_recorded_market_data_file_closes_reader(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = MarketDataRecorder(directory)
+            for message in self.messages():
+                recorder.record_message(message)
+            recorder.close()
+
+            with patch.object(MarketDataReader, "close", autospec=True,
+                              side_effect=MarketDataReader.close) as close_mock:
+                read_messages = list(read_recorded_messages(data_file_path(directory, self.trading_pair)))
+
+        self.assertEqual(len(self.messages()), len(read_messages))
+        close_mock.assert_called_once()
+
+    def test_backtest_exchange_fills_limit_orders_with_replayed_trades(self):
+        tracker = ReplayOrderBookTracker(self.messages(), [self.trading_pair], "binance")
+        exchange = BacktestExchange(tracker, MarketConfig.default_config(), BinanceExchange)
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp + 3)
+
+        self.assertTrue(exchange.ready)
+        self.assertEqual(Decimal("99.5"), exchange.get_price(self.trading_pair, False))
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.6"))
+
+        clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(Decimal("1"), fill_logger.event_log[0].amount)
@@ -204,6 +204,189 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertTrue(fetched_order == order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_by_order_update(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        self.tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        ))
+
+        self.assertIs(order, self.tracker._orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertNotIn(order.client_order_id, self.tracker._orders_without_exchange_order_id)
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_fetch_order_by_exchange_order_id_assigned_directly(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker._orders_by_exchange_order_id["someExchangeOrderId"])
+
+    def test_fetch_order_by_exchange_order_id_of_cached_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        self.tracker._cached_orders.clear()
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", self.tracker._orders_by_exchange_order_id)
+
+    def test_fetch_order_without_exchange_order_id_does_not_match_orders_without_one(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIsNone(self.tracker.fetch_order(client_order_id="someOtherClientOrderId"))
+
+    def _track_and_untrack_orders(self, count: int):
+        for i in range(count):
+            order: InFlightOrder = InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                exchange_order_id=f"someExchangeOrderId_{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                price=Decimal("1.0"),
+            )
+            self.tracker.start_tracking_order(order)
+            self.tracker.stop_tracking_order(order.client_order_id)
+
+    def test_exchange_order_id_index_drops_expired_cached_orders(self):
+        self._track_and_untrack_orders(2 * ClientOrderTracker.MAX_CACHE_SIZE + 1)
+
+        self.assertLessEqual(len(self.tracker._orders_by_exchange_order_id), 2 * ClientOrderTracker.MAX_CACHE_SIZE)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId_0"))
+
+    def test_exchange_order_id_index_rebuilt_once_every_max_cache_size_untracked_orders(self):
+        with patch.object(self.tracker,
+                          "_rebuild_exchange_order_id_index",
+                          wraps=self.tracker._rebuild_exchange_order_id_index) as rebuild_mock:
+            self._track_and_untrack_orders(3 * ClientOrderTracker.MAX_CACHE_SIZE + 1)
+
+        self.assertEqual(3, rebuild_mock.call_count)
+
+    def test_fetch_orders_by_trading_pair(self):
+        orders: List[InFlightOrder] = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                price=Decimal("1.0"),
+            )
+            for i, trading_pair in enumerate([self.trading_pair, self.trading_pair, "COINBETA-HBOT"])
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+
+        self.assertEqual({order.client_order_id: order for order in orders[:2]},
+                         dict(self.tracker.fetch_orders_by_trading_pair(self.trading_pair)))
+        self.assertEqual({orders[2].client_order_id: orders[2]},
+                         dict(self.tracker.fetch_orders_by_trading_pair("COINBETA-HBOT")))
+
+        self.tracker.stop_tracking_order(orders[2].client_order_id)
+
+        self.assertEqual(0, len(self.tracker.fetch_orders_by_trading_pair("COINBETA-HBOT")))
+        self.assertNotIn("COINBETA-HBOT", self.tracker._active_orders_by_trading_pair)
+
+    def test_fetch_orders_by_state(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIn(order.client_order_id, self.tracker.fetch_orders_by_state(OrderState.PENDING_CREATE))
+        self.assertEqual(0, len(self.tracker.fetch_orders_by_state(OrderState.OPEN)))
+
+        self.tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        ))
+
+        self.assertEqual(0, len(self.tracker.fetch_orders_by_state(OrderState.PENDING_CREATE)))
+        self.assertIn(order.client_order_id, self.tracker.fetch_orders_by_state(OrderState.OPEN))
+
+        self.tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELLED,
+        ))
+
+        self.assertEqual(0, len(self.tracker.fetch_orders_by_state(OrderState.OPEN)))
+        self.assertEqual(0, len(self.tracker.fetch_orders_by_state(OrderState.CANCELLED)))
+
+    def test_all_orders_is_a_view_of_active_and_cached_orders(self):
+        all_orders = self.tracker.all_orders
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIn(order.client_order_id, all_orders)
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIn(order.client_order_id, all_orders)
+        self.assertIs(all_orders, self.tracker.all_orders)
+        self.assertEqual([order], list(all_orders.values()))
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
@@ -1,3 +1,6 @@
+import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from unittest import TestCase
@@ -16,6 +19,7 @@ from hummingbot.core.event.events import (
     PositionAction,
     TradeType
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -46,6 +50,44 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    @patch("hummingbot.model.sql_connection_manager.SQLConnectionManager.get_db_engine")
+    def file_db_manager(self, engine_mock) -> SQLConnectionManager:
+        # In memory SQLite databases are not shared between threads, the writer thread needs a database file
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test_DB.sqlite')}")
+        return SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_name="test_DB")
+
+    def create_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            exchange_order_id=f"E{order_id}",
+        )
+
+    def fill_event(self, order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"T{order_id}"
+        )
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -225,3 +267,142 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_started_recorder_writes_behind_in_order(self):
+        manager = self.file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        order_ids = [f"OID{i}-1642010000000000" for i in range(50)]
+        with patch.object(recorder, "_append_csv_row"):
+            for order_id in order_ids:
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(order_id))
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, self.fill_event(order_id))
+            asyncio.get_event_loop().run_until_complete(recorder.flush())
+
+        self.assertEqual(0, recorder.pending_writes)
+        with manager.get_new_session() as session:
+            orders = session.query(Order).order_by(Order.id).all()
+            self.assertEqual(50, len(orders))
+            for order in orders:
+                self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name],
+                                 [status.status for status in order.status])
+                self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+                self.assertEqual(1, len(order.trade_fills))
+
+    def test_stop_commits_pending_records(self):
+        manager = self.file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        recorder.start()
+
+        for i in range(10):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(f"OID{i}"))
+        recorder.stop()
+
+        self.assertIsNone(recorder._writer_thread)
+        with manager.get_new_session() as session:
+            self.assertEqual(10, session.query(Order).count())
+
+    def test_market_states_are_saved_with_latest_tracking_states(self):
+        manager = self.file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        for i in range(5):
+            self.tracking_states = {"orders": i}
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(f"OID{i}"))
+        asyncio.get_event_loop().run_until_complete(recorder.flush())
+
+        with manager.get_new_session() as session:
+            market_states = session.query(MarketState).all()
+            self.assertEqual(1, len(market_states))
+            self.assertEqual({"orders": 4}, market_states[0].saved_state)
+        self.assertEqual({}, recorder._pending_market_states)
+
+    def test_failing_record_does_not_discard_batch(self):
+        manager = self.file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+
+        def failing_write(session):
+            raise Exception("Test error")
+
+        items = [(lambda session: session.add(Order(id="OID1",
+                                                    config_file_path=self.config_file_path,
+                                                    strategy=self.strategy_name,
+                                                    market=self.display_name,
+                                                    symbol=self.trading_pair,
+                                                    base_asset=self.base,
+                                                    quote_asset=self.quote,
+                                                    creation_timestamp=0,
+                                                    order_type=OrderType.LIMIT.name,
+                                                    amount=Decimal(1),
+                                                    leverage=1,
+                                                    price=Decimal(1),
+                                                    last_status=MarketEvent.BuyOrderCreated.name,
+                                                    last_update_timestamp=0)), None),
+                 (failing_write, None)]
+        recorder._write_batch(items)
+
+        with manager.get_new_session() as session:
+            self.assertEqual(1, session.query(Order).count())
+
+    def test_failing_post_commit_callback_does_not_write_records_again(self):
+        manager = self.file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        callback_calls = []
+
+        def failing_callback():
+            callback_calls.append(1)
+            raise Exception("Test error")
+
+        def write_order(order_id: str):
+            def operation(session):
+                session.add(Order(id=order_id,
+                                  config_file_path=self.config_file_path,
+                                  strategy=self.strategy_name,
+                                  market=self.display_name,
+                                  symbol=self.trading_pair,
+                                  base_asset=self.base,
+                                  quote_asset=self.quote,
+                                  creation_timestamp=0,
+                                  order_type=OrderType.LIMIT.name,
+                                  amount=Decimal(1),
+                                  leverage=1,
+                                  price=Decimal(1),
+                                  last_status=MarketEvent.BuyOrderCreated.name,
+                                  last_update_timestamp=0))
+                return failing_callback
+            return operation
+
+        recorder._write_batch([(write_order("OID1"), None), (write_order("OID2"), None)])
+
+        self.assertEqual(2, len(callback_calls))
+        with manager.get_new_session() as session:
+            self.assertEqual(2, session.query(Order).count())
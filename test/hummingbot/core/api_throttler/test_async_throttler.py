@@ -5,6 +5,7 @@ import time
 import unittest
 
 from decimal import Decimal
+from unittest.mock import patch
 from typing import (
     Dict,
     List,
@@ -12,7 +13,7 @@ from typing import (
 
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog, TaskLogWindow
 
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
@@ -109,10 +110,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
+        self.throttler._task_logs.extend([
             TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        ])
 
         self.assertEqual(2, len(self.throttler._task_logs))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -224,3 +225,118 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
             )
+
+    def test_acquire_wakes_up_when_capacity_frees(self):
+        rate_limit = RateLimit(limit_id="SHORT", limit=1, time_interval=0.2)
+        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=[(rate_limit, rate_limit.weight)],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct,
+                                      retry_interval=10.0)
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(context.acquire(), 1.0))
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.5)
+
+    def test_time_until_capacity(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        now = time.time()
+        self.throttler._task_logs.append(TaskLog(timestamp=now - 2.0, rate_limit=self.rate_limits[2], weight=3))
+        self.throttler._task_logs.append(TaskLog(timestamp=now - 1.0, rate_limit=self.rate_limits[2], weight=3))
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=related_limits,
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+
+        # 6/10 used, a task of weight 5 fits once the first log (weight 3) expires
+        self.assertAlmostEqual(5.0 * 1.05 - 2.0, context.time_until_capacity(), delta=0.1)
+
+    def test_update_used_capacity_adds_untracked_weight(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.assertEqual(5, self.throttler._task_logs.used_capacity(TEST_WEIGHTED_POOL_ID, time.time()))
+
+        self.throttler.update_used_capacity(TEST_WEIGHTED_POOL_ID, 8)
+        self.assertEqual(8, self.throttler._task_logs.used_capacity(TEST_WEIGHTED_POOL_ID, time.time()))
+
+        # Usage below the local accounting is ignored
+        self.throttler.update_used_capacity(TEST_WEIGHTED_POOL_ID, 3)
+        self.assertEqual(8, self.throttler._task_logs.used_capacity(TEST_WEIGHTED_POOL_ID, time.time()))
+
+        # Unknown limits are ignored
+        self.throttler.update_used_capacity("UNKNOWN", 3)
+        self.assertEqual(0, self.throttler._task_logs.used_capacity("UNKNOWN", time.time()))
+
+        # A weight 5 task does not fit anymore
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler), 0.5))
+
+    def test_update_used_capacity_is_scaled_by_rate_limits_share_pct(self):
+        global_config_map["rate_limits_share_pct"].value = Decimal("50")
+        throttler = AsyncThrottler(rate_limits=self.rate_limits)
+
+        throttler.update_used_capacity(TEST_WEIGHTED_POOL_ID, 7)
+
+        self.assertEqual(4, throttler._task_logs.used_capacity(TEST_WEIGHTED_POOL_ID, time.time()))
+
+    def test_block_limit(self):
+        self.throttler.block_limit(TEST_WEIGHTED_POOL_ID, 30.0)
+
+        context = self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID)
+        self.assertFalse(context.within_capacity())
+        self.assertAlmostEqual(30.0, context.time_until_capacity(), delta=0.1)
+
+    def test_block_limit_shorter_than_rate_limit_period(self):
+        self.throttler.block_limit(TEST_WEIGHTED_POOL_ID, 2.0)
+
+        context = self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID)
+        self.assertFalse(context.within_capacity())
+        self.assertAlmostEqual(2.0, context.time_until_capacity(), delta=0.1)
+
+        with patch("hummingbot.core.api_throttler.async_throttler.time.time", return_value=time.time() + 2.5):
+            self.assertTrue(context.within_capacity())
+
+
+class TaskLogWindowUnitTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limit = RateLimit(limit_id="A", limit=10, time_interval=10.0)
+        self.other_rate_limit = RateLimit(limit_id="B", limit=10, time_interval=1.0)
+        self.window = TaskLogWindow(safety_margin_pct=0.1)
+
+    def test_used_capacity_is_tracked_per_limit_id(self):
+        self.window.append(TaskLog(timestamp=100.0, rate_limit=self.rate_limit, weight=2))
+        self.window.append(TaskLog(timestamp=100.5, rate_limit=self.rate_limit, weight=3))
+        self.window.append(TaskLog(timestamp=100.5, rate_limit=self.other_rate_limit, weight=4))
+
+        self.assertEqual(3, len(self.window))
+        self.assertEqual(5, self.window.used_capacity("A", 101.0))
+        self.assertEqual(4, self.window.used_capacity("B", 101.0))
+        self.assertEqual(0, self.window.used_capacity("C", 101.0))
+
+    def test_expired_logs_are_flushed_in_timestamp_order(self):
+        self.window.append(TaskLog(timestamp=100.0, rate_limit=self.rate_limit, weight=2))
+        self.window.append(TaskLog(timestamp=105.0, rate_limit=self.rate_limit, weight=3))
+
+        self.assertEqual(5, self.window.used_capacity("A", 111.0))
+        self.assertEqual(3, self.window.used_capacity("A", 111.1))
+        self.assertEqual(1, len(self.window))
+
+        self.window.flush(116.1)
+        self.assertEqual(0, len(self.window))
+        self.assertEqual([], list(self.window))
+
+    def test_time_until_capacity(self):
+        self.window.append(TaskLog(timestamp=100.0, rate_limit=self.rate_limit, weight=4))
+        self.window.append(TaskLog(timestamp=102.0, rate_limit=self.rate_limit, weight=4))
+
+        self.assertEqual(0.0, self.window.time_until_capacity(self.rate_limit, 2, 103.0))
+        self.assertAlmostEqual(8.0, self.window.time_until_capacity(self.rate_limit, 3, 103.0))
+        self.assertAlmostEqual(10.0, self.window.time_until_capacity(self.rate_limit, 7, 103.0))
+        self.assertIsNone(self.window.time_until_capacity(self.rate_limit, 11, 103.0))
@@ -0,0 +1,195 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.market_data_recorder import (
+    INDEX_DTYPE,
+    INDEX_FILE_EXTENSION,
+    INDEX_MAGIC,
+    MarketDataFileWriter,
+    MarketDataReader,
+    MarketDataRecorder,
+    RecordedRowType,
+    data_file_path,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.events import TradeType
+
+
+class MarketDataRecorderTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = data_file_path(self.temp_dir.name, self.trading_pair)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _diff(self, update_id: int, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [["99.5", "2"]],
+            "asks": [["100.5", "3"], ["101", "0"]],
+        }, timestamp)
+
+    def _trade(self, trade_id: int, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": trade_id,
+            "update_id": trade_id,
+            "price": "100",
+            "amount": "0.5",
+        }, timestamp)
+
+    def test_record_and_read_columns(self):
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.record_message(self._diff(1, 1000.0))
+        recorder.record_message(self._trade(7, 1001.0))
+        recorder.close()
+
+        reader = MarketDataReader(self.path)
+        columns = reader.read()
+
+        self.assertEqual(self.trading_pair, reader.trading_pair)
+        self.assertEqual([1000.0, 1000.0, 1000.0, 1001.0], columns["timestamp"].tolist())
+        self.assertEqual([1, 1, 1, 7], columns["update_id"].tolist())
+        self.assertEqual([RecordedRowType.DIFF_BID, RecordedRowType.DIFF_ASK, RecordedRowType.DIFF_ASK,
+                          RecordedRowType.TRADE_SELL], columns["row_type"].tolist())
+        self.assertEqual([99.5, 100.5, 101.0, 100.0], columns["price"].tolist())
+        self.assertEqual([2.0, 3.0, 0.0, 0.5], columns["amount"].tolist())
+
+    def test_read_time_range_across_chunks(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, max_chunk_rows=4)
+        for i in range(10):
+            recorder.record_message(self._trade(i, 1000.0 + i))
+        recorder.close()
+
+        reader = MarketDataReader(self.path)
+        chunks = list(reader.iter_chunks(1002.0, 1007.0))
+
+        self.assertEqual(3, len(reader.index))
+        self.assertEqual([[1002.0, 1003.0], [1004.0, 1005.0, 1006.0]], [chunk["timestamp"].tolist() for chunk in chunks])
+        self.assertEqual(list(range(2, 7)), reader.read(1002.0, 1007.0)["update_id"].tolist())
+        self.assertFalse(chunks[0]["price"].flags.writeable)
+
+    def test_chunk_written_when_duration_exceeded(self):
+        writer = MarketDataFileWriter(self.path, max_chunk_rows=100, max_chunk_duration=10.0)
+        writer.append(1000.0, 1, RecordedRowType.TRADE_BUY, 100.0, 1.0)
+        writer.append(1005.0, 2, RecordedRowType.TRADE_BUY, 100.0, 1.0)
+        self.assertEqual(2, writer.pending_row_count)
+
+        writer.append(1010.0, 3, RecordedRowType.TRADE_BUY, 100.0, 1.0)
+
+        self.assertEqual(0, writer.pending_row_count)
+        writer.close()
+
+    def test_timestamps_kept_non_decreasing(self):
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.record_message(self._trade(1, 1000.0))
+        recorder.record_message(self._trade(2, 999.0))
+        recorder.close()
+
+        self.assertEqual([1000.0, 1000.0], MarketDataReader(self.path).read()["timestamp"].tolist())
+
+    def test_reopened_file_appends_after_last_indexed_chunk(self):
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.record_message(self._trade(1, 1000.0))
+        recorder.close()
+        # A chunk written without its index entry, as after a crash
+        with open(self.path, "ab") as data_file:
+            data_file.write(b"\x00" * 40)
+
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.record_message(self._trade(2, 1001.0))
+        recorder.close()
+
+        reader = MarketDataReader(self.path)
+        self.assertEqual(2, len(reader.index))
+        self.assertEqual([1, 2], reader.read()["update_id"].tolist())
+        self.assertEqual(2 * 40, os.path.getsize(self.path))
+        self.assertEqual(len(INDEX_MAGIC) + 2 * INDEX_DTYPE.itemsize,
+                         os.path.getsize(self.path + INDEX_FILE_EXTENSION))
+
+    def test_record_order_book_as_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["99", "1"], ["98", "2"]], [["101", "3"]], 5)
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.record_order_book(self.trading_pair, order_book, 1000.0)
+        recorder.close()
+
+        messages = list(MarketDataReader(self.path).iter_messages())
+
+        self.assertEqual(1, len(messages))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, messages[0].type)
+        self.assertEqual(5, messages[0].update_id)
+        self.assertEqual([[99.0, 1.0], [98.0, 2.0]], messages[0].content["bids"])
+        self.assertEqual([[101.0, 3.0]], messages[0].content["asks"])
+
+    def test_iter_messages_rebuilds_recorded_messages(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, max_chunk_rows=2)
+        recorder.record_message(self._diff(1, 1000.0))
+        recorder.record_message(self._diff(2, 1000.0))
+        recorder.record_message(self._trade(3, 1001.0))
+        recorder.close()
+
+        messages = list(MarketDataReader(self.path).iter_messages())
+
+        self.assertEqual([OrderBookMessageType.DIFF, OrderBookMessageType.DIFF, OrderBookMessageType.TRADE],
+                         [message.type for message in messages])
+        self.assertEqual([1, 2], [messages[0].update_id, messages[1].update_id])
+        self.assertEqual([[99.5, 2.0]], messages[1].content["bids"])
+        self.assertEqual([[100.5, 3.0], [101.0, 0.0]], messages[1].content["asks"])
+        self.assertEqual(3, messages[2].trade_id)
+        self.assertEqual(float(TradeType.SELL.value), messages[2].content["trade_type"])
+
+    def test_empty_recording(self):
+        MarketDataFileWriter(self.path).close()
+
+        reader = MarketDataReader(self.path)
+
+        self.assertEqual(0, reader.row_count)
+        self.assertEqual(0, len(reader.read()["timestamp"]))
+        self.assertEqual([], list(reader.iter_messages()))
+        self.assertIsInstance(reader.index, np.ndarray)
+
+    def test_close_closes_files_and_recording_reopens_them(self):
+        recorder = MarketDataRecorder(self.temp_dir.name)
+        recorder.record_message(self._trade(1, 1000.0))
+        writer = recorder._writer(self.trading_pair)
+        recorder.close()
+
+        self.assertTrue(writer._data_file.closed)
+        self.assertTrue(writer._index_file.closed)
+
+        recorder.record_message(self._trade(2, 1001.0))
+        recorder.close()
+        self.assertEqual([1, 2], MarketDataReader(self.path).read()["update_id"].tolist())
+
+    def test_chunks_written_off_the_calling_thread(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, max_chunk_rows=2)
+        writer = recorder._writer(self.trading_pair)
+        write_threads = []
+        write_columns = writer._write_columns
+
+        def record_thread(columns):
+            write_threads.append(threading.current_thread())
+            write_columns(columns)
+
+        writer._write_columns = record_thread
+        recorder.record_message(self._trade(1, 1000.0))
+        recorder.record_message(self._trade(2, 1001.0))
+        recorder.flush()
+
+        self.assertEqual(1, len(write_threads))
+        self.assertNotEqual(threading.current_thread(), write_threads[0])
+        self.assertEqual([1, 2], MarketDataReader(self.path).read()["update_id"].tolist())
+        recorder.close()
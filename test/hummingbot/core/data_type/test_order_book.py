@@ -50,6 +50,131 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_index_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 3)
+        self.assertEqual(3, result.result_price)
+        result = order_book.get_price_for_volume(True, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((4 + 5) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((3 * 3 + 2) / 4, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 7)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 14)
+        self.assertEqual(5, result.result_price)
+        result = order_book.get_price_for_quote_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(14, result.result_volume)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertAlmostEqual(9, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertAlmostEqual(14, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 5.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 3.5)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 2)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(13, result.result_volume)
+
+    def test_depth_index_invalidated_by_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(5, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_numpy_diffs(np.array([[2, 0, 2]], dtype=np.float64),
+                                     np.array([[4, 3, 2]], dtype=np.float64))
+        self.assertEqual(4, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(1, order_book.get_price_for_volume(False, 1).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(False, 2).result_price))
+
+    def test_depth_arrays(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 3, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.depth_arrays()
+        self.assertEqual([[3, 3, 3], [2, 2, 2], [1, 1, 1]], bids.tolist())
+        self.assertEqual([[4, 1, 1], [5, 2, 2], [6, 3, 3]], asks.tolist())
+
+        bids, asks = order_book.depth_arrays(2)
+        self.assertEqual([[3, 3, 3], [2, 2, 2]], bids.tolist())
+        self.assertEqual([[4, 1, 1], [5, 2, 2]], asks.tolist())
+
+    def test_depth_arrays_reuses_buffers(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        bids_buffer = np.zeros((5, 3))
+        asks_buffer = np.zeros((1, 3))
+
+        bids, asks = order_book.depth_arrays(5, bids_buffer, asks_buffer)
+
+        self.assertTrue(np.shares_memory(bids, bids_buffer))
+        self.assertTrue(np.shares_memory(asks, asks_buffer))
+        self.assertEqual([[2, 2, 2], [1, 1, 1]], bids.tolist())
+        self.assertEqual([[4, 1, 1]], asks.tolist())
+
+        with self.assertRaises(ValueError):
+            order_book.depth_arrays(5, np.zeros((5, 2)), asks_buffer)
+
+    def test_snapshot_of_empty_book(self):
+        bids, asks = OrderBook().snapshot
+        self.assertEqual(["price", "amount", "update_id"], list(bids.columns))
+        self.assertTrue(bids.empty)
+        self.assertTrue(asks.empty)
+
+    def test_apply_raw_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["1.5", "10.0"], ["1.4", "5", "extra"]], [["1.6", "3.25"]], 10)
+
+        bids, asks = order_book.depth_arrays()
+        self.assertEqual([[1.5, 10, 10], [1.4, 5, 10]], bids.tolist())
+        self.assertEqual([[1.6, 3.25, 10]], asks.tolist())
+        self.assertEqual(10, order_book.snapshot_uid)
+
+        order_book.apply_raw_diffs([["1.5", "0.00000000"]], [[1.7, 2.0]], 11)
+
+        bids, asks = order_book.depth_arrays()
+        self.assertEqual([[1.4, 5, 10]], bids.tolist())
+        self.assertEqual([[1.6, 3.25, 10], [1.7, 2, 11]], asks.tolist())
+        self.assertEqual(11, order_book.last_diff_uid)
+
+    def test_apply_raw_diffs_from_packed_buffer(self):
+        order_book = OrderBook()
+        order_book.apply_raw_diffs(np.array([[1.5, 10.0], [1.4, 5.0]]), np.array([[1.6, 3.0, 99.0]]), 7)
+
+        bids, asks = order_book.depth_arrays()
+        self.assertEqual([[1.5, 10, 7], [1.4, 5, 7]], bids.tolist())
+        self.assertEqual([[1.6, 3, 7]], asks.tolist())
+
+    def test_apply_raw_diffs_invalid_value(self):
+        order_book = OrderBook()
+        with self.assertRaises(ValueError):
+            order_book.apply_raw_diffs([["not a number", "1"]], [], 1)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -119,6 +119,26 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_has_raw_entries(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return []
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1},
+            timestamp=time.time(),
+        )
+        self.assertTrue(msg.has_raw_entries)
+
+        msg = CustomOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1},
+            timestamp=time.time(),
+        )
+        self.assertFalse(msg.has_raw_entries)
+
     def test_has_update_id(self):
         update_id = "someId"
 
@@ -0,0 +1,289 @@
+import asyncio
+import time
+import unittest
+from typing import List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracking_task: Optional[asyncio.Task] = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def _create_tracker(self, **kwargs) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair], **kwargs)
+        tracker._order_books[self.trading_pair] = OrderBook()
+        tracker._tracking_message_queues[self.trading_pair] = tracker._create_tracking_message_queue()
+        return tracker
+
+    def _diff(self, update_id: int, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=time.time())
+
+    def _enqueue(self, tracker: OrderBookTracker, messages: List[OrderBookMessage]):
+        for message in messages:
+            tracker._tracking_message_queues[self.trading_pair].put_nowait(message)
+
+    def _run_tracking(self, tracker: OrderBookTracker):
+        self.tracking_task = self.ev_loop.create_task(tracker._track_single_book(self.trading_pair))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+    def test_diffs_applied_one_by_one_by_default(self):
+        tracker = self._create_tracker()
+        self._enqueue(tracker, [self._diff(1, [["1.0", "1"]], [["2.0", "1"]]),
+                                self._diff(2, [["1.0", "3"]], [])])
+
+        self._run_tracking(tracker)
+
+        metrics = tracker.tracking_metrics[self.trading_pair]
+        self.assertEqual(2, metrics.diffs_applied)
+        self.assertEqual(0, metrics.diffs_coalesced)
+        bids, asks = tracker.order_books[self.trading_pair].depth_arrays()
+        self.assertEqual([[1.0, 3.0, 2.0]], bids.tolist())
+        self.assertEqual([[2.0, 1.0, 1.0]], asks.tolist())
+
+    def test_pending_diffs_coalesced(self):
+        tracker = self._create_tracker(coalesce_diffs=True)
+        self._enqueue(tracker, [self._diff(1, [["1.0", "1"], ["0.9", "1"]], [["2.0", "1"]]),
+                                self._diff(2, [["1.0", "3"]], [["2.1", "1"]]),
+                                self._diff(3, [["0.9", "0"]], [["2.0", "0"]])])
+
+        self._run_tracking(tracker)
+
+        metrics = tracker.tracking_metrics[self.trading_pair]
+        self.assertEqual(3, metrics.diffs_applied)
+        self.assertEqual(2, metrics.diffs_coalesced)
+        self.assertEqual(0, metrics.queue_size)
+        self.assertEqual(3, len(tracker._past_diffs_windows[self.trading_pair]))
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual(3, order_book.last_diff_uid)
+        bids, asks = order_book.depth_arrays()
+        self.assertEqual([[1.0, 3.0, 2.0]], bids.tolist())
+        self.assertEqual([[2.1, 1.0, 2.0]], asks.tolist())
+
+    def test_coalescing_stops_at_snapshot(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": 2,
+            "bids": [["0.5", "1"]],
+            "asks": [["3.0", "1"]],
+        }, timestamp=time.time())
+        messages = [self._diff(1, [["1.0", "1"]], []), snapshot, self._diff(3, [["0.6", "2"]], [])]
+        tracker = self._create_tracker()
+        coalescing_tracker = self._create_tracker(coalesce_diffs=True)
+        self._enqueue(tracker, messages)
+        self._enqueue(coalescing_tracker, messages)
+
+        self._run_tracking(tracker)
+        self.tracking_task.cancel()
+        self._run_tracking(coalescing_tracker)
+
+        order_book = coalescing_tracker.order_books[self.trading_pair]
+        self.assertEqual(2, order_book.snapshot_uid)
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(0, coalescing_tracker.tracking_metrics[self.trading_pair].diffs_coalesced)
+        for expected, coalesced in zip(tracker.order_books[self.trading_pair].depth_arrays(),
+                                       order_book.depth_arrays()):
+            self.assertEqual(expected.tolist(), coalesced.tolist())
+
+    def test_router_merges_diffs_at_high_water_mark(self):
+        tracker = self._create_tracker(message_queue_high_water_mark=1)
+        message_queue = tracker._tracking_message_queues[self.trading_pair]
+        tracker._put_tracking_message(self.trading_pair, message_queue, self._diff(1, [["1.0", "1"]], []))
+        tracker._put_tracking_message(self.trading_pair, message_queue, self._diff(2, [["1.0", "2"]], [["2.0", "1"]]))
+        tracker._put_tracking_message(self.trading_pair, message_queue, self._diff(3, [["0.9", "1"]], [["2.0", "3"]]))
+
+        metrics = tracker.tracking_metrics[self.trading_pair]
+        self.assertEqual(1, metrics.queue_size)
+        self.assertEqual(1, metrics.max_queue_size)
+        self.assertEqual(2, metrics.queue_full_count)
+        self.assertEqual(1, metrics.diffs_coalesced)
+        overflow = tracker._overflow_messages[self.trading_pair]
+        self.assertEqual(1, len(overflow))
+        self.assertEqual(2, overflow[0].first_update_id)
+        self.assertEqual(3, overflow[0].update_id)
+
+        self._run_tracking(tracker)
+
+        self.assertNotIn(self.trading_pair, tracker._overflow_messages)
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual(3, order_book.last_diff_uid)
+        bids, asks = order_book.depth_arrays()
+        self.assertEqual([[1.0, 2.0, 3.0], [0.9, 1.0, 3.0]], bids.tolist())
+        self.assertEqual([[2.0, 3.0, 3.0]], asks.tolist())
+
+    def test_full_queue_does_not_hold_up_other_trading_pairs(self):
+        other_trading_pair = "OTHER-HBOT"
+        tracker = self._create_tracker(message_queue_high_water_mark=1)
+        tracker._order_books[other_trading_pair] = OrderBook()
+        tracker._tracking_message_queues[other_trading_pair] = tracker._create_tracking_message_queue()
+        for update_id in range(1, 4):
+            tracker._order_book_diff_stream.put_nowait(self._diff(update_id, [["1.0", str(update_id)]], []))
+        other_diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": other_trading_pair, "update_id": 1, "bids": [["5.0", "1"]], "asks": []
+        }, timestamp=time.time())
+        tracker._order_book_diff_stream.put_nowait(other_diff)
+
+        router_task = self.ev_loop.create_task(tracker._order_book_diff_router())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        router_task.cancel()
+
+        self.assertEqual(0, tracker._order_book_diff_stream.qsize())
+        self.assertEqual(1, tracker._tracking_message_queues[other_trading_pair].qsize())
+        self.assertEqual(3, tracker._overflow_messages[self.trading_pair][0].update_id)
+
+    def test_snapshot_supersedes_held_back_diffs(self):
+        tracker = self._create_tracker(message_queue_high_water_mark=1)
+        message_queue = tracker._tracking_message_queues[self.trading_pair]
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair, "update_id": 3, "bids": [["0.5", "1"]], "asks": [["3.0", "1"]]
+        }, timestamp=time.time())
+        tracker._put_tracking_message(self.trading_pair, message_queue, self._diff(1, [], []))
+        tracker._put_tracking_message(self.trading_pair, message_queue, self._diff(2, [["1.0", "1"]], []))
+        tracker._put_tracking_message(self.trading_pair, message_queue, snapshot)
+        tracker._put_tracking_message(self.trading_pair, message_queue, self._diff(4, [["0.6", "1"]], []))
+
+        overflow = tracker._overflow_messages[self.trading_pair]
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF], [m.type for m in overflow])
+        self.assertEqual([3, 4], [m.update_id for m in overflow])
+
+    def test_coalescing_opt_in_per_connector(self):
+        class CoalescingTracker(OrderBookTracker):
+            COALESCE_DIFFS = True
+            MESSAGE_QUEUE_HIGH_WATER_MARK = 100
+
+        tracker = CoalescingTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+
+        self.assertTrue(tracker._coalesce_diffs)
+        self.assertEqual(100, tracker._create_tracking_message_queue().maxsize)
+
+    def _snapshot_order_book(self, update_id: int) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["1.0", "1"]], [["2.0", "1"]], update_id)
+        return order_book
+
+    def test_init_order_books_concurrently_when_data_source_opts_in(self):
+        trading_pairs = ["A-B", "C-D", "E-F"]
+        data_source = MagicMock()
+        data_source.CONCURRENT_SNAPSHOT_REQUESTS = True
+        pending_requests: List[str] = []
+        release = asyncio.Event()
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            pending_requests.append(trading_pair)
+            await release.wait()
+            return self._snapshot_order_book(1)
+
+        data_source.get_new_order_book = get_new_order_book
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+
+        init_task = self.ev_loop.create_task(tracker._init_order_books())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(trading_pairs, pending_requests)
+        self.assertFalse(tracker.ready)
+
+        release.set()
+        self.ev_loop.run_until_complete(init_task)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(trading_pairs, list(tracker.order_books.keys()))
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    def test_init_order_books_sequentially_by_default(self, sleep_mock):
+        data_source = MagicMock()
+        data_source.CONCURRENT_SNAPSHOT_REQUESTS = OrderBookTrackerDataSource.CONCURRENT_SNAPSHOT_REQUESTS
+        data_source.get_new_order_book = AsyncMock(side_effect=[self._snapshot_order_book(1),
+                                                                Exception("Snapshot request failed"),
+                                                                self._snapshot_order_book(2)])
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=["A-B", "C-D"])
+
+        self.ev_loop.run_until_complete(tracker._init_order_books())
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(3, data_source.get_new_order_book.call_count)
+        self.assertEqual([1.0, OrderBookTracker.ORDER_BOOK_INIT_RETRY_INTERVAL, 1.0],
+                         [call.args[0] for call in sleep_mock.call_args_list])
+        self.assertEqual(2, tracker.order_books["C-D"].snapshot_uid)
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    def test_order_books_ready_one_by_one(self):
+        data_source = MagicMock()
+        data_source.CONCURRENT_SNAPSHOT_REQUESTS = True
+        snapshot_requests = {"A-B": asyncio.Event(), "C-D": asyncio.Event()}
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            await snapshot_requests[trading_pair].wait()
+            return self._snapshot_order_book(1)
+
+        data_source.get_new_order_book = get_new_order_book
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=["A-B", "C-D"])
+
+        init_task = self.ev_loop.create_task(tracker._init_order_books())
+        snapshot_requests["C-D"].set()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+        self.assertFalse(tracker.ready)
+        self.assertEqual(["C-D"], list(tracker.order_books.keys()))
+        self.assertIn("C-D", tracker._tracking_tasks)
+
+        snapshot_requests["A-B"].set()
+        self.ev_loop.run_until_complete(init_task)
+        self.assertEqual({"A-B", "C-D"}, set(tracker.order_books.keys()))
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    def test_diffs_received_during_initialization_applied_after_snapshot(self):
+        data_source = MagicMock()
+        data_source.CONCURRENT_SNAPSHOT_REQUESTS = True
+        data_source.get_new_order_book = AsyncMock(return_value=self._snapshot_order_book(2))
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        router_task = self.ev_loop.create_task(tracker._order_book_diff_router())
+        tracker._order_book_diff_stream.put_nowait(self._diff(1, [["0.5", "1"]], []))
+        tracker._order_book_diff_stream.put_nowait(self._diff(3, [["0.9", "1"]], []))
+        tracker._order_book_diff_stream.put_nowait(
+            OrderBookMessage(OrderBookMessageType.DIFF, {"trading_pair": "OTHER-PAIR", "update_id": 3})
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+        self.ev_loop.run_until_complete(tracker._init_order_books())
+        router_task.cancel()
+
+        bids, _ = tracker.order_books[self.trading_pair].depth_arrays()
+        self.assertEqual([[1.0, 1.0, 2.0], [0.9, 1.0, 3.0]], bids.tolist())
+        self.assertNotIn("OTHER-PAIR", tracker._pre_init_diffs)
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    def test_tracked_messages_recorded(self):
+        recorder = MagicMock()
+        tracker = self._create_tracker(market_data_recorder=recorder)
+        diffs = [self._diff(1, [["1.0", "1"]], []), self._diff(2, [["1.0", "3"]], [])]
+        self._enqueue(tracker, diffs)
+
+        self._run_tracking(tracker)
+
+        recorder.record_order_book.assert_called_once()
+        self.assertEqual(self.trading_pair, recorder.record_order_book.call_args[0][0])
+        self.assertEqual(diffs, [call[0][0] for call in recorder.record_message.call_args_list])
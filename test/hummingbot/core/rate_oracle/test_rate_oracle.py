@@ -10,8 +10,8 @@ from yarl import URL
 
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.core.mock_api.mock_web_server import MockWebServer
-from hummingbot.core.rate_oracle.utils import find_rate
-from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.utils import find_rate, RateConversionGraph
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
 from .fixture import Fixture
 
 
@@ -78,6 +78,20 @@ class RateOracleTest(unittest.TestCase):
         cls.web_app.stop()
         cls._patcher.stop()
 
+    def setUp(self) -> None:
+        super().setUp()
+        self._source = RateOracle.source
+        self._global_token = RateOracle.global_token
+        self._streaming = RateOracle.streaming
+        RateOracle._cached_rate_graph = None
+
+    def tearDown(self) -> None:
+        RateOracle.source = self._source
+        RateOracle.global_token = self._global_token
+        RateOracle.streaming = self._streaming
+        RateOracle._cached_rate_graph = None
+        super().tearDown()
+
     def test_find_rate_from_source(self):
         self.ev_loop.run_until_complete(self._test_find_rate_from_source())
 
@@ -120,6 +134,167 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_rate_conversion_graph_multi_hop_routes(self):
+        prices = {"HBOT-USDT": Decimal("100"), "ETH-BTC": Decimal("0.05"), "BTC-USDT": Decimal("40000"),
+                  "USDT-GBP": Decimal("0.75"), "EUR-GBP": Decimal("0.8"), "ZBOT-XBOT": Decimal("2")}
+        graph = RateConversionGraph(prices)
+        self.assertEqual(Decimal("1"), graph.rate("HBOT-HBOT"))
+        self.assertEqual(Decimal("100"), graph.rate("HBOT-USDT"))
+        self.assertEqual(Decimal("0.01"), graph.rate("USDT-HBOT"))
+        # USDT-BTC-ETH, the first conversion uses an inverted pair
+        self.assertEqual(Decimal("1") / Decimal("40000") / Decimal("0.05"), graph.rate("USDT-ETH"))
+        # HBOT-USDT-BTC-ETH
+        self.assertEqual(Decimal("100") / Decimal("40000") / Decimal("0.05"), graph.rate("HBOT-ETH"))
+        # ETH-BTC-USDT-GBP-EUR
+        self.assertEqual([("ETH-BTC", False), ("BTC-USDT", False), ("USDT-GBP", False), ("EUR-GBP", True)],
+                         graph.route("ETH-EUR"))
+        self.assertEqual(Decimal("0.05") * Decimal("40000") * Decimal("0.75") / Decimal("0.8"), graph.rate("ETH-EUR"))
+        self.assertIsNone(graph.rate("HBOT-ZBOT"))
+        self.assertIsNone(graph.rate("HBOT-NONE"))
+
+    def test_rate_conversion_graph_route_length_limit(self):
+        prices = {f"A{i}-A{i + 1}": Decimal("2") for i in range(RateConversionGraph.MAX_ROUTE_HOPS + 1)}
+        graph = RateConversionGraph(prices)
+        self.assertEqual(Decimal("2") ** RateConversionGraph.MAX_ROUTE_HOPS,
+                         graph.rate(f"A0-A{RateConversionGraph.MAX_ROUTE_HOPS}"))
+        self.assertIsNone(graph.rate(f"A0-A{RateConversionGraph.MAX_ROUTE_HOPS + 1}"))
+
+    def test_rate_conversion_graph_prefers_shortest_route(self):
+        prices = {"HBOT-BTC": Decimal("0.001"), "BTC-ETH": Decimal("20"), "ETH-USDT": Decimal("2"),
+                  "HBOT-USDT": Decimal("100")}
+        graph = RateConversionGraph(prices)
+        self.assertEqual([("HBOT-USDT", False)], graph.route("HBOT-USDT"))
+        self.assertEqual([("HBOT-BTC", False), ("BTC-ETH", False)], graph.route("HBOT-ETH"))
+
+    def test_rate_conversion_graph_carries_over_routes_and_precomputed_pairs(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")}
+        graph = RateConversionGraph(prices)
+        graph.precompute(["HBOT-AAVE", "ZBOT-USDT"])
+
+        new_prices = {"HBOT-USDT": Decimal("120"), "AAVE-USDT": Decimal("40")}
+        with mock.patch.object(RateConversionGraph, "_find_route") as find_route_mock:
+            new_graph = RateConversionGraph(new_prices, previous=graph)
+            find_route_mock.assert_not_called()
+        self.assertIs(graph._links, new_graph._links)
+        self.assertEqual({"HBOT-AAVE": Decimal("3"), "ZBOT-USDT": None}, new_graph._rates)
+        # The previous graph keeps its own rates
+        self.assertEqual(Decimal("2"), graph.rate("HBOT-AAVE"))
+
+        new_pair_prices = {"HBOT-USDT": Decimal("120"), "ZBOT-HBOT": Decimal("0.5")}
+        new_pair_graph = RateConversionGraph(new_pair_prices, previous=new_graph)
+        self.assertIsNot(new_graph._links, new_pair_graph._links)
+        self.assertEqual(Decimal("60"), new_pair_graph.rate("ZBOT-USDT"))
+        self.assertIsNone(new_pair_graph.rate("HBOT-AAVE"))
+
+    def test_rate_conversion_graph_zero_price(self):
+        graph = RateConversionGraph({"HBOT-USDT": Decimal("0"), "USDT-GBP": Decimal("0.75")})
+        self.assertIsNone(graph.rate("HBOT-GBP"))
+        self.assertIsNone(graph.rate("GBP-HBOT"))
+
+    def test_rate_uses_graph_of_latest_prices(self):
+        oracle = RateOracle()
+        oracle.precompute_rates(["HBOT-GBP"])
+        oracle._set_prices({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")})
+        self.assertEqual({"HBOT-GBP": Decimal("75")}, oracle._rate_graph._rates)
+        self.assertEqual(Decimal("75"), oracle.rate("HBOT-GBP"))
+        oracle._set_prices({"HBOT-USDT": Decimal("200"), "USDT-GBP": Decimal("0.75")})
+        self.assertEqual(Decimal("150"), oracle.rate("HBOT-GBP"))
+
+    @mock.patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle.get_prices")
+    def test_global_rate_reuses_graph_of_cached_prices(self, get_prices_mock):
+        RateOracle.source = RateOracleSource.binance
+        RateOracle.global_token = "USDT"
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")}
+        get_prices_mock.return_value = prices
+        self.assertEqual(Decimal("100"), self.ev_loop.run_until_complete(RateOracle.global_rate("HBOT")))
+        graph = RateOracle._cached_rate_graph
+        self.assertIs(prices, graph.prices)
+        self.assertEqual(Decimal("2"), self.ev_loop.run_until_complete(RateOracle.rate_async("HBOT-AAVE")))
+        self.assertIs(graph, RateOracle._cached_rate_graph)
+
+        get_prices_mock.return_value = {"HBOT-USDT": Decimal("110"), "AAVE-USDT": Decimal("55")}
+        self.assertEqual(Decimal("110"), self.ev_loop.run_until_complete(RateOracle.global_rate("HBOT")))
+        self.assertIsNot(graph, RateOracle._cached_rate_graph)
+
+    def test_stream_trading_pairs(self):
+        oracle = RateOracle()
+        oracle.source = RateOracleSource.binance
+        oracle.streaming = True
+        self.assertEqual(set(), oracle._stream_trading_pairs())
+        oracle._set_prices({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "AAVE-USDT": Decimal("50")})
+        self.assertEqual(set(), oracle._stream_trading_pairs())
+        oracle.precompute_rates(["HBOT-GBP"])
+        self.assertEqual({"HBOT-USDT", "USDT-GBP"}, oracle._stream_trading_pairs())
+        oracle.rate("AAVE-USDT")
+        self.assertEqual({"HBOT-USDT", "USDT-GBP", "AAVE-USDT"}, oracle._stream_trading_pairs())
+
+        oracle.source = RateOracleSource.coingecko
+        self.assertEqual(set(), oracle._stream_trading_pairs())
+        oracle.source = RateOracleSource.kucoin
+        oracle.streaming = False
+        self.assertEqual(set(), oracle._stream_trading_pairs())
+
+    def test_ticker_updates_applied_on_rate(self):
+        oracle = RateOracle()
+        oracle._set_prices({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "AAVE-USDT": Decimal("50")})
+        oracle.precompute_rates(["HBOT-GBP"])
+        graph = oracle._rate_graph
+        oracle._ticker_updates["HBOT-USDT"] = ("190", "210")
+        oracle._ticker_updates["AAVE-USDT"] = ("0", "51")
+        self.assertEqual(Decimal("150"), oracle.rate("HBOT-GBP"))
+        self.assertEqual(Decimal("50"), oracle.rate("AAVE-USDT"))
+        self.assertEqual({}, oracle._ticker_updates)
+        self.assertIs(graph, oracle._rate_graph)
+
+    def test_rate_conversion_graph_update_prices(self):
+        graph = RateConversionGraph({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"),
+                                     "AAVE-USDT": Decimal("50")})
+        graph.precompute(["HBOT-GBP", "AAVE-USDT"])
+        with mock.patch.object(graph, "_find_rate", wraps=graph._find_rate) as find_rate_mock:
+            graph.update_prices({"HBOT-USDT": Decimal("200"), "ZBOT-USDT": Decimal("10")})
+        find_rate_mock.assert_called_once_with("HBOT-GBP")
+        self.assertEqual(Decimal("150"), graph.rate("HBOT-GBP"))
+        self.assertEqual(Decimal("50"), graph.rate("AAVE-USDT"))
+        self.assertNotIn("ZBOT-USDT", graph.prices)
+
+    def test_stream_failure_falls_back_to_rest(self):
+        oracle = RateOracle()
+        oracle.source = RateOracleSource.binance
+        oracle.streaming = True
+        oracle._set_prices({"HBOT-USDT": Decimal("100")})
+        oracle.precompute_rates(["HBOT-USDT"])
+        stream = mock.MagicMock()
+        stream.listen = mock.AsyncMock(side_effect=ConnectionError("Test disconnection"))
+        oracle._streams[RateOracleSource.binance] = stream
+
+        self.ev_loop.run_until_complete(oracle._stream_prices(oracle._stream_trading_pairs()))
+
+        stream.listen.assert_called_once_with({"HBOT-USDT"}, oracle._ticker_updates)
+        self.assertEqual(set(), oracle._stream_trading_pairs())
+
+    def test_stream_restarted_when_other_pairs_needed(self):
+        oracle = RateOracle()
+        oracle.source = RateOracleSource.kucoin
+        oracle.streaming = True
+        oracle.STREAM_CHECK_INTERVAL = 0.01
+        oracle._set_prices({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+        oracle.precompute_rates(["HBOT-USDT"])
+        listen_event = asyncio.Event()
+
+        async def listen(trading_pairs, updates):
+            await listen_event.wait()
+
+        stream = mock.MagicMock()
+        stream.listen = listen
+        oracle._streams[RateOracleSource.kucoin] = stream
+
+        stream_task = self.ev_loop.create_task(oracle._stream_prices(oracle._stream_trading_pairs()))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertFalse(stream_task.done())
+        oracle.rate("AAVE-HBOT")
+        self.ev_loop.run_until_complete(asyncio.wait_for(stream_task, 1))
+        self.assertEqual({"HBOT-USDT", "AAVE-USDT"}, oracle._stream_trading_pairs())
+
     def test_get_binance_prices(self):
         self.ev_loop.run_until_complete(self._test_get_binance_prices())
 
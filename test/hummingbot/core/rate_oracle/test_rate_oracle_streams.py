@@ -0,0 +1,121 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from bidict import bidict
+
+from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.core.rate_oracle.rate_oracle_streams import BinanceRateOracleStream, KucoinRateOracleStream
+from test.hummingbot.connector.network_mocking_assistant import NetworkMockingAssistant
+
+
+class RateOracleStreamsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.listening_task = None
+        self.updates = {}
+        BinanceAPIOrderBookDataSource._trading_pair_symbol_map = {
+            "com": bidict({"BTCUSDT": "BTC-USDT", "ETHBTC": "ETH-BTC", "LTCBTC": "LTC-BTC"}),
+            "us": bidict({"BTCUSD": "BTC-USD"})
+        }
+
+    def tearDown(self):
+        self.listening_task and self.listening_task.cancel()
+        BinanceAPIOrderBookDataSource._trading_pair_symbol_map = {}
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_binance_stream_follows_book_tickers_of_both_domains(self, ws_connect_mock):
+        websockets = {
+            BinanceRateOracleStream.WSS_URL.format("com"): self.mocking_assistant.create_websocket_mock(),
+            BinanceRateOracleStream.WSS_URL.format("us"): self.mocking_assistant.create_websocket_mock(),
+        }
+        ws_connect_mock.side_effect = lambda url, **kwargs: websockets[url]
+        com_ws = websockets[BinanceRateOracleStream.WSS_URL.format("com")]
+        us_ws = websockets[BinanceRateOracleStream.WSS_URL.format("us")]
+        self.mocking_assistant.add_websocket_aiohttp_message(com_ws, json.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            com_ws, json.dumps({"u": 1, "s": "BTCUSDT", "b": "40000.1", "B": "1", "a": "40000.3", "A": "2"}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            com_ws, json.dumps({"u": 2, "s": "ETHBTC", "b": "0.05", "B": "1", "a": "0.06", "A": "2"}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            us_ws, json.dumps({"u": 1, "s": "BTCUSD", "b": "40001", "B": "1", "a": "40003", "A": "2"}))
+
+        stream = BinanceRateOracleStream()
+        self.listening_task = self.ev_loop.create_task(stream.listen({"BTC-USDT", "BTC-USD"}, self.updates))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(com_ws)
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(us_ws)
+
+        self.assertEqual({"BTC-USDT": ("40000.1", "40000.3"), "BTC-USD": ("40001", "40003")}, self.updates)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@bookTicker"], "id": 1}],
+                         self.mocking_assistant.json_messages_sent_through_websocket(com_ws))
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusd@bookTicker"], "id": 1}],
+                         self.mocking_assistant.json_messages_sent_through_websocket(us_ws))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_binance_stream_splits_subscriptions(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, json.dumps({"result": None, "id": 1}))
+
+        stream = BinanceRateOracleStream()
+        stream.SUBSCRIPTIONS_PER_REQUEST = 2
+        self.listening_task = self.ev_loop.create_task(
+            stream.listen({"BTC-USDT", "ETH-BTC", "LTC-BTC"}, self.updates))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([1, 2], [message["id"] for message in sent_messages])
+        self.assertEqual({"btcusdt@bookTicker", "ethbtc@bookTicker", "ltcbtc@bookTicker"},
+                         {param for message in sent_messages for param in message["params"]})
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_binance_stream_raises_when_disconnected(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.return_value.receive.side_effect = ConnectionError("Test disconnection")
+
+        stream = BinanceRateOracleStream()
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(stream.listen({"BTC-USDT"}, self.updates))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.request")
+    def test_kucoin_stream_follows_tickers(self, request_mock, ws_connect_mock):
+        self.mocking_assistant.configure_http_request_mock(request_mock)
+        self.mocking_assistant.add_http_response(
+            request_mock, 200,
+            {"code": "200000",
+             "data": {"token": "test-token",
+                      "instanceServers": [{"endpoint": "wss://test.kucoin.com/endpoint", "protocol": "websocket",
+                                           "encrypt": True, "pingInterval": 18000, "pingTimeout": 10000}]}})
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        ws = ws_connect_mock.return_value
+        self.mocking_assistant.add_websocket_aiohttp_message(ws, json.dumps({"id": "1", "type": "welcome"}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws, json.dumps({"type": "message", "topic": "/market/ticker:BTC-USDT", "subject": "trade.ticker",
+                            "data": {"sequence": "1", "price": "40000.2", "size": "1", "bestAsk": "40000.3",
+                                     "bestAskSize": "1", "bestBid": "40000.1", "bestBidSize": "1"}}))
+
+        stream = KucoinRateOracleStream()
+        self.listening_task = self.ev_loop.create_task(stream.listen({"BTC-USDT"}, self.updates))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws)
+
+        self.assertEqual("wss://test.kucoin.com/endpoint?token=test-token", ws_connect_mock.call_args[0][0])
+        self.assertEqual({"BTC-USDT": ("40000.1", "40000.3")}, self.updates)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws)
+        self.assertEqual(1, len(sent_messages))
+        self.assertEqual("subscribe", sent_messages[0]["type"])
+        self.assertEqual("/market/ticker:BTC-USDT", sent_messages[0]["topic"])
@@ -2,6 +2,7 @@ import unittest
 import asyncio
 import pandas as pd
 import time
+from unittest.mock import patch
 
 from hummingbot.core.clock import (
     Clock,
@@ -124,3 +125,33 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_run_til_instrumented(self):
+        self.assertIsNone(self.clock_realtime.metrics)
+
+        clock = Clock(ClockMode.REALTIME, self.tick_size, self.realtime_start_timestamp, self.realtime_end_timestamp,
+                      instrumented=True)
+        time_iterator: TimeIterator = TimeIterator()
+        clock.add_iterator(time_iterator)
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(self.realtime_end_timestamp))
+
+        metrics = clock.metrics
+        self.assertGreater(metrics.tick_histogram.total_count, 0)
+        self.assertEqual(metrics.tick_histogram.total_count, metrics.iterator_histograms["TimeIterator"].total_count)
+        self.assertEqual(0, metrics.iterator_errors("TimeIterator"))
+        self.assertGreaterEqual(metrics.max_loop_lag, 0)
+
+    def test_run_til_instrumented_metrics_errors_do_not_stop_the_clock(self):
+        clock = Clock(ClockMode.REALTIME, self.tick_size, self.realtime_start_timestamp, self.realtime_end_timestamp,
+                      instrumented=True)
+        time_iterator: TimeIterator = TimeIterator()
+        clock.add_iterator(time_iterator)
+        with patch.object(clock.metrics, "record_tick", side_effect=Exception("Test error")) as record_tick_mock:
+            with clock:
+                self.ev_loop.run_until_complete(clock.run_til(self.realtime_end_timestamp))
+
+        self.assertGreater(record_tick_mock.call_count, 0)
+        self.assertEqual(record_tick_mock.call_count,
+                         clock.metrics.iterator_histograms["TimeIterator"].total_count)
+        self.assertGreaterEqual(time.time(), self.realtime_end_timestamp)
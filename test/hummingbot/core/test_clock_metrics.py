@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.clock_metrics import (
+    ClockMetrics,
+    TickDurationHistogram,
+)
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class TickDurationHistogramTest(unittest.TestCase):
+
+    def test_add_and_quantiles(self):
+        histogram = TickDurationHistogram()
+        self.assertEqual(0, histogram.mean_duration)
+        self.assertEqual(0, histogram.quantile(0.99))
+
+        for _ in range(98):
+            histogram.add(0.0002)
+        histogram.add(0.02)
+        histogram.add(2.5)
+
+        self.assertEqual(100, histogram.total_count)
+        self.assertAlmostEqual((98 * 0.0002 + 0.02 + 2.5) / 100, histogram.mean_duration)
+        self.assertEqual(2.5, histogram.max_duration)
+        self.assertEqual(0.0005, histogram.quantile(0.5))
+        self.assertEqual(0.05, histogram.quantile(0.99))
+        # The last bucket is unbounded, the maximum is reported instead
+        self.assertEqual(2.5, histogram.quantile(1))
+        self.assertEqual(98, histogram.to_dict()["buckets"]["0.0005"])
+
+
+class ClockMetricsTest(unittest.TestCase):
+
+    def test_record_iterator_ticks(self):
+        metrics = ClockMetrics(tick_size=1.0)
+        iterator = TimeIterator()
+        metrics.record_iterator_tick(iterator, 0.001)
+        metrics.record_iterator_tick(iterator, 0.003, failed=True)
+
+        histogram = metrics.iterator_histograms["TimeIterator"]
+        self.assertEqual(2, histogram.total_count)
+        self.assertAlmostEqual(0.002, histogram.mean_duration)
+        self.assertEqual(1, metrics.iterator_errors("TimeIterator"))
+        self.assertEqual(0, metrics.iterator_errors("Unknown"))
+
+    def test_record_tick_counts_overruns_and_loop_lag(self):
+        metrics = ClockMetrics(tick_size=1.0)
+        metrics.record_tick(0.1, 0.05, now=0)
+        metrics.record_tick(0.9, 0.2, now=0)
+        metrics.record_tick(1.5, 0.01, now=0)
+
+        self.assertEqual(2, metrics.overrun_count)
+        self.assertEqual(3, metrics.tick_histogram.total_count)
+        self.assertEqual(0.01, metrics.last_loop_lag)
+        self.assertEqual(0.2, metrics.max_loop_lag)
+        self.assertAlmostEqual(0.26 / 3, metrics.mean_loop_lag)
+
+    def test_metrics_logged_every_log_interval(self):
+        with patch("hummingbot.core.clock_metrics.time.time", return_value=1000):
+            metrics = ClockMetrics(tick_size=1.0, log_interval=60)
+        metrics.record_iterator_tick(TimeIterator(), 0.001)
+
+        with patch.object(ClockMetrics, "log_metrics") as log_metrics_mock:
+            metrics.record_tick(0.001, 0.001, now=1059)
+            log_metrics_mock.assert_not_called()
+            metrics.record_tick(0.001, 0.001, now=1060)
+            log_metrics_mock.assert_called_once()
+            metrics.record_tick(0.001, 0.001, now=1061)
+            log_metrics_mock.assert_called_once()
+
+        logged = metrics.to_dict()
+        self.assertEqual(3, logged["ticks"]["count"])
+        self.assertEqual(1, logged["iterators"]["TimeIterator"]["count"])
+        self.assertEqual(0, logged["iterators"]["TimeIterator"]["errors"])
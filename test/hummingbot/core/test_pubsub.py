@@ -3,9 +3,12 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
 
 from test.mock.mock_events import MockEventType, MockEvent
+from test.mock.mock_paper_exchange import MockPaperExchange
 
 
 class PubSubTest(unittest.TestCase):
@@ -89,6 +92,85 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_removed_on_collection(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.assertEqual(None, listener_zero_weakref())
+        # The dead listener is dropped by its weak reference callback, get_listeners() doesn't need to sweep it
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_trigger_event_skips_lapsed_listener(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, len(self.listener_one.event_log))
+
+    def test_listeners_updated_after_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(2, len(self.listener_one.event_log))
+
+    def test_remove_listener_while_triggering_event(self):
+        pubsub = self.pubsub
+        event_tag = self.event_tag_zero
+        listener_one = self.listener_one
+
+        class RemovingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.event_log = []
+
+            def __call__(self, event_object):
+                self.event_log.append(event_object)
+                pubsub.remove_listener(event_tag, listener_one)
+
+        removing_listener = RemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        # The event being dispatched still reaches the listener removed meanwhile, the next ones don't
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(removing_listener.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual([removing_listener], self.pubsub.get_listeners(self.event_tag_zero))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, len(removing_listener.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_trigger_event_on_time_iterator_subclass(self):
+        # TimeIterator (and so the connectors) doesn't call PubSub.__init__()
+        connector = MockPaperExchange()
+        connector.add_listener(MarketEvent.BuyOrderCreated, self.listener_zero)
+        connector.add_listener(MarketEvent.SellOrderCreated, self.listener_one)
+        connector.trigger_event(MarketEvent.BuyOrderCreated, self.event)
+
+        self.assertEqual([self.event], self.listener_zero.event_log)
+        self.assertEqual(0, len(self.listener_one.event_log))
+        self.assertIn(self.listener_zero, connector.get_listeners(MarketEvent.BuyOrderCreated))
+
+        connector.remove_listener(MarketEvent.BuyOrderCreated, self.listener_zero)
+        self.assertNotIn(self.listener_zero, connector.get_listeners(MarketEvent.BuyOrderCreated))
+        connector.trigger_event(MarketEvent.BuyOrderCreated, self.event)
+        connector.trigger_event(MarketEvent.SellOrderCreated, self.event)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,3 +24,12 @@ class FixedRateSourceTests(TestCase):
 
     def test_string_representation(self):
         self.assertEqual(str(FixedRateSource()), "fixed rates")
+
+    def test_rate_updated_by_added_rates(self):
+        rate_source = FixedRateSource()
+        rate_source.add_rate("BTC-USDT", Decimal(40000))
+        self.assertIsNone(rate_source.rate("ETH-USDT"))
+        rate_source.add_rate("ETH-BTC", Decimal("0.05"))
+        self.assertEqual(rate_source.rate("ETH-USDT"), Decimal(2000))
+        rate_source.add_rate("BTC-USDT", Decimal(50000))
+        self.assertEqual(rate_source.rate("ETH-USDT"), Decimal(2500))
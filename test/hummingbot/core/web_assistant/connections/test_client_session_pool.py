@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.core.web_assistant.connections.client_session_pool import ClientSessionPool
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+
+
+class ClientSessionPoolTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = ClientSessionPool(limit=10, limit_per_host=2, ttl_dns_cache=60, keepalive_timeout=15)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.pool.close())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def start_server(self) -> TestServer:
+        async def ping(request):
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/ping", ping)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    def test_get_client_returns_shared_tuned_session(self):
+        client = self.async_run_with_timeout(self.pool.get_client())
+
+        self.assertIs(client, self.async_run_with_timeout(self.pool.get_client()))
+        self.assertEqual(10, client.connector.limit)
+        self.assertEqual(2, client.connector.limit_per_host)
+        self.assertTrue(client.connector.use_dns_cache)
+        self.assertEqual(60, client.connector._cached_hosts._ttl)
+        self.assertEqual(15, client.connector._keepalive_timeout)
+
+    def test_get_client_creates_new_session_when_closed(self):
+        client = self.async_run_with_timeout(self.pool.get_client())
+        self.async_run_with_timeout(client.close())
+
+        new_client = self.async_run_with_timeout(self.pool.get_client())
+
+        self.assertIsNot(client, new_client)
+        self.assertFalse(new_client.closed)
+
+    def test_get_client_closes_session_of_previous_event_loop(self):
+        client = self.async_run_with_timeout(self.pool.get_client())
+        self.pool._client_loop = None  # As if the session had been created on another event loop
+
+        new_client = self.async_run_with_timeout(self.pool.get_client())
+
+        self.assertIsNot(client, new_client)
+        self.assertTrue(client.closed)
+
+    @patch("hummingbot.client.config.global_config_map.global_config_map")
+    def test_limits_default_to_global_config(self, config_map_mock):
+        limits = {"http_connection_limit": 50, "http_connection_limit_per_host": 5}
+        config_map_mock.get.side_effect = lambda key: MagicMock(value=limits[key])
+
+        pool = ClientSessionPool()
+
+        self.assertEqual(50, pool.pool_metrics().limit)
+        self.assertEqual(5, pool.pool_metrics().limit_per_host)
+
+    def test_websockets_use_a_session_apart_from_rest_requests(self):
+        client = self.async_run_with_timeout(self.pool.get_client())
+        ws_client = self.async_run_with_timeout(self.pool.get_ws_client())
+
+        self.assertIsNot(client, ws_client)
+        self.assertIs(ws_client, self.async_run_with_timeout(self.pool.get_ws_client()))
+        self.assertEqual(0, ws_client.connector.limit)
+
+    def test_connections_factories_share_the_pool(self):
+        client = self.async_run_with_timeout(ConnectionsFactory()._get_shared_client())
+
+        self.assertIs(client, self.async_run_with_timeout(ConnectionsFactory()._get_shared_client()))
+        self.assertIs(client, self.async_run_with_timeout(ClientSessionPool.get_instance().get_client()))
+
+    def test_prewarm_opens_connection_reused_by_requests(self):
+        server = self.async_run_with_timeout(self.start_server())
+        url = str(server.make_url("/ping"))
+
+        self.async_run_with_timeout(self.pool.prewarm([url]))
+        metrics = self.pool.pool_metrics()
+        self.assertEqual(1, metrics.connections_created)
+        self.assertEqual(1, metrics.idle_connections)
+        self.assertEqual(0, metrics.acquired_connections)
+
+        async def get():
+            client = await self.pool.get_client()
+            async with client.get(url) as response:
+                await response.read()
+
+        self.async_run_with_timeout(get())
+        metrics = self.pool.pool_metrics()
+        self.assertEqual(1, metrics.connections_created)
+        self.assertEqual(1, metrics.connections_reused)
+        self.assertEqual(10, metrics.limit)
+        self.assertEqual(2, metrics.limit_per_host)
+
+        self.async_run_with_timeout(server.close())
+
+    def test_prewarm_failures_are_ignored(self):
+        self.async_run_with_timeout(self.pool.prewarm(["http://127.0.0.1:1/ping"]))
+
+        self.assertEqual(0, self.pool.pool_metrics().idle_connections)
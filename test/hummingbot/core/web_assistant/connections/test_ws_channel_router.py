@@ -0,0 +1,36 @@
+import asyncio
+import unittest
+
+from hummingbot.core.web_assistant.connections.ws_channel_router import WSChannelRouter
+
+
+class WSChannelRouterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.diffs_queue = asyncio.Queue()
+        self.trades_queue = asyncio.Queue()
+
+    def test_queue_for_matching_marker(self):
+        router = WSChannelRouter()
+        router.add_route('"e":"depthUpdate"', self.diffs_queue)
+        router.add_route('"e":"trade"', self.trades_queue)
+
+        self.assertIs(self.diffs_queue, router.queue_for('{"e":"depthUpdate","E":1,"s":"COINALPHAHBOT"}'))
+        self.assertIs(self.trades_queue, router.queue_for('{"e":"trade","E":1,"s":"COINALPHAHBOT"}'))
+
+    def test_queue_for_no_matching_marker(self):
+        router = WSChannelRouter()
+        router.add_route('"e":"trade"', self.trades_queue)
+
+        self.assertIsNone(router.queue_for('{"result":null,"id":1}'))
+
+    def test_queue_for_only_scans_the_start_of_the_message(self):
+        router = WSChannelRouter(scan_length=16)
+        router.add_route('"e":"trade"', self.trades_queue)
+
+        self.assertIsNone(router.queue_for('{"E":123456789,"e":"trade"}'))
+        self.assertIs(self.trades_queue, router.queue_for('{"e":"trade","E":123456789}'))
+
+    def test_pass_unmatched(self):
+        self.assertTrue(WSChannelRouter().pass_unmatched)
+        self.assertFalse(WSChannelRouter(pass_unmatched=False).pass_unmatched)
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.ws_channel_router import WSChannelRouter
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 from test.hummingbot.connector.network_mocking_assistant import (
@@ -250,3 +251,77 @@ class WSConnectionTest(unittest.TestCase):
         self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
 
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decodes_with_json_decoder(self, ws_connect_mock):
+        decoded_messages = []
+
+        def json_decoder(raw_message: str):
+            decoded_messages.append(raw_message)
+            return json.loads(raw_message)
+
+        ws_connection = WSConnection(self.client_session, json_decoder=json_decoder)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        data = {"one": 1}
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps(data)
+        )
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual(data, response.data)
+        self.assertEqual([json.dumps(data)], decoded_messages)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_routes_messages_to_channel_queues(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        diffs_queue = asyncio.Queue()
+        channel_router = WSChannelRouter()
+        channel_router.add_route('"channel":"diffs"', diffs_queue)
+        self.ws_connection.channel_router = channel_router
+        diff = {"channel": "diffs", "one": 1}
+        data = {"channel": "trades", "two": 2}
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps(diff, separators=(",", ":"))
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps(data, separators=(",", ":"))
+        )
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(data, response.data)
+        self.assertEqual(1, diffs_queue.qsize())
+        self.assertEqual(diff, diffs_queue.get_nowait())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_drops_unrouted_messages_without_decoding_them(self, ws_connect_mock):
+        decoded_messages = []
+
+        def json_decoder(raw_message: str):
+            decoded_messages.append(raw_message)
+            return json.loads(raw_message)
+
+        ws_connection = WSConnection(self.client_session, json_decoder=json_decoder)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        diffs_queue = asyncio.Queue()
+        channel_router = WSChannelRouter(pass_unmatched=False)
+        channel_router.add_route('"channel":"diffs"', diffs_queue)
+        ws_connection.channel_router = channel_router
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message='{"channel":"trades","two":2}'
+        )
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message='{"channel":"diffs","one":1}'
+        )
+        receive_task = self.ev_loop.create_task(ws_connection.receive())
+        self.async_tasks.append(receive_task)
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertFalse(receive_task.done())
+        self.assertEqual({"channel": "diffs", "one": 1}, diffs_queue.get_nowait())
+        self.assertEqual(['{"channel":"diffs","one":1}'], decoded_messages)
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import time
+import unittest
+from typing import Awaitable
+
+import aiohttp
+from aioresponses import aioresponses
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+ORDERS = "ORDERS"
+
+
+class RateLimitUsageRESTPostProcessorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.url = "https://www.test.com/url"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id=REQUEST_WEIGHT, limit=1200, time_interval=60),
+            RateLimit(limit_id=ORDERS, limit=100, time_interval=10),
+        ])
+        self.post_processor = RateLimitUsageRESTPostProcessor(
+            throttler=self.throttler,
+            usage_headers={"X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT, "X-MBX-ORDER-COUNT-10S": ORDERS})
+        self.connection = RESTConnection(aiohttp.ClientSession())
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def used_capacity(self, limit_id: str) -> int:
+        return self.throttler._task_logs.used_capacity(limit_id, time.time())
+
+    def get_response(self, mocked_api, status: int = 200, headers=None) -> RESTResponse:
+        mocked_api.get(self.url, body=json.dumps({}).encode(), status=status, headers=headers)
+        request = RESTRequest(method=RESTMethod.GET, url=self.url)
+        return self.async_run_with_timeout(self.connection.call(request))
+
+    @aioresponses()
+    def test_used_weight_headers_are_fed_to_throttler(self, mocked_api):
+        response = self.get_response(mocked_api, headers={"x-mbx-used-weight-1m": "700", "X-MBX-ORDER-COUNT-10S": "7"})
+
+        processed_response = self.async_run_with_timeout(self.post_processor.post_process(response))
+
+        self.assertEqual(response, processed_response)
+        self.assertEqual(700, self.used_capacity(REQUEST_WEIGHT))
+        self.assertEqual(7, self.used_capacity(ORDERS))
+
+    @aioresponses()
+    def test_missing_or_invalid_headers_are_ignored(self, mocked_api):
+        response = self.get_response(mocked_api, headers={"X-MBX-USED-WEIGHT-1M": "invalid"})
+
+        self.async_run_with_timeout(self.post_processor.post_process(response))
+
+        self.assertEqual(0, self.used_capacity(REQUEST_WEIGHT))
+        self.assertEqual(0, self.used_capacity(ORDERS))
+
+    @aioresponses()
+    def test_rate_limit_exceeded_response_blocks_limits(self, mocked_api):
+        response = self.get_response(mocked_api, status=429, headers={"Retry-After": "120"})
+
+        self.async_run_with_timeout(self.post_processor.post_process(response))
+
+        self.assertEqual(0, self.used_capacity(REQUEST_WEIGHT))
+        self.assertEqual(0, self.used_capacity(ORDERS))
+        now = time.time()
+        self.assertAlmostEqual(120, self.throttler._task_logs.time_until_unblocked(REQUEST_WEIGHT, now), delta=0.1)
+        self.assertAlmostEqual(120, self.throttler._task_logs.time_until_unblocked(ORDERS, now), delta=0.1)
+        context = self.throttler.execute_task(REQUEST_WEIGHT)
+        self.assertAlmostEqual(120, context.time_until_capacity(), delta=0.1)
@@ -1,7 +1,10 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import ConvertPriceAndAmountColumnsToBigint
+from hummingbot.model.db_migration.transformations import (
+    AddConfigMarketTimestampIndexToOrders,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -33,3 +36,28 @@ class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
         self.assertIn("CAST(price * 1000000 AS INTEGER", executed_queries[9])
         self.assertEquals('drop table TradeFill;', executed_queries[10])
         self.assertEquals('alter table TradeFill_dg_tmp rename to TradeFill;', executed_queries[11])
+
+
+class AddConfigMarketTimestampIndexToOrdersTests(TestCase):
+
+    def test_name(self):
+        self.assertEqual("AddConfigMarketTimestampIndexToOrders", AddConfigMarketTimestampIndexToOrders(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20220301, AddConfigMarketTimestampIndexToOrders(self).to_version)
+
+    def test_apply_creates_indexes(self):
+        executed_queries = []
+        mock = MagicMock()
+        mock.engine.execute.side_effect = lambda query: executed_queries.append(query)
+
+        AddConfigMarketTimestampIndexToOrders(migrator=self).apply(mock)
+
+        self.assertEqual(
+            'create index if not exists o_config_market_timestamp_index on "Order" '
+            '(config_file_path, market, creation_timestamp);',
+            executed_queries[0])
+        self.assertEqual(
+            'create index if not exists tf_config_timestamp_index on TradeFill (config_file_path, timestamp);',
+            executed_queries[1])
+        self.assertEqual("analyze;", executed_queries[2])
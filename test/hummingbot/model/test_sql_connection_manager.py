@@ -0,0 +1,61 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sqlalchemy import inspect
+from sqlalchemy.pool import QueuePool
+
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.db_dir.name, "test_trades.sqlite")
+
+    def tearDown(self) -> None:
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    def test_sqlite_engine_applies_performance_profile(self):
+        manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        self.assertIsInstance(manager.engine.pool, QueuePool)
+        with manager.engine.connect() as conn:
+            self.assertEqual("wal", conn.execute("PRAGMA journal_mode").scalar())
+            # NORMAL
+            self.assertEqual(1, conn.execute("PRAGMA synchronous").scalar())
+            self.assertEqual(SQLConnectionManager.SQLITE_PRAGMAS["cache_size"],
+                             conn.execute("PRAGMA cache_size").scalar())
+            self.assertEqual(SQLConnectionManager.SQLITE_PRAGMAS["busy_timeout"],
+                             conn.execute("PRAGMA busy_timeout").scalar())
+        manager.engine.dispose()
+
+    def test_new_database_has_config_market_timestamp_index(self):
+        manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        order_indexes = {index["name"]: index["column_names"] for index in inspect(manager.engine).get_indexes("Order")}
+        self.assertEqual(["config_file_path", "market", "creation_timestamp"],
+                         order_indexes["o_config_market_timestamp_index"])
+        manager.engine.dispose()
+
+    def test_existing_database_is_migrated_to_add_index(self):
+        manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        with manager.engine.begin() as conn:
+            conn.execute("drop index o_config_market_timestamp_index")
+        with manager.get_new_session() as session:
+            with session.begin():
+                manager.get_local_db_version(session).value = "20220130"
+        manager.engine.dispose()
+
+        manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        order_indexes = [index["name"] for index in inspect(manager.engine).get_indexes("Order")]
+        self.assertIn("o_config_market_timestamp_index", order_indexes)
+        with manager.get_new_session() as session:
+            version: Metadata = manager.get_local_db_version(session)
+            self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, version.value)
+        manager.engine.dispose()
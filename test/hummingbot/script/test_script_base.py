@@ -4,6 +4,7 @@ import unittest
 from decimal import Decimal
 from statistics import mean
 from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_interface import OnTick
 
 
 class ScriptIteratorUnitTest(unittest.TestCase):
@@ -71,3 +72,23 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("0.01")))
         self.assertEqual(Decimal("1"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("1")))
         self.assertEqual(Decimal("-1.75"), ScriptBase.round_by_step(Decimal("-1.8"), Decimal("0.25")))
+
+    def test_on_tick_applies_parameter_and_balance_updates(self):
+        script_base = ScriptBase()
+        balances = {"binance": {"BTC": Decimal("1")}}
+        script_base.process_parent_item(OnTick(Decimal("100"), {"bid_spread": Decimal("0.01"), "buy_levels": 1},
+                                               balances, balances))
+
+        self.assertEqual([Decimal("100")], script_base.mid_prices)
+        self.assertEqual(Decimal("0.01"), script_base.pmm_parameters.bid_spread)
+        self.assertEqual(1, script_base.pmm_parameters.buy_levels)
+        self.assertEqual(balances, script_base.all_total_balances)
+
+        # Unchanged parameters and balances aren't sent again
+        script_base.process_parent_item(OnTick(Decimal("101"), {"buy_levels": 2}, None, None))
+
+        self.assertEqual([Decimal("100"), Decimal("101")], script_base.mid_prices)
+        self.assertEqual(Decimal("0.01"), script_base.pmm_parameters.bid_spread)
+        self.assertEqual(2, script_base.pmm_parameters.buy_levels)
+        self.assertEqual(balances, script_base.all_total_balances)
+        self.assertEqual(balances, script_base.all_available_balances)
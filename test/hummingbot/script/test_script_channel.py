@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.script.script_channel import ScriptChannel
+
+
+class ScriptChannelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.channel = ScriptChannel()
+        self.received_items = []
+        self.received_event = asyncio.Event()
+
+    def tearDown(self) -> None:
+        self.channel.stop_listening()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _receive(self, item):
+        self.received_items.append(item)
+        self.received_event.set()
+
+    def test_put_outside_event_loop_sends_right_away(self):
+        self.channel.put("one")
+
+        self.assertTrue(self.channel._reader.poll())
+        self.assertEqual(["one"], self.channel._reader.recv())
+
+    def test_items_put_in_same_iteration_are_sent_as_one_batch(self):
+        async def put_items():
+            self.channel.put("one")
+            self.channel.put("two")
+            self.assertFalse(self.channel._reader.poll())
+            await asyncio.sleep(0)
+
+        self.async_run_with_timeout(put_items())
+
+        self.assertEqual(["one", "two"], self.channel._reader.recv())
+        self.assertFalse(self.channel._reader.poll())
+
+    def test_listener_called_back_with_each_item(self):
+        self.channel.start_listening(self._receive)
+
+        async def put_items():
+            self.channel.put("one")
+            self.channel.put({"two": 2})
+            await self.received_event.wait()
+
+        self.async_run_with_timeout(put_items())
+
+        self.assertEqual(["one", {"two": 2}], self.received_items)
+
+    def test_flush_sends_pending_items(self):
+        async def put_and_flush():
+            self.channel.put("one")
+            self.channel.flush()
+            self.assertTrue(self.channel._reader.poll())
+            self.assertEqual(["one"], self.channel._reader.recv())
+            await asyncio.sleep(0)
+            # The scheduled flush was cancelled, nothing else is sent
+            self.assertFalse(self.channel._reader.poll())
+
+        self.async_run_with_timeout(put_and_flush())
+
+    def test_items_put_in_event_loop_are_sent_from_sender_thread(self):
+        writer = self.channel._writer
+        send_threads = []
+
+        def send(items):
+            send_threads.append(threading.current_thread())
+            writer.send(items)
+
+        self.channel._writer = MagicMock()
+        self.channel._writer.send.side_effect = send
+
+        async def put_items():
+            self.channel.put("one")
+            await asyncio.sleep(0)
+            self.channel.put("two")
+            self.channel.flush()
+
+        self.async_run_with_timeout(put_items())
+
+        self.assertEqual(["one"], self.channel._reader.recv())
+        self.assertEqual(["two"], self.channel._reader.recv())
+        self.assertNotEqual(threading.current_thread(), send_threads[0])
+        self.assertEqual(threading.current_thread(), send_threads[1])
+
+    def test_listener_called_back_from_reader_thread_without_add_reader_support(self):
+        with patch.object(self.ev_loop, "add_reader", side_effect=NotImplementedError):
+            self.channel.start_listening(self._receive)
+
+        async def put_items():
+            self.channel.put("one")
+            self.channel.put({"two": 2})
+            await self.received_event.wait()
+
+        self.async_run_with_timeout(put_items())
+
+        self.assertEqual(["one", {"two": 2}], self.received_items)
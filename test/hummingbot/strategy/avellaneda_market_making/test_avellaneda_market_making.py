@@ -115,7 +115,9 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
         self.avg_vol_indicator: InstantVolatilityIndicator = InstantVolatilityIndicator(sampling_length=100,
                                                                                         processing_length=1)
 
-        self.trading_intensity_indicator: TradingIntensityIndicator = TradingIntensityIndicator(sampling_length=200)
+        # The expected liquidity parameters were estimated with the nonlinear fit
+        self.trading_intensity_indicator: TradingIntensityIndicator = TradingIntensityIndicator(sampling_length=200,
+                                                                                                nonlinear_fit=True)
 
         self.strategy.avg_vol = self.avg_vol_indicator
         self.strategy.trading_intensity = self.trading_intensity_indicator
@@ -95,3 +95,79 @@ class RingBufferTest(unittest.TestCase):
         value = Decimal(3.141592653)
         self.buffer.add_value(value)
         self.assertAlmostEqual(float(value), self.buffer.get_last_value(), 6)
+
+    def test_running_statistics_match_numpy(self):
+        np.random.seed(123456789)
+        for value in np.random.normal(100, 0.01, self.BUFFER_LENGTH * 5 + 7):
+            self.buffer.add_value(value)
+            if self.buffer.is_full:
+                samples = self.buffer.get_as_numpy_array()
+                self.assertAlmostEqual(np.mean(samples), self.buffer.mean_value, 10)
+                self.assertAlmostEqual(np.var(samples), self.buffer.variance, 10)
+                self.assertAlmostEqual(np.sum(samples), self.buffer.sum_value, 8)
+
+    def test_sum_value_and_size(self):
+        self.assertEqual(0, self.buffer.size)
+        self.assertEqual(0, self.buffer.sum_value)
+        for i in range(self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+        self.assertEqual(self.BUFFER_LENGTH, self.buffer.size)
+        self.assertEqual(sum(range(5, self.BUFFER_LENGTH + 5)), self.buffer.sum_value)
+
+    def test_nan_samples_are_dropped_from_statistics_once_overwritten(self):
+        self.buffer.add_value(np.nan)
+        self.fill_buffer_with_zeros()
+        self.assertEqual(0, self.buffer.mean_value)
+        self.buffer = RingBuffer(self.BUFFER_LENGTH)
+        self.fill_buffer_with_zeros()
+        self.buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+        self.assertTrue(np.isnan(self.buffer.sum_value))
+        for i in range(self.BUFFER_LENGTH - 1):
+            self.buffer.add_value(1)
+        self.assertTrue(np.isnan(self.buffer.variance))
+        self.buffer.add_value(1)
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+
+    def test_min_and_max_values(self):
+        tracking_buffer = RingBuffer(self.BUFFER_LENGTH, track_extremes=True)
+        self.assertTrue(np.isnan(tracking_buffer.min_value))
+        self.assertTrue(np.isnan(self.buffer.max_value))
+        np.random.seed(123456789)
+        for value in np.random.uniform(-10, 10, self.BUFFER_LENGTH * 3):
+            tracking_buffer.add_value(value)
+            self.buffer.add_value(value)
+            samples = self.buffer.get_as_numpy_array()
+            self.assertEqual(np.min(samples), tracking_buffer.min_value)
+            self.assertEqual(np.max(samples), tracking_buffer.max_value)
+            self.assertEqual(np.min(samples), self.buffer.min_value)
+            self.assertEqual(np.max(samples), self.buffer.max_value)
+
+    def test_get_segments(self):
+        self.buffer.add_value(1)
+        self.buffer.add_value(2)
+        older, newer = self.buffer.get_segments()
+        self.assertEqual([1, 2], older.tolist())
+        self.assertEqual([], newer.tolist())
+        for i in range(3, self.BUFFER_LENGTH + 3):
+            self.buffer.add_value(i)
+        older, newer = self.buffer.get_segments()
+        self.assertEqual(list(range(3, self.BUFFER_LENGTH + 1)), older.tolist())
+        self.assertEqual([self.BUFFER_LENGTH + 1, self.BUFFER_LENGTH + 2], newer.tolist())
+        # Segments are read-only views of the buffer, not copies
+        self.buffer.add_value(0)
+        self.assertEqual(0, older[0])
+        with self.assertRaises(ValueError):
+            older[0] = 0
+
+    def test_long_buffer_wraps_around(self):
+        length = 40000
+        self.buffer = RingBuffer(length)
+        for i in range(length + 10):
+            self.buffer.add_value(i)
+        samples = self.buffer.get_as_numpy_array()
+        self.assertEqual(length, samples.size)
+        self.assertEqual(10, samples[0])
+        self.assertEqual(length + 9, samples[-1])
+        self.assertAlmostEqual(np.mean(samples), self.buffer.mean_value, 6)
@@ -64,7 +64,7 @@ class TradingIntensityTest(unittest.TestCase):
     def test_calculate_trading_intensity(self):
         N_SAMPLES = 1000
 
-        self.indicator = TradingIntensityIndicator(self.BUFFER_LENGTH)
+        self.indicator = TradingIntensityIndicator(self.BUFFER_LENGTH, nonlinear_fit=True)
 
         original_price_mid = 100
         original_spread = Decimal("10")
@@ -83,3 +83,59 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(self.indicator.current_value[0], 1.0006118838992204, 4)
         self.assertAlmostEqual(self.indicator.current_value[1], 0.00016076949224819458, 4)
+
+    @staticmethod
+    def make_depth_arrays():
+        # Consecutive books, as [price, amount, update_id] rows, and the market orders explaining their changes
+        books = [
+            ([[100, 1], [99, 2], [98, 3]], [[101, 1], [102, 2], [103, 3]]),
+            ([[98, 2.9], [97, 1]], [[101, 0.5], [102, 2], [103, 3]]),
+            ([[98.5, 1], [98, 2.9], [97, 1]], [[101.5, 1], [102, 2], [103, 3]]),
+            ([[98.5, 0.4], [98, 2.9]], [[102, 1.5], [103, 3]]),
+        ]
+        return [tuple(np.column_stack([np.array(side, dtype=np.float64), np.ones(len(side))]) for side in book)
+                for book in books]
+
+    def test_estimate_trading_intensity_with_log_linear_fit(self):
+        self.indicator = TradingIntensityIndicator(2)
+        books = self.make_depth_arrays()
+
+        self.indicator.add_sample(books[0])
+        self.indicator.add_sample(books[1])
+        self.assertFalse(self.indicator.is_sampling_buffer_full)
+        self.assertEqual((0, 0), self.indicator.current_value)
+
+        self.indicator.add_sample(books[2])
+        self.assertTrue(self.indicator.is_sampling_buffer_full)
+        # Volumes executed per price level (distance to the previous mid price) over the last 2 samples
+        slope, intercept = np.polyfit([0.5, 1.5, 2.5], np.log([1 + 0.5, 2 + 0.5, 3 - 2.9]), 1)
+        alpha, kappa = self.indicator.current_value
+        self.assertAlmostEqual(-slope, kappa, 10)
+        self.assertAlmostEqual(np.exp(intercept), alpha, 10)
+
+        # The market orders of the second sample are dropped
+        self.indicator.add_sample(books[3])
+        slope, intercept = np.polyfit([1.5, 2], np.log([0.5 + (1 - 0.4) + 1, 2 - 1.5]), 1)
+        alpha, kappa = self.indicator.current_value
+        self.assertAlmostEqual(-slope, kappa, 10)
+        self.assertAlmostEqual(np.exp(intercept), alpha, 10)
+
+    def test_snapshot_data_frames_and_depth_arrays_give_same_estimate(self):
+        array_indicator = TradingIntensityIndicator(2)
+        data_frame_indicator = TradingIntensityIndicator(2)
+
+        for bids, asks in self.make_depth_arrays():
+            array_indicator.add_sample((bids, asks))
+            data_frame_indicator.add_sample((pd.DataFrame(bids[:, :2], columns=["price", "amount"]),
+                                             pd.DataFrame(asks[:, :2], columns=["price", "amount"])))
+
+        self.assertNotEqual((0, 0), array_indicator.current_value)
+        self.assertEqual(array_indicator.current_value, data_frame_indicator.current_value)
+
+    def test_unchanged_book_side_is_skipped(self):
+        self.indicator = TradingIntensityIndicator(1)
+        bids, asks = self.make_depth_arrays()[0]
+        self.indicator.add_sample((bids, asks))
+        self.indicator.add_sample((bids[1:], asks))
+        self.assertFalse(self.indicator.is_sampling_buffer_changed)
+        self.assertFalse(self.indicator.is_sampling_buffer_full)